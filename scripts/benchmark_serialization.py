@@ -0,0 +1,57 @@
+"""
+Compares the per-item cost of the validated and trusted article serialization paths
+
+    PYTHONPATH=src python scripts/benchmark_serialization.py [--items 100] [--rounds 200]
+"""
+
+# Standard Library Imports
+import argparse
+import timeit
+from typing import Any, Dict, List
+
+# 3rd-Party Imports
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+# Application-Local Imports
+from ninety_seven_things.lib.serialization import dump_records
+from ninety_seven_things.modules.article.schemas import FullArticleRecord, FullArticleView
+
+
+def make_documents(count: int) -> List[Dict[str, Any]]:
+    contents = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 60
+
+    return [
+        {"_id": ObjectId(), "title": f"Thing {i}", "index": i % 98, "contents": contents, "language": "en"}
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    documents = make_documents(args.items)
+    response_adapter = TypeAdapter(List[FullArticleView])
+
+    def validated() -> bytes:
+        # document -> model -> dict -> view model -> response_model validation -> JSON. The Beanie document step is
+        # stood in for by a second view model so that the benchmark runs without a database.
+        models = [FullArticleView.model_validate({**document, "id": document["_id"]}) for document in documents]
+        views = [FullArticleView(**model.model_dump()) for model in models]
+        return response_adapter.dump_json(response_adapter.validate_python(views))
+
+    def trusted() -> bytes:
+        return dump_records(FullArticleRecord, documents)
+
+    assert len(validated()) == len(trusted())
+
+    for name, path in (("validated", validated), ("trusted", trusted)):
+        seconds = min(timeit.repeat(path, number=args.rounds, repeat=3)) / args.rounds
+        print(f"{name:>10}: {seconds * 1e6 / args.items:8.2f} µs/item ({seconds * 1e3:.3f} ms per {args.items} items)")
+
+
+if __name__ == "__main__":
+    main()
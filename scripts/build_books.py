@@ -0,0 +1,36 @@
+"""
+Builds the book for every language ahead of time, so that no download has to wait for one
+
+    PYTHONPATH=src python scripts/build_books.py
+
+Languages whose articles are unchanged since their book was last built are skipped.
+"""
+
+# Standard Library Imports
+import asyncio
+import sys
+from collections import defaultdict
+
+# Application-Local Imports
+from ninety_seven_things.lib import preload
+from ninety_seven_things.modules.book.service import BOOKS_DIR, ensure_books
+
+
+async def main() -> int:
+    by_language = defaultdict(list)
+
+    for document in preload.read_article_documents():
+        by_language[document["language"]].append(document)
+
+    for language, documents in sorted(by_language.items()):
+        documents.sort(key=lambda document: document["index"])
+        digest = await ensure_books(language, documents)
+        print(f"{language}: {len(documents)} articles, book {digest}")
+
+    print(f"Books are in {BOOKS_DIR}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,44 @@
+"""
+Builds the reader snapshot that READER_SNAPSHOT_PATH points the reader at
+
+    PYTHONPATH=src python scripts/build_snapshot.py --source mongo
+    PYTHONPATH=src python scripts/build_snapshot.py --source git --checkout data/checkout/2024-01-01T00:00:00
+
+The snapshot replaces any existing file atomically; running workers keep serving the one they have mapped until they
+are restarted. Rebuild it after editing articles, as the reader does not see changes made in Mongo while it is in use.
+"""
+
+# Standard Library Imports
+import argparse
+import pathlib
+import sys
+import time
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.snapshot import write_snapshot
+from ninety_seven_things.ui.reader.corpus import load_articles, render_pages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=["mongo", "git"], default="mongo")
+    parser.add_argument("--checkout", type=pathlib.Path, help="an existing checkout to read instead of cloning one")
+    parser.add_argument("--output", type=pathlib.Path, default=settings.READER_SNAPSHOT_PATH or None)
+    args = parser.parse_args()
+
+    if args.output is None:
+        parser.error("--output is required when READER_SNAPSHOT_PATH is not set")
+
+    start = time.perf_counter()
+    count = write_snapshot(render_pages(load_articles(args.source, args.checkout)), args.output)
+
+    print(
+        f"Wrote {count} pages ({args.output.stat().st_size} bytes) to {args.output} in {time.perf_counter() - start:.2f}s"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
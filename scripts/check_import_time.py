@@ -0,0 +1,103 @@
+"""
+Fails if importing the application takes longer than a budget, or pulls in a subsystem that should load lazily
+
+    PYTHONPATH=src python scripts/check_import_time.py --budget-ms 1500
+
+Each run imports the module in a fresh interpreter under `python -X importtime`; the fastest of --runs is compared with
+the budget, as the slower runs mostly measure a busy machine. Needs the same environment (.env) as the app itself.
+tests/test_import_time.py runs the same check as part of the test suite.
+"""
+
+# Standard Library Imports
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULE = "ninety_seven_things.main"
+DEFAULT_BUDGET_MS = 1500.0
+DEFAULT_RUNS = 3
+
+# Loaded on first use by the subsystems that need them, never by the app import itself
+DEFAULT_FORBIDDEN = ["git", "sendgrid", "jinja2", "markdown", "icecream", "ninety_seven_things.ui.admin.app"]
+
+
+def measure_import(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Imports module in a fresh interpreter and returns (module, self µs, cumulative µs) for everything it imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{result.stderr}")
+
+    timings = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    return timings
+
+
+def heaviest_packages(timings: List[Tuple[str, int, int]], count: int) -> List[Tuple[str, int]]:
+    totals: Dict[str, int] = defaultdict(int)
+
+    for name, self_us, _ in timings:
+        totals[name.partition(".")[0]] += self_us
+
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def check(
+    module: str = DEFAULT_MODULE, runs: int = DEFAULT_RUNS, forbid: List[str] = DEFAULT_FORBIDDEN
+) -> Tuple[float, List[str], List[Tuple[str, int, int]]]:
+    """
+    The fastest of runs cold imports of module: its time in ms, the forbidden modules it loaded, and its timings
+    """
+    fastest = min((measure_import(module) for _ in range(runs)), key=lambda timings: timings[-1][2])
+    imported = {name for name, _, _ in fastest}
+
+    return fastest[-1][2] / 1000, [name for name in forbid if name in imported], fastest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--top", type=int, default=15, help="how many of the slowest packages to list")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN, help="modules the import must not load")
+    args = parser.parse_args()
+
+    total_ms, loaded, fastest = check(args.module, args.runs, args.forbid)
+
+    print(f"{args.module} imported in {total_ms:.0f}ms (fastest of {args.runs}, budget {args.budget_ms:.0f}ms)")
+
+    for package, self_us in heaviest_packages(fastest, args.top):
+        print(f"{self_us / 1000:>10.1f}ms  {package}")
+
+    failed = False
+
+    if loaded:
+        print(f"Imported eagerly but should load on first use: {', '.join(loaded)}")
+        failed = True
+
+    if total_ms > args.budget_ms:
+        print(f"Over budget by {total_ms - args.budget_ms:.0f}ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
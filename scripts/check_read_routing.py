@@ -0,0 +1,66 @@
+"""
+Shows which replica set member serves an article read under each read preference
+
+    PYTHONPATH=src python scripts/check_read_routing.py
+
+Run against the local replica set from docker-compose.replica-set.yaml; against a standalone server every read is
+served by that server.
+"""
+
+# Standard Library Imports
+import asyncio
+from typing import Optional, Tuple
+
+# 3rd-Party Imports
+from beanie import init_beanie
+from pymongo import monitoring
+from pymongo.read_preferences import Primary
+
+# Application-Local Imports
+from ninety_seven_things.core import db
+from ninety_seven_things.lib.read_routing import reading_from, route_read_preference, secondary_preferred
+from ninety_seven_things.modules.article.models import Article
+
+
+class ServerRecorder(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.last_server: Optional[Tuple[str, int]] = None
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name == "find":
+            self.last_server = event.connection_id
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+async def main() -> None:
+    recorder = ServerRecorder()
+    monitoring.register(recorder)
+
+    client = db.get_client()
+    await init_beanie(database=db.get_database(), document_models=[Article])
+    await client.admin.command("ping")
+
+    print(f"primary: {client.primary}, secondaries: {sorted(client.secondaries)}")
+
+    for label, read_preference in (
+        ("primary", Primary()),
+        ("secondary preferred", secondary_preferred()),
+        ("GET /ui/reader/en/index", route_read_preference("GET", "/ui/reader/en/index")),
+        ("GET /ui/admin/article", route_read_preference("GET", "/ui/admin/article")),
+    ):
+        with reading_from(read_preference):
+            await Article.find_one()
+
+        where = "primary" if recorder.last_server == client.primary else "secondary"
+        print(f"{label:>25}: served by {recorder.last_server} ({where})")
+
+    db.close_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+"""
+Exports the reader as a static site, for nginx or a CDN to serve in front of the app
+
+    PYTHONPATH=src python scripts/export_reader.py --source mongo --output data/reader-site
+
+Re-running only rewrites the pages whose content changed. The files have no extension, so serve them with, e.g.:
+
+    location /ui/reader/ { root /srv/reader-site; default_type application/json; gzip_static on; }
+    location /reader/ { root /srv/reader-site; gzip_static on; try_files $uri /reader/index.html; }
+
+/ui/reader/{language}/article/random is not a fixed page, so proxy it (and the admin UI and API) to the app. So too
+/ui/reader/{language}/index for the "Most read this week" list, which the exported index pages leave out:
+
+    location ~ ^/ui/reader/[^/]+/index$ { proxy_pass http://app; }
+"""
+
+# Standard Library Imports
+import argparse
+import pathlib
+import sys
+import time
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.ui.reader.corpus import load_articles
+from ninety_seven_things.ui.reader.export import export_site
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=["mongo", "git"], default="mongo")
+    parser.add_argument("--checkout", type=pathlib.Path, help="an existing checkout to read instead of cloning one")
+    parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path(settings.DATA_DIR) / "reader-site")
+    parser.add_argument("--workers", type=int, help="worker processes; defaults to one per CPU")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = export_site(load_articles(args.source, args.checkout), args.output, workers=args.workers)
+
+    print(
+        f"Exported to {args.output} in {time.perf_counter() - start:.2f}s: {len(report.written)} written, "
+        f"{report.unchanged} unchanged, {len(report.removed)} removed"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
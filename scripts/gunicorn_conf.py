@@ -0,0 +1,56 @@
+"""
+Gunicorn configuration for scripts/start-prod.sh
+
+With PRELOAD_APP set (the default) the master imports the app, preloads the article corpus and freezes the heap
+before forking, so the workers share that memory copy-on-write. Workers open their own Mongo / Redis connections
+from the app lifespan, after the fork.
+"""
+
+# Standard Library Imports
+import logging
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('API_PORT', '5555')}")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = os.environ.get("WORKER_CLASS", "uvicorn.workers.UvicornWorker")
+preload_app = os.environ.get("PRELOAD_APP", "true").lower() in ("1", "true", "yes")
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("KEEP_ALIVE", "5"))
+
+
+def when_ready(server):  # type: ignore
+    """
+    Runs in the master once the app is loaded and before any worker is forked
+    """
+    if not preload_app:
+        return
+
+    # Application-Local Imports
+    from ninety_seven_things.core.config import settings
+    from ninety_seven_things.lib import health, metrics, preload, snapshot
+
+    logger = logging.getLogger(settings.LOG_NAME)
+
+    try:
+        preload.preload_corpus()
+    except health.WARM_UP_ERRORS as exc:
+        logger.warning(f"Unable to preload the article corpus, workers will load their own: {exc}")
+
+    # Mapped once here and inherited, rather than opened by each worker on its first reader request
+    snapshot.get_reader_snapshot()
+
+    preload.freeze()
+
+    rss = metrics.read_memory().get("rss")
+
+    if rss is not None:
+        logger.info(f"Master RSS after preloading is {rss / 2**20:.1f}MiB")
+
+
+def child_exit(server, worker):  # type: ignore
+    # 3rd-Party Imports
+    from prometheus_client import multiprocess
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(worker.pid)
@@ -2,13 +2,13 @@
 
 set -e
 
-DEFAULT_MODULE_NAME=src.main
+DEFAULT_MODULE_NAME=ninety_seven_things.main
 
 MODULE_NAME=${MODULE_NAME:-$DEFAULT_MODULE_NAME}
 VARIABLE_NAME=${VARIABLE_NAME:-app}
 export APP_MODULE=${APP_MODULE:-"$MODULE_NAME:$VARIABLE_NAME"}
 
-DEFAULT_GUNICORN_CONF=/src/gunicorn/gunicorn_conf.py
+DEFAULT_GUNICORN_CONF="$(dirname "$0")/gunicorn_conf.py"
 export GUNICORN_CONF=${GUNICORN_CONF:-$DEFAULT_GUNICORN_CONF}
 export WORKER_CLASS=${WORKER_CLASS:-"uvicorn.workers.UvicornWorker"}
 
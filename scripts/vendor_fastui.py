@@ -0,0 +1,61 @@
+"""
+Vendors the prebuilt FastUI frontend that the installed fastui expects, so the app serves it itself
+
+    PYTHONPATH=src python scripts/vendor_fastui.py
+    PYTHONPATH=src python scripts/vendor_fastui.py --tarball fastui-prebuilt-0.0.26.tgz
+
+By default the package tarball is downloaded from the npm registry. For air-gapped builds fetch it once elsewhere
+(`npm pack @pydantic/fastui-prebuilt@<version>`) and pass it with --tarball. Re-run after upgrading fastui.
+"""
+
+# Standard Library Imports
+import argparse
+import io
+import sys
+import tarfile
+import urllib.request
+
+# 3rd-Party Imports
+import fastui
+
+# Application-Local Imports
+from ninety_seven_things.lib.frontend import ASSETS_DIR, vendor_assets
+
+REGISTRY_URL = "https://registry.npmjs.org/@pydantic/fastui-prebuilt/-/fastui-prebuilt-{version}.tgz"
+ASSETS_PREFIX = "package/dist/assets/"
+
+
+def read_tarball(source: str) -> bytes:
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=30) as response:
+            return response.read()
+
+    with open(source, "rb") as f:
+        return f.read()
+
+
+def main() -> int:
+    version = fastui._PREBUILT_VERSION
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tarball", default=REGISTRY_URL.format(version=version), help="path or URL")
+    args = parser.parse_args()
+
+    files = {}
+
+    with tarfile.open(fileobj=io.BytesIO(read_tarball(args.tarball)), mode="r:gz") as tarball:
+        for member in tarball.getmembers():
+            if member.isfile() and member.name.startswith(ASSETS_PREFIX):
+                files[member.name.removeprefix(ASSETS_PREFIX)] = tarball.extractfile(member).read()
+
+    if "index.js" not in files or "index.css" not in files:
+        sys.exit(f"{args.tarball} does not contain the prebuilt FastUI frontend")
+
+    fingerprint = vendor_assets(files, version=version)
+    print(f"Vendored FastUI frontend {version} ({len(files)} files) to {ASSETS_DIR / fingerprint}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
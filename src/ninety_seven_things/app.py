@@ -1,23 +1,29 @@
 # Standard Library Imports
+import asyncio
+import contextlib
 import logging
+import os
 import pathlib
 import sys
 from contextlib import asynccontextmanager
 
 # 3rd-Party Imports
 from beanie import init_beanie
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import FileResponse, JSONResponse, Response
 from starlette.middleware.cors import CORSMiddleware
 
 # Application-Local Imports
 from ninety_seven_things import __version__
-from ninety_seven_things.core import config
+from ninety_seven_things.core import config, db
 from ninety_seven_things.core import logging as wj_logging
-from ninety_seven_things.lib import constants, exceptions, helpers
+from ninety_seven_things.core.redis import redis
+from ninety_seven_things.lib import cache, constants, exceptions, health, helpers, metrics, query_log, read_routing
+from ninety_seven_things.modules.article import availability as article_availability
 from ninety_seven_things.modules.article import models as article_models
+from ninety_seven_things.modules.article import popularity as article_popularity
 from ninety_seven_things.modules.author import models as author_models
+from ninety_seven_things.modules.progress import models as progress_models
 from ninety_seven_things.modules.user import models as user_models
 
 try:
@@ -32,22 +38,57 @@ logger.info(f"Welcome to the {config.settings.PROJECT_NAME}")
 @asynccontextmanager
 async def lifespan(application: FastAPI):  # type: ignore
     """Initialize application services."""
-    logger.info(f"Connecting to mongo at {config.settings.MONGO_URL}")
+    # The server has attached its handlers by now
+    wj_logging.route_through_queue(*wj_logging.SERVER_LOGGERS)
 
-    client = AsyncIOMotorClient(config.settings.MONGO_URL)
-    application.db = client[config.settings.MONGO_DBNAME]
+    application.db = db.get_database()
 
     logger.info("Starting ODM initialization")
 
     await init_beanie(
         database=application.db,
-        document_models=[author_models.Author, article_models.Article, user_models.User],
+        document_models=[
+            author_models.Author,
+            article_models.Article,
+            article_models.ArticleViewCount,
+            user_models.User,
+            progress_models.ReadingProgress,
+        ],
     )
 
     logger.info("ODM initialization complete")
 
+    invalidation_listener = asyncio.create_task(cache.listen_for_invalidations(redis))
+    availability_listener = asyncio.create_task(article_availability.listen_for_changes(redis))
+
+    # Runs while the server starts accepting connections; /readyz reports ready once it is done
+    warm_up = asyncio.create_task(health.warm_up())
+
+    view_counter = asyncio.create_task(article_popularity.run_write_behind())
+
+    tasks = [warm_up, invalidation_listener, availability_listener, view_counter]
+
+    if config.settings.METRICS_ENABLED:
+        tasks.append(asyncio.create_task(metrics.track_memory(config.settings.METRICS_MEMORY_INTERVAL_SECONDS)))
+
     yield
 
+    for task in tasks:
+        task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    # Views counted since the last flush would otherwise be lost
+    await article_popularity.flush_views()
+
+    db.close_client()
+
+    memory = metrics.update_memory_metrics()
+
+    if "growth" in memory:
+        logger.info(f"Worker {os.getpid()} RSS grew by {memory['growth'] / 2**20:.1f}MiB since forking")
+
     logger.info("Shutdown complete")
 
 
@@ -76,6 +117,12 @@ if config.settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+app.add_middleware(read_routing.ReadRoutingMiddleware)
+app.add_middleware(query_log.QueryLogMiddleware)
+
+if config.settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 logger.info("Simplifying operation IDs")
 helpers.simplify_operation_ids(app)
 
@@ -90,3 +137,33 @@ helpers.simplify_operation_ids(app)
 async def get_favicon() -> FileResponse:
     favicon_path = pathlib.Path(__file__).parent / "static" / "favicon.ico"
     return FileResponse(favicon_path)
+
+
+@app.get(path="/metrics", include_in_schema=False)
+async def get_metrics(request: Request) -> Response:
+    """
+    Only for scrapers on the internal network, or presenting METRICS_TOKEN
+    """
+    if not metrics.scrape_allowed(request):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    return metrics.metrics_response()
+
+
+@app.get(path="/healthz", include_in_schema=False)
+async def get_liveness() -> Response:
+    """
+    The process is up and serving requests
+    """
+    return JSONResponse(content={"status": "ok"})
+
+
+@app.get(path="/readyz", include_in_schema=False)
+async def get_readiness() -> Response:
+    """
+    Ready once warm-up has finished and mongo and redis both answer; 503 until then
+    """
+    readiness = await health.check_readiness()
+    status_code = 200 if readiness.ready else 503
+
+    return JSONResponse(content=readiness.model_dump(), status_code=status_code)
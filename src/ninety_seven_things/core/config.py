@@ -1,10 +1,10 @@
 # Standard Library Imports
 import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Literal, Optional
 
 # 3rd-Party Imports
-from pydantic import AnyHttpUrl, EmailStr
+from pydantic import AnyHttpUrl, EmailStr, IPvAnyNetwork
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 path = Path(__file__)
@@ -52,6 +52,37 @@ class Settings(BaseSettings):
     # Alerting
     ALERT_EMAIL_RECIPIENT: EmailStr
 
+    # Administration
+    ADMIN_PAGE_SIZE: int = 50
+
+    # Batch Reads
+    BATCH_MAX_ITEMS: int = 100
+
+    # Caching
+    ARTICLE_CACHE_SIZE: int = 2048  # entries; each article is held under its id and its (language, index) key
+    ARTICLE_CACHE_TTL: int = 300  # seconds, in both the local and redis tiers
+    CACHE_REDIS_PREFIX: str = "97_things:cache"
+    CACHE_INVALIDATION_CHANNEL: str = "97_things:cache:invalidate"
+    CACHE_INVALIDATION_RETRY_SECONDS: float = 1.0
+
+    # HTTP Caching
+    ARTICLE_CACHE_MAX_AGE: int = 60  # seconds clients and proxies may reuse an article response without revalidating
+    ARTICLE_STALE_WHILE_REVALIDATE: int = 300  # seconds after that it may still be served while revalidating; 0 to off
+
+    # Reader Navigation
+    READER_FALLBACK_LANGUAGE: str = "en"  # Previous / Next continue in this language past the end of the current one
+    ARTICLE_AVAILABILITY_CHANNEL: str = "97_things:availability"
+
+    # View Counting
+    ARTICLE_VIEWS_FLUSH_SECONDS: float = 5.0  # how often each worker pushes the views it counted to redis
+    ARTICLE_VIEWS_ROLLUP_SECONDS: float = 60.0  # how often one worker writes them to mongo and rebuilds the rollups
+    ARTICLE_VIEWS_REDIS_PREFIX: str = "97_things:views"
+    ARTICLE_POPULAR_DAYS: int = 7
+    ARTICLE_POPULAR_COUNT: int = 10
+
+    # Reader Snapshot
+    READER_SNAPSHOT_PATH: str = ""  # empty serves the reader from mongo; rebuild with scripts/build_snapshot.py
+
     # Units of Measure
     UNIT_OF_MEASURE: str = "metric"  # "imperial"
 
@@ -70,17 +101,61 @@ class Settings(BaseSettings):
     # Logging
     LOG_NAME: str = "97_things"
     LOG_LEVEL: str = "INFO"
-    LOG_FILE: str = "/tmp/97_things.log"
+    LOG_FILE: str = ""  # a path to also log to a rotating file
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_FILE_BACKUP_COUNT: int = 5
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_SAMPLING: Dict[str, float] = {}  # e.g. {"97_things.role": 0.01}
 
     # Mongo Database
     MONGO_URL: str
     MONGO_DBNAME: str
     MONGO_PORT: int
+    MONGO_MAX_POOL_SIZE: int = 50  # per worker
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: int = 60000  # idle connections beyond minPoolSize are closed after this long
+    MONGO_CONNECT_TIMEOUT_MS: int = 5000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 10000
+    MONGO_SOCKET_TIMEOUT_MS: Optional[int] = None  # None waits indefinitely
+    MONGO_COMPRESSORS: List[Literal["zstd", "snappy", "zlib"]] = ["zstd", "zlib"]  # first one the server supports
+    MONGO_READ_PREFERENCE: str = "primary"
+    MONGO_READ_ROUTING_ENABLED: bool = True
+    MONGO_SECONDARY_READ_PATHS: List[str] = ["/ui/reader", "/api/v1/article", "/api/v1/author"]  # GET / HEAD only
+    MONGO_SECONDARY_MAX_STALENESS_SECONDS: int = 90  # the smallest bound the drivers accept
+    MONGO_SLOW_QUERY_MS: int = 100
+    MONGO_QUERY_WARNING_THRESHOLD: int = 20  # queries per request before it is logged as a likely N+1
 
     # Redis DB
     REDIS_URL: str
     REDIS_PORT: int
 
+    # Metrics
+    METRICS_ENABLED: bool = True
+    METRICS_MEMORY_INTERVAL_SECONDS: float = 15.0
+    # Clients that may scrape /metrics without a token, when connecting directly: requests carrying proxy headers
+    # (X-Forwarded-For, Forwarded) always need METRICS_TOKEN, since uvicorn trusts those headers from any peer
+    METRICS_ALLOWED_NETWORKS: List[IPvAnyNetwork] = [
+        "127.0.0.0/8",
+        "10.0.0.0/8",
+        "172.16.0.0/12",
+        "192.168.0.0/16",
+        "::1/128",
+        "fc00::/7",
+    ]
+    METRICS_TOKEN: str = ""  # when set, a scrape presenting it as a bearer token is accepted from anywhere
+
+    # Warm-up / Readiness
+    WARMUP_STEPS: List[Literal["mongo", "redis", "articles", "pages", "templates"]] = [
+        "mongo",
+        "redis",
+        "articles",
+        "pages",
+        "templates",
+    ]
+    WARMUP_CONNECTIONS: int = 5  # opened to each of mongo and redis
+    READINESS_TIMEOUT_SECONDS: float = 1.0
+
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
     BACKEND_CORS_ORIGINS_REGEX: str = ""
@@ -1,14 +1,19 @@
 # Standard Library Imports
 import logging
+from typing import Any, Dict, Optional
 
 # 3rd-Party Imports
 import motor.motor_asyncio
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import metrics, query_log
 
 logger = logging.getLogger(settings.LOG_NAME)
 
+# The one Motor client for this process, created on first use so that it is never inherited across a fork
+client: Optional[motor.motor_asyncio.AsyncIOMotorClient] = None
+
 
 def get_mongo_uri(hosts: str, port: int) -> str:
     # Hosts is a comma-separated list of hosts. Explode it and insert ports.
@@ -18,6 +23,53 @@ def get_mongo_uri(hosts: str, port: int) -> str:
     return f"mongodb://{cluster}"
 
 
-logger.info("Connecting to mongo at %s", settings.MONGO_URL)
-client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGO_URL, uuidRepresentation="standard")
-db = client[settings.MONGODB_DBNAME]
+def client_options(**overrides: Any) -> Dict[str, Any]:
+    """
+    Connection options from Settings, shared by the Motor client and any short-lived synchronous client, which may
+    override any of them
+    """
+    options = {
+        "uuidRepresentation": "standard",
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGO_SOCKET_TIMEOUT_MS,
+        "readPreference": settings.MONGO_READ_PREFERENCE,
+    }
+
+    if settings.MONGO_COMPRESSORS:
+        options["compressors"] = ",".join(settings.MONGO_COMPRESSORS)
+
+    options.update(overrides)
+
+    return options
+
+
+def get_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    global client
+
+    if client is None:
+        logger.info(f"Connecting to mongo at {settings.MONGO_URL}")
+        client = motor.motor_asyncio.AsyncIOMotorClient(
+            settings.MONGO_URL,
+            event_listeners=[metrics.MongoPoolListener(), query_log.CommandMonitor()],
+            **client_options(),
+        )
+
+    return client
+
+
+def get_database() -> motor.motor_asyncio.AsyncIOMotorDatabase:
+    return get_client()[settings.MONGO_DBNAME]
+
+
+def close_client() -> None:
+    global client
+
+    if client is None:
+        return
+
+    client.close()
+    client = None
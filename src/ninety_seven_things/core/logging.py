@@ -1,23 +1,215 @@
 # Standard Library Imports
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.exceptions import ConfigurationException
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# uvicorn's loggers write through handlers of their own (gunicorn's, under its worker) instead of the root's
+SERVER_LOGGERS = ("uvicorn.error", "uvicorn.access")
+
+# Each queue's listener, by the name of the logger it is attached to ("" is the root)
+listeners: Dict[str, QueueListener] = {}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Renders each record as a single line of JSON
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of the records below WARNING for chatty loggers. Rates are keyed by logger name, optionally
+    suffixed with the emitting module (e.g. "97_things.role"), the most specific match wins.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self.rates.get(f"{record.name}.{record.module}", self.rates.get(record.name))
+
+        if rate is None:
+            return True
+
+        return random.random() < rate
 
-def init_logging() -> None:
-    init_stdout_logging()
 
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without formatting them and without ever waiting on a full queue
+    """
 
-def init_stdout_logging() -> None:
-    root = logging.getLogger()
-    root.setLevel(settings.LOG_LEVEL)
+    dropped: int = 0
 
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener lives in this process, so the record can be passed through untouched and the message is only
+        # rendered by the handler that finally writes it
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def get_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == "json":
+        return JSONFormatter()
+
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def get_stdout_handler() -> logging.Handler:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(settings.LOG_LEVEL)
+    handler.setFormatter(get_formatter())
+
+    return handler
+
+
+def get_file_handler() -> logging.Handler:
+    try:
+        handler = RotatingFileHandler(
+            settings.LOG_FILE,
+            maxBytes=settings.LOG_FILE_MAX_BYTES,
+            backupCount=settings.LOG_FILE_BACKUP_COUNT,
+            delay=True,
+        )
+    except OSError as exc:
+        raise ConfigurationException from exc
+
+    handler.setLevel(settings.LOG_LEVEL)
+    handler.setFormatter(get_formatter())
+
+    return handler
+
+
+def init_logging() -> None:
+    handlers = [get_stdout_handler()]
+
+    if settings.LOG_FILE:
+        handlers.append(get_file_handler())
+
+    init_queue_logging(handlers)
+
+
+def start_queue(name: str, handlers: List[logging.Handler]) -> None:
+    """
+    Puts a queue in front of the named logger ("" is the root), its records written by handlers from a listener thread
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+
+    queue_handler = NonBlockingQueueHandler(log_queue)
+
+    if settings.LOG_SAMPLING:
+        queue_handler.addFilter(SamplingFilter(rates=settings.LOG_SAMPLING))
+
+    logging.getLogger(name).addHandler(queue_handler)
+
+    listeners[name] = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listeners[name].start()
+
+
+def detach_queue(name: str) -> None:
+    log = logging.getLogger(name)
+
+    for handler in [h for h in log.handlers if isinstance(h, NonBlockingQueueHandler)]:
+        log.removeHandler(handler)
+
+
+def init_queue_logging(handlers: List[logging.Handler]) -> None:
+    """
+    Routes the root logger through a queue so that request handling never waits on I/O; the given handlers are driven
+    from a background listener thread
+    """
+    stop_logging()
+
+    logging.getLogger().setLevel(settings.LOG_LEVEL)
+
+    start_queue("", handlers)
+
+
+def route_through_queue(*names: str) -> None:
+    """
+    Moves the handlers of loggers that do not propagate to the root (uvicorn's, which it or gunicorn's worker attach
+    when the server starts) behind a queue of their own, so that they do not write from the request path either
+    """
+    for name in names:
+        log = logging.getLogger(name)
+        handlers = [handler for handler in log.handlers if not isinstance(handler, NonBlockingQueueHandler)]
+
+        if not handlers:
+            continue
+
+        for handler in handlers:
+            log.removeHandler(handler)
+
+        previous = listeners.pop(name, None)
+
+        if previous is not None:
+            previous.stop()
+            detach_queue(name)
+            handlers = [*previous.handlers, *handlers]
+
+        start_queue(name, handlers)
+
+
+def stop_logging() -> None:
+    """
+    Flushes anything still queued and detaches the queue handlers
+    """
+    for name, listener in list(listeners.items()):
+        listener.stop()
+        detach_queue(name)
+
+    listeners.clear()
+
+
+def restart_logging_after_fork() -> None:
+    """
+    Threads do not survive a fork, so a forked child (e.g. a gunicorn worker under preload_app) starts listeners of
+    its own on fresh queues, driving the same handlers
+    """
+    # The parent's threads do not exist in this process, so there is nothing to stop or join
+    inherited = dict(listeners)
+    listeners.clear()
+
+    for name, listener in inherited.items():
+        detach_queue(name)
+        start_queue(name, list(listener.handlers))
 
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-    handler.setFormatter(formatter)
-    root.addHandler(handler)
+atexit.register(stop_logging)
+os.register_at_fork(after_in_child=restart_logging_after_fork)
@@ -0,0 +1,13 @@
+# Standard Library Imports
+import logging
+
+# 3rd-Party Imports
+import redis.asyncio
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+# Shared by the authentication token strategy and the caches
+redis = redis.asyncio.from_url(settings.REDIS_URL, decode_responses=True)
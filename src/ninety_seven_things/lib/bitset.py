@@ -0,0 +1,46 @@
+"""
+Sets of small non-negative integers held as the set bits of a Python int
+"""
+
+# Standard Library Imports
+import random
+from typing import Iterator, Optional
+
+
+def members(bitset: int) -> Iterator[int]:
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+def next_member(bitset: int, after: int) -> Optional[int]:
+    """
+    The smallest member greater than after
+    """
+    start = max(after + 1, 0)
+    above = bitset >> start
+
+    return start + (above & -above).bit_length() - 1 if above else None
+
+
+def previous_member(bitset: int, before: int) -> Optional[int]:
+    """
+    The largest member less than before
+    """
+    below = bitset & ((1 << max(before, 0)) - 1)
+
+    return below.bit_length() - 1 if below else None
+
+
+def random_member(bitset: int) -> Optional[int]:
+    count = bitset.bit_count()
+
+    if not count:
+        return None
+
+    # The n-th member, found by clearing the lowest set bit n times
+    for _ in range(random.randrange(count)):
+        bitset &= bitset - 1
+
+    return (bitset & -bitset).bit_length() - 1
@@ -0,0 +1,329 @@
+"""
+Caching: a bounded in-process LRU (L1), optionally fronting a Redis cache shared by every worker (L2), with
+invalidations broadcast over Redis pub/sub so that each worker evicts its own L1. Every delete or clear also bumps the
+cache's generation in Redis; a fill carries the generation read before its values were, and is refused if a write has
+bumped it since, so a read that raced a write can not cache the document from before it.
+"""
+
+# Standard Library Imports
+import asyncio
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# 3rd-Party Imports
+from bson import json_util
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import metrics
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+# Every TieredCache in this process, by name, so that invalidation messages can be routed to them
+caches: Dict[str, "TieredCache"] = {}
+
+
+class LocalCache:
+    """
+    Least recently used entries are dropped once max_size is reached and entries older than ttl seconds are treated as
+    misses. Lookups are counted in the cache_lookups_total metric under the cache's name.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        # Counts deletes and clears, so that a fill can tell whether one happened while it was waiting on Redis
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.entries.get(key)
+
+        if entry is not None and entry[0] < time.monotonic():
+            del self.entries[key]
+            entry = None
+
+        metrics.record_cache_lookup(self.name, hit=entry is not None)
+
+        if entry is None:
+            return None
+
+        self.entries.move_to_end(key)
+
+        return entry[1]
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        The cached values for whichever of the keys are present
+        """
+        found = {}
+
+        for key in keys:
+            value = self.get(key)
+
+            if value is not None:
+                found[key] = value
+
+        return found
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.max_size <= 0:
+            return
+
+        self.entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        self.evictions += 1
+
+        for key in keys:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.evictions += 1
+        self.entries.clear()
+
+
+class TieredCache:
+    """
+    An in-process LocalCache in front of Redis. Misses in L1 fall through to Redis and hits there refill L1, so a cold
+    worker warms from Redis rather than Mongo. Values must be BSON-compatible (they are stored as extended JSON) and
+    keys strings. Deletes and clears are published on CACHE_INVALIDATION_CHANNEL for the other workers; Redis errors are
+    logged and treated as misses so that an outage only costs performance.
+    """
+
+    def __init__(self, name: str, redis: Redis, max_size: int, ttl: int) -> None:
+        self.name = name
+        self.redis = redis
+        self.ttl = ttl
+        self.local = LocalCache(name=f"{name}.local", max_size=max_size, ttl=ttl)
+        # Whether L1 was primed, and at which generation (None if it could not be read)
+        self.primed = False
+        self.primed_generation: Optional[str] = None
+
+        caches[name] = self
+
+    def redis_key(self, key: str) -> str:
+        return f"{settings.CACHE_REDIS_PREFIX}:{self.name}:{key}"
+
+    @property
+    def generation_key(self) -> str:
+        # Outside the cache's own keys, so that clearing them leaves it be
+        return f"{settings.CACHE_REDIS_PREFIX}:generation:{self.name}"
+
+    async def generation(self) -> Optional[str]:
+        """
+        Read before the values that will fill the cache, or None if Redis is unavailable
+        """
+        try:
+            return await self.redis.get(self.generation_key) or "0"
+        except RedisError as exc:
+            logger.warning(f"Unable to read the {self.name} cache generation from redis: {exc}")
+            return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        The cached values for whichever of the keys are present in either tier
+        """
+        keys = list(dict.fromkeys(keys))
+        found = self.local.get_many(keys)
+        missing = [key for key in keys if key not in found]
+
+        if not missing:
+            return found
+
+        evictions = self.local.evictions
+
+        try:
+            values = await self.redis.mget([self.redis_key(key) for key in missing])
+        except RedisError as exc:
+            logger.warning(f"Unable to read the {self.name} cache from redis: {exc}")
+            return found
+
+        for key, value in zip(missing, values, strict=True):
+            metrics.record_cache_lookup(f"{self.name}.redis", hit=value is not None)
+
+            if value is not None:
+                found[key] = json_util.loads(value)
+
+                # An invalidation handled meanwhile may have been for this value
+                if self.local.evictions == evictions:
+                    self.local.set(key, found[key])
+
+        return found
+
+    async def set_many(self, values: Dict[str, Any], generation: Optional[str]) -> None:
+        """
+        Fills both tiers with values read at generation, unless a write has bumped it since. L1 is filled first, so that
+        an invalidation arriving while Redis is being written evicts it; without a generation only L1 is filled.
+        """
+        for key, value in values.items():
+            self.local.set(key, value)
+
+        if generation is None:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                await pipeline.watch(self.generation_key)
+
+                if (await pipeline.get(self.generation_key) or "0") != generation:
+                    self.local.delete(*values)
+                    return
+
+                pipeline.multi()
+
+                for key, value in values.items():
+                    pipeline.set(self.redis_key(key), json_util.dumps(value), ex=self.ttl)
+
+                await pipeline.execute()
+        except WatchError:
+            # Bumped while the values were being written
+            self.local.delete(*values)
+        except RedisError as exc:
+            logger.warning(f"Unable to write the {self.name} cache to redis: {exc}")
+
+    async def set(self, key: str, value: Any, generation: Optional[str]) -> None:
+        await self.set_many({key: value}, generation)
+
+    def prime(self, values: Dict[str, Any], generation: Optional[str]) -> None:
+        """
+        Fills L1 only, with entries that never expire and are only removed by invalidation. Used to preload the gunicorn
+        master so that every worker inherits the same entries; generation is the cache's, read before the values were.
+        """
+        for key, value in values.items():
+            self.local.set(key, value, ttl=math.inf)
+
+        self.primed = True
+        self.primed_generation = generation
+
+    async def drop_stale_primed_entries(self) -> None:
+        """
+        A worker forked long after the master primed L1 (a replacement for one that crashed or was recycled) inherits
+        entries that invalidations published before it existed never reached; if the cache has been written since, or
+        it is unknown whether it has, L1 is cleared
+        """
+        if not self.primed:
+            return
+
+        self.primed = False
+
+        if self.primed_generation is None or await self.generation() != self.primed_generation:
+            logger.info(f"The {self.name} cache changed since it was preloaded, clearing the inherited entries")
+            self.local.clear()
+
+    async def delete(self, *keys: str) -> None:
+        self.local.delete(*keys)
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                pipeline.delete(*(self.redis_key(key) for key in keys))
+                pipeline.incr(self.generation_key)
+                await pipeline.execute()
+        except RedisError as exc:
+            logger.warning(f"Unable to delete from the {self.name} cache in redis: {exc}")
+
+        await publish_invalidation(self.redis, self.name, keys)
+
+    async def clear(self) -> None:
+        self.local.clear()
+
+        try:
+            redis_keys = [key async for key in self.redis.scan_iter(match=self.redis_key("*"))]
+
+            if redis_keys:
+                await self.redis.delete(*redis_keys)
+
+            await self.redis.incr(self.generation_key)
+        except RedisError as exc:
+            logger.warning(f"Unable to clear the {self.name} cache in redis: {exc}")
+
+        await publish_invalidation(self.redis, self.name)
+
+
+async def publish_invalidation(redis: Redis, name: Optional[str] = None, keys: Optional[Sequence[str]] = None) -> None:
+    """
+    Tells every worker to evict keys from its L1 copy of the named cache; no keys clears it and no name clears every
+    cache
+    """
+    message = json.dumps({"cache": name, "keys": list(keys) if keys is not None else None})
+
+    try:
+        await redis.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+    except RedisError as exc:
+        logger.warning(f"Unable to publish a cache invalidation for {name or 'every cache'}: {exc}")
+
+
+async def clear_all() -> None:
+    """
+    Clears every cache in both tiers, on every worker
+    """
+    for cache in caches.values():
+        await cache.clear()
+
+
+def evict_local(name: Optional[str], keys: Optional[List[str]]) -> None:
+    if name is None:
+        targets = list(caches.values())
+    elif name in caches:
+        targets = [caches[name]]
+    else:
+        return
+
+    for cache in targets:
+        if keys is None:
+            cache.local.clear()
+        else:
+            cache.local.delete(*keys)
+
+
+async def listen_for_invalidations(redis: Redis) -> None:
+    """
+    Applies invalidations published by any worker (this one included) to this worker's L1 caches. Runs for the life
+    of the process; while the subscription is down messages may be missed, so every L1 is cleared on reconnecting.
+    The first subscription only clears entries preloaded before forking if their cache has been written since.
+    """
+    reconnecting = False
+
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+
+                if reconnecting:
+                    evict_local(None, None)
+                else:
+                    # Subscribed first, so that any write after the check is still heard about
+                    for cache in list(caches.values()):
+                        await cache.drop_stale_primed_entries()
+
+                reconnecting = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    try:
+                        payload = json.loads(message["data"])
+                        evict_local(payload["cache"], payload["keys"])
+                    except (ValueError, KeyError, TypeError) as exc:
+                        logger.warning(f"Ignoring malformed cache invalidation {message['data']!r}: {exc}")
+        except RedisError as exc:
+            logger.warning(f"Cache invalidation subscription lost, retrying: {exc}")
+            await asyncio.sleep(settings.CACHE_INVALIDATION_RETRY_SECONDS)
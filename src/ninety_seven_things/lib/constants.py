@@ -4,6 +4,7 @@ E_CONFIG = 1
 # Date / Time Formats
 TIME_FORMAT_STR = "HH:MM"
 DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%S"
+HUMAN_READABLE_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
 # Navigation
 INDEX_ID = 0
@@ -7,6 +7,32 @@ class EntityType(StrEnum):
     AUTHOR = "author"
 
 
+class ArticleSort(StrEnum):
+    """
+    Article orderings
+    """
+
+    INDEX = "index"
+    INDEX_DESCENDING = "index_descending"
+    TITLE = "title"
+    TITLE_DESCENDING = "title_descending"
+    LANGUAGE = "language"
+    LANGUAGE_DESCENDING = "language_descending"
+
+    @property
+    def field(self) -> str:
+        return self.value.removesuffix("_descending")
+
+    @property
+    def direction(self) -> str:
+        return "-" if self.value.endswith("_descending") else "+"
+
+
+class ArticleView(StrEnum):
+    FULL = "full"
+    ABRIDGED = "abridged"
+
+
 class HealthCheckStatus(StrEnum):
     OK = "ok"
     NOT_OK = "not ok"
@@ -45,3 +45,10 @@ class DoesNotExistException(NinetySevenThingsException, MessageExceptionMixin):
     """
     The object / Document being searched for does not exist.
     """
+
+
+@dataclass
+class SnapshotFormatException(NinetySevenThingsException, MessageExceptionMixin):
+    """
+    A file is not a snapshot this version can read
+    """
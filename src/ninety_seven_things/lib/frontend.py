@@ -0,0 +1,133 @@
+"""
+The FastUI React frontend, served from a vendored copy of its prebuilt bundle rather than from the public CDN
+
+scripts/vendor_fastui.py unpacks the bundle into static/fastui/<fingerprint>/, where the fingerprint is a hash of its
+contents, so its URLs never change meaning and can be cached forever. Without a vendored copy the landing pages fall
+back to the CDN.
+"""
+
+# Standard Library Imports
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import pathlib
+import shutil
+import stat
+from typing import Dict, Optional
+
+# 3rd-Party Imports
+import anyio
+import fastui
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+ASSETS_DIR = pathlib.Path(__file__).parent.parent / "static" / "fastui"
+ASSETS_URL = "/static/fastui"
+MANIFEST_NAME = "manifest.json"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Below this a gzipped copy saves too little to be worth the extra file
+MIN_COMPRESS_SIZE = 1024
+
+
+def vendor_assets(files: Dict[str, bytes], version: str, assets_dir: pathlib.Path = ASSETS_DIR) -> str:
+    """
+    Writes the bundle's files, each with a gzipped copy, under a directory named after a hash of their contents, then
+    points the manifest at it and removes any previously vendored bundle. Returns the fingerprint.
+    """
+    digest = hashlib.sha256()
+
+    for name in sorted(files):
+        digest.update(name.encode())
+        digest.update(files[name])
+
+    fingerprint = digest.hexdigest()[:16]
+    bundle_dir = assets_dir / fingerprint
+
+    for name, contents in files.items():
+        path = bundle_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(contents)
+
+        if len(contents) >= MIN_COMPRESS_SIZE:
+            path.with_name(f"{path.name}.gz").write_bytes(gzip.compress(contents, compresslevel=9, mtime=0))
+
+    manifest = {"version": version, "fingerprint": fingerprint}
+    (assets_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+    for path in assets_dir.iterdir():
+        if path.is_dir() and path.name != fingerprint:
+            shutil.rmtree(path)
+
+    return fingerprint
+
+
+@functools.cache
+def assets_fingerprint() -> Optional[str]:
+    """
+    The fingerprint of the vendored bundle, or None if there is none or it was built for another version of fastui
+    """
+    try:
+        manifest = json.loads((ASSETS_DIR / MANIFEST_NAME).read_text())
+    except (OSError, ValueError) as exc:
+        logger.warning(f"No vendored FastUI frontend, loading it from the CDN instead: {exc}")
+        return None
+
+    if manifest.get("version") != fastui._PREBUILT_VERSION:
+        logger.warning(
+            f"The vendored FastUI frontend is version {manifest.get('version')} but fastui expects "
+            f"{fastui._PREBUILT_VERSION}, loading it from the CDN instead"
+        )
+        return None
+
+    return manifest["fingerprint"]
+
+
+@functools.cache
+def landing_html(title: str, api_root_url: str) -> str:
+    """
+    The page that loads the React app, built once per title
+    """
+    html = fastui.prebuilt_html(title=title, api_root_url=api_root_url)
+    fingerprint = assets_fingerprint()
+
+    if fingerprint is None:
+        return html
+
+    return html.replace(fastui._PREBUILT_CDN_URL, f"{ASSETS_URL}/{fingerprint}")
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Serves the gzipped copy of a file to clients that accept it, and marks every response as cacheable forever; only
+    mount it over fingerprinted paths
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+
+        if "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, f"{path}.gz")
+
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                # The media type is guessed from the name without its .gz suffix
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = "gzip"
+
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["Vary"] = "Accept-Encoding"
+
+        return response
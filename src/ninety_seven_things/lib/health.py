@@ -0,0 +1,130 @@
+"""
+Start-up warm-up and the liveness / readiness checks that report on it. Subsystems register the steps that warm them;
+settings.WARMUP_STEPS chooses which of them run, and in what order.
+"""
+
+# Standard Library Imports
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# 3rd-Party Imports
+from pydantic import BaseModel
+from pymongo.errors import PyMongoError
+from redis.exceptions import RedisError
+
+# Application-Local Imports
+from ninety_seven_things.core import db
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.core.redis import redis
+from ninety_seven_things.lib.exceptions import NinetySevenThingsException
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+# What a failing warm-up step or dependency check is expected to raise; TimeoutError is an OSError
+WARM_UP_ERRORS = (PyMongoError, RedisError, OSError, ValueError, NinetySevenThingsException)
+DEPENDENCY_ERRORS = (PyMongoError, RedisError, OSError)
+
+
+class WarmUpStep(BaseModel):
+    seconds: float
+    error: Optional[str] = None
+
+
+class WarmUpState(BaseModel):
+    finished: bool = False
+    steps: Dict[str, WarmUpStep] = {}
+
+
+class DependencyStatus(BaseModel):
+    ok: bool
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+class Readiness(BaseModel):
+    ready: bool
+    warm_up: WarmUpState
+    dependencies: Dict[str, DependencyStatus]
+
+
+warm_up_state = WarmUpState()
+
+
+# Every warm-up step, by name
+warm_up_steps: Dict[str, Callable[[], Awaitable[None]]] = {}
+
+
+def register_warm_up_step(name: str, step: Callable[[], Awaitable[None]]) -> None:
+    warm_up_steps[name] = step
+
+
+async def ping_mongo() -> Any:
+    return await db.get_database().command("ping")
+
+
+async def ping_redis() -> Any:
+    return await redis.ping()
+
+
+async def open_mongo_connections() -> None:
+    # Concurrent commands each check out their own connection, leaving that many open in the pool
+    await asyncio.gather(*(ping_mongo() for _ in range(settings.WARMUP_CONNECTIONS)))
+
+
+async def open_redis_connections() -> None:
+    await asyncio.gather(*(ping_redis() for _ in range(settings.WARMUP_CONNECTIONS)))
+
+
+register_warm_up_step("mongo", open_mongo_connections)
+register_warm_up_step("redis", open_redis_connections)
+
+
+async def warm_up() -> None:
+    """
+    Runs the configured WARMUP_STEPS in order. A failing step is logged and recorded but does not stop the rest, as
+    the worker is still able to serve without it, only more slowly.
+    """
+    for name in settings.WARMUP_STEPS:
+        start = time.perf_counter()
+        error = None
+
+        step = warm_up_steps.get(name)
+
+        if step is None:
+            logger.warning(f"Warm-up step {name} is not registered")
+            error = "not registered"
+        else:
+            try:
+                await step()
+            except WARM_UP_ERRORS as exc:
+                logger.warning(f"Warm-up step {name} failed: {exc}")
+                error = str(exc) or type(exc).__name__
+
+        warm_up_state.steps[name] = WarmUpStep(seconds=time.perf_counter() - start, error=error)
+
+    warm_up_state.finished = True
+    logger.info(f"Warm-up finished in {sum(result.seconds for result in warm_up_state.steps.values()):.2f}s")
+
+
+async def check_dependency(ping: Callable[[], Awaitable[Any]]) -> DependencyStatus:
+    start = time.perf_counter()
+
+    try:
+        await asyncio.wait_for(ping(), timeout=settings.READINESS_TIMEOUT_SECONDS)
+    except DEPENDENCY_ERRORS as exc:
+        return DependencyStatus(ok=False, error=str(exc) or type(exc).__name__)
+
+    return DependencyStatus(ok=True, latency_ms=(time.perf_counter() - start) * 1000)
+
+
+async def check_readiness() -> Readiness:
+    mongo, redis_status = await asyncio.gather(check_dependency(ping_mongo), check_dependency(ping_redis))
+    dependencies = {"mongo": mongo, "redis": redis_status}
+
+    return Readiness(
+        ready=warm_up_state.finished and all(dependency.ok for dependency in dependencies.values()),
+        warm_up=warm_up_state,
+        dependencies=dependencies,
+    )
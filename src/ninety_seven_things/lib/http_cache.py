@@ -0,0 +1,102 @@
+"""
+HTTP conditional requests for read endpoints: a strong ETag hashed from the serialized body, Last-Modified from a
+single document's updated_at, and a bodiless 304 when the client's copy is still current
+
+Collections are validated by their ETag alone. Deleting one of their documents, or moving the page they are a window
+onto, changes the body without changing the newest updated_at, so a Last-Modified would let clients keep a stale copy.
+"""
+
+# Standard Library Imports
+import datetime
+import email.utils
+import hashlib
+from typing import Any, Dict, Optional
+
+# 3rd-Party Imports
+from fastapi import Request, Response, status
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.serialization import JSONBytesResponse
+
+
+def entity_tag(content: bytes) -> str:
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def last_modified(document: Optional[Dict[str, Any]]) -> Optional[datetime.datetime]:
+    """
+    The document's updated_at, or None if it has none (e.g. it was written before the field existed)
+    """
+    updated_at = document.get("updated_at") if document is not None else None
+
+    # Mongo hands back naive datetimes, which are always UTC
+    if updated_at is not None and updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=datetime.UTC)
+
+    return updated_at
+
+
+def cache_control() -> str:
+    directives = ["public", f"max-age={settings.ARTICLE_CACHE_MAX_AGE}"]
+
+    if settings.ARTICLE_STALE_WHILE_REVALIDATE:
+        directives.append(f"stale-while-revalidate={settings.ARTICLE_STALE_WHILE_REVALIDATE}")
+
+    return ", ".join(directives)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+
+    return "*" in candidates or etag in candidates
+
+
+def not_modified_since(if_modified_since: str, modified: datetime.datetime) -> bool:
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.UTC)
+
+    # HTTP dates only have whole seconds
+    return modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(request: Request, etag: str, modified: Optional[datetime.datetime]) -> bool:
+    """
+    If-None-Match takes precedence; If-Modified-Since is only considered without it
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_modified_since is not None and modified is not None:
+        return not_modified_since(if_modified_since, modified)
+
+    return False
+
+
+def conditional_response(request: Request, content: bytes, document: Optional[Dict[str, Any]] = None) -> Response:
+    """
+    The serialized content as a JSON response carrying validators and Cache-Control, or a 304 if the client has it.
+    Pass the document for a single-document response; it is the source of Last-Modified.
+    """
+    etag = entity_tag(content)
+    modified = last_modified(document)
+
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+
+    if modified is not None:
+        headers["Last-Modified"] = email.utils.format_datetime(modified, usegmt=True)
+
+    if is_not_modified(request, etag, modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return JSONBytesResponse(content=content, headers=headers)
@@ -0,0 +1,53 @@
+"""
+Deferred loading for optional subsystems, so that a worker only imports what the requests it serves actually use
+"""
+
+# Standard Library Imports
+import asyncio
+import importlib
+import logging
+import time
+from typing import Optional
+
+# 3rd-Party Imports
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+def import_attribute(path: str) -> object:
+    """
+    Imports "package.module:attribute" and returns the attribute
+    """
+    module_name, _, attribute = path.partition(":")
+
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class LazyApp:
+    """
+    An ASGI app that stands in for the one at import_path, importing it on the first request it receives. Mount it
+    where the real app would be mounted.
+    """
+
+    def __init__(self, import_path: str) -> None:
+        self.import_path = import_path
+        self.app: Optional[ASGIApp] = None
+        self.lock = asyncio.Lock()
+
+    async def load(self) -> ASGIApp:
+        async with self.lock:
+            if self.app is None:
+                start = time.perf_counter()
+                self.app = import_attribute(self.import_path)
+                logger.info(f"Loaded {self.import_path} on first use in {time.perf_counter() - start:.3f}s")
+
+        return self.app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        app = self.app or await self.load()
+
+        await app(scope, receive, send)
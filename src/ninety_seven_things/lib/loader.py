@@ -0,0 +1,152 @@
+"""
+Link introspection, fetch planning and request-scoped batch resolution of Beanie links
+"""
+
+# Standard Library Imports
+import logging
+from collections import defaultdict
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Sequence, Set, Type, Union
+
+# 3rd-Party Imports
+from beanie import Document, Link
+from beanie.odm.fields import LinkTypes
+from beanie.operators import In
+from fastapi import Depends
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+FORWARD_LINK_TYPES = {LinkTypes.DIRECT, LinkTypes.OPTIONAL_DIRECT, LinkTypes.LIST, LinkTypes.OPTIONAL_LIST}
+
+# True fetches every link, False none, and a sequence of field names only those links
+LinkSelection = Union[bool, Sequence[str]]
+
+
+class BatchLoader:
+    """
+    Collects pending link ids per target document class and resolves each class with a single $in query. Ids are
+    deduplicated and resolved documents are remembered, so a link is only ever fetched once per loader.
+    """
+
+    def __init__(self) -> None:
+        self.pending: Dict[Type[Document], Set[Any]] = defaultdict(set)
+        self.resolved: Dict[Type[Document], Dict[Any, Document]] = defaultdict(dict)
+
+    def add(self, link: Union[Link, Document]) -> None:
+        if isinstance(link, Document):
+            self.resolved[type(link)][link.id] = link
+            return
+
+        if link.ref.id not in self.resolved[link.document_class]:
+            self.pending[link.document_class].add(link.ref.id)
+
+    def add_many(self, links: Iterable[Union[Link, Document]]) -> None:
+        for link in links:
+            self.add(link)
+
+    async def load(self) -> None:
+        pending, self.pending = self.pending, defaultdict(set)
+
+        for document_class, ids in pending.items():
+            documents = await document_class.find(In(document_class.id, list(ids))).to_list()
+
+            for document in documents:
+                self.resolved[document_class][document.id] = document
+
+    def get(self, link: Union[Link, Document]) -> Optional[Document]:
+        if isinstance(link, Document):
+            return link
+
+        return self.resolved[link.document_class].get(link.ref.id)
+
+    async def resolve(self, links: Iterable[Union[Link, Document]]) -> List[Document]:
+        """
+        Resolves the given links in order, skipping any whose target no longer exists
+        """
+        links = list(links)
+
+        self.add_many(links)
+        await self.load()
+
+        return [document for document in (self.get(link) for link in links) if document is not None]
+
+
+def forward_link_fields(model: Type[Document]) -> List[str]:
+    return [
+        field_name
+        for field_name, link_info in (model.get_link_fields() or {}).items()
+        if link_info.link_type in FORWARD_LINK_TYPES
+    ]
+
+
+def as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+
+    if isinstance(value, list):
+        return value
+
+    return [value]
+
+
+def link_values(document: Document) -> Dict[str, List[Union[Link, Document]]]:
+    """
+    Every forward link held by a document, keyed by field name, with single links wrapped in a list
+    """
+    return {
+        field_name: as_list(getattr(document, field_name, None)) for field_name in forward_link_fields(type(document))
+    }
+
+
+def use_lookup(model: Type[Document], fetch_links: LinkSelection) -> bool:
+    """
+    Whether a query should ask Beanie to fetch links. Beanie turns fetch_links into an aggregation with a $lookup per
+    link, which is only worth it when every link is wanted and the model actually has some; otherwise a plain find is
+    issued and any named links are resolved afterwards by fetch_selected_links.
+    """
+    return fetch_links is True and bool(forward_link_fields(model))
+
+
+async def fetch_selected_links(
+    model: Type[Document],
+    documents: Sequence[Document],
+    fetch_links: LinkSelection,
+    loader: Optional[BatchLoader] = None,
+) -> None:
+    """
+    Replaces the named links on each document with the documents they point to, one query per target collection
+    """
+    if isinstance(fetch_links, bool):
+        return
+
+    unknown_fields = set(fetch_links) - set(forward_link_fields(model))
+
+    if unknown_fields:
+        raise ValueError(f"{model.__name__} has no link fields named {', '.join(sorted(unknown_fields))}")
+
+    if loader is None:
+        loader = BatchLoader()
+
+    for document in documents:
+        for field_name in fetch_links:
+            loader.add_many(as_list(getattr(document, field_name)))
+
+    await loader.load()
+
+    for document in documents:
+        for field_name in fetch_links:
+            value = getattr(document, field_name)
+
+            if isinstance(value, list):
+                setattr(document, field_name, [loader.get(link) or link for link in value])
+            elif value is not None:
+                setattr(document, field_name, loader.get(value) or value)
+
+
+async def get_batch_loader() -> BatchLoader:
+    return BatchLoader()
+
+
+BatchLoaderDependency = Annotated[BatchLoader, Depends(get_batch_loader)]
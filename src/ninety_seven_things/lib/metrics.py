@@ -0,0 +1,279 @@
+"""
+Prometheus instrumentation: per-route request metrics, cache lookups and connection pool statistics
+"""
+
+# Standard Library Imports
+import asyncio
+import hmac
+import ipaddress
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+# 3rd-Party Imports
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.registry import Collector
+from pymongo import monitoring
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+REQUESTS = Counter("http_requests_total", "HTTP requests handled", ["method", "route", "status"])
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP response body size", ["method", "route"], buckets=SIZE_BUCKETS
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", ["method"], multiprocess_mode="livesum"
+)
+
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups by outcome", ["cache", "result"])
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total", "Calls that awaited an identical call already in flight", ["name"]
+)
+
+MONGO_COMMAND_DURATION = Histogram(
+    "mongo_command_duration_seconds", "Mongo command latency", ["command", "collection"], buckets=LATENCY_BUCKETS
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_mongo_queries", "Mongo commands issued per request", ["method", "route"], buckets=QUERY_BUCKETS
+)
+
+MONGO_POOL_CONNECTIONS = Gauge(
+    "mongo_pool_connections", "Mongo connections by state", ["state"], multiprocess_mode="livesum"
+)
+
+WORKER_MEMORY = Gauge(
+    "worker_memory_bytes",
+    "Worker memory by kind (rss, shared, private, and rss growth since the worker forked)",
+    ["kind"],
+    multiprocess_mode="liveall",
+)
+
+# Headers a proxy adds, which uvicorn (run with --forwarded-allow-ips "*") trusts when rewriting the request's client
+PROXY_HEADERS = ("x-forwarded-for", "forwarded")
+
+# Collectors reading this process's own state at scrape time, which the multiprocess registry must include too
+process_collectors: List[Collector] = []
+
+# Resident set size when this process was forked, for measuring how much of the parent's memory it has un-shared
+fork_rss: Optional[int] = None
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def read_memory() -> Dict[str, int]:
+    """
+    Resident, shared and private memory of this process, from /proc/self/smaps_rollup; empty where that is unavailable
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            fields = {name: int(value.split()[0]) * 1024 for name, _, value in (line.partition(":") for line in smaps)}
+    except (OSError, ValueError):
+        return {}
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def record_fork_rss() -> None:
+    global fork_rss
+    fork_rss = read_memory().get("rss")
+
+
+os.register_at_fork(after_in_child=record_fork_rss)
+
+
+def update_memory_metrics() -> Dict[str, int]:
+    memory = read_memory()
+
+    if memory and fork_rss is not None:
+        memory["growth"] = memory["rss"] - fork_rss
+
+    for kind, value in memory.items():
+        WORKER_MEMORY.labels(kind).set(value)
+
+    return memory
+
+
+async def track_memory(interval: float) -> None:
+    while True:
+        update_memory_metrics()
+        await asyncio.sleep(interval)
+
+
+def register_process_collector(collector: Collector) -> None:
+    REGISTRY.register(collector)
+    process_collectors.append(collector)
+
+
+def render_metrics() -> bytes:
+    """
+    Renders every metric in the text exposition format. When PROMETHEUS_MULTIPROC_DIR is set (gunicorn), values are
+    aggregated across all workers, apart from those of the process collectors, which describe the worker scraped.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+
+        for collector in process_collectors:
+            registry.register(collector)
+
+        return generate_latest(registry)
+
+    return generate_latest(REGISTRY)
+
+
+def scrape_allowed(request: Request) -> bool:
+    """
+    Scrapes are accepted from anywhere with the METRICS_TOKEN bearer token, or from METRICS_ALLOWED_NETWORKS. The
+    client address is only trusted when no proxy header is present: uvicorn takes it from X-Forwarded-For sent by any
+    peer, so it can be forged, and behind a proxy every client would seem internal. Proxied scrapes need the token.
+    """
+    if settings.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+
+        if scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+            return True
+
+    if request.client is None or any(header in request.headers for header in PROXY_HEADERS):
+        return False
+
+    try:
+        address = ipaddress.ip_address(request.client.host)
+    except ValueError:
+        return False
+
+    return any(address in network for network in settings.METRICS_ALLOWED_NETWORKS)
+
+
+def metrics_response() -> Response:
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware, labelled by route template rather than raw path so that cardinality stays bounded
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+
+            await send(message)
+
+        in_flight = IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+            REQUESTS.labels(method, route, str(status_code)).inc()
+            LATENCY.labels(method, route).observe(elapsed)
+            RESPONSE_SIZE.labels(method, route).observe(response_size)
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """
+    Tracks open and checked-out connections for the Motor client it is registered on
+    """
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        MONGO_POOL_CONNECTIONS.labels("open").inc()
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        MONGO_POOL_CONNECTIONS.labels("open").dec()
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        pass
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        MONGO_POOL_CONNECTIONS.labels("checked_out").inc()
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        MONGO_POOL_CONNECTIONS.labels("checked_out").dec()
+
+
+class RedisPoolCollector(Collector):
+    """
+    Reads connection counts off a redis.asyncio connection pool at scrape time
+    """
+
+    def __init__(self, pool: Any):
+        self.pool = pool
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        gauge = GaugeMetricFamily("redis_pool_connections", "Redis connections by state", labels=["state"])
+        gauge.add_metric(["available"], len(getattr(self.pool, "_available_connections", [])))
+        gauge.add_metric(["in_use"], len(getattr(self.pool, "_in_use_connections", [])))
+        gauge.add_metric(["max"], getattr(self.pool, "max_connections", 0))
+        yield gauge
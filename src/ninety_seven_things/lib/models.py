@@ -2,16 +2,39 @@
 import datetime
 
 # 3rd-Party Imports
+from motor.motor_asyncio import AsyncIOMotorCollection
 from pydantic import Field, field_serializer
 
 # Application-Local Imports
 from ninety_seven_things.lib import constants, helpers
+from ninety_seven_things.lib.read_routing import current_read_preference
 
 
 class Timestamped:
+    """
+    For Beanie documents; the services set updated_at on every write
+    """
+
     created_at: datetime.datetime = Field(default_factory=helpers.utcnow)
     updated_at: datetime.datetime = Field(default_factory=helpers.utcnow)
 
     @field_serializer("created_at", "updated_at")
-    def serialize_created_at(self, created_at: datetime.datetime) -> str:
-        return created_at.strftime(constants.HUMAN_READABLE_DATETIME_FORMAT)
+    def serialize_timestamp(self, timestamp: datetime.datetime) -> str:
+        return timestamp.strftime(constants.HUMAN_READABLE_DATETIME_FORMAT)
+
+
+class ReadRouted:
+    """
+    For Beanie documents (listed before Document), whose queries then honour the read preference routed for the
+    current request; writes always go to the primary regardless
+    """
+
+    @classmethod
+    def get_motor_collection(cls) -> AsyncIOMotorCollection:
+        collection = super().get_motor_collection()  # type: ignore[misc]
+        read_preference = current_read_preference.get()
+
+        if read_preference is None:
+            return collection
+
+        return collection.with_options(read_preference=read_preference)
@@ -0,0 +1,85 @@
+"""
+Preloading for the gunicorn master: the article corpus is read and cached once before the workers fork, then frozen so
+that every worker shares those pages copy-on-write instead of building a copy of its own
+"""
+
+# Standard Library Imports
+import gc
+import logging
+from typing import Any, Dict, List, Optional
+
+# 3rd-Party Imports
+import pymongo
+import redis
+from redis.exceptions import RedisError
+
+# Application-Local Imports
+from ninety_seven_things.core import db
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.modules.article import availability as article_availability
+from ninety_seven_things.modules.article import service as article_service
+from ninety_seven_things.modules.article.models import Article
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+# Fail fast so that an unreachable Mongo only delays start-up briefly; the workers then load the corpus themselves
+PRELOAD_SERVER_SELECTION_TIMEOUT_MS = 5000
+PRELOAD_REDIS_TIMEOUT_SECONDS = 5.0
+
+# Set in the master and inherited by each worker, whose warm-up then skips loading the corpus itself
+preloaded_articles = 0
+
+
+def read_article_documents(**client_overrides: Any) -> List[Dict[str, Any]]:
+    """
+    Reads every article with a short-lived synchronous client, closed again before returning, so no connection is
+    inherited across the fork; workers open their own from the app lifespan
+    """
+    with pymongo.MongoClient(settings.MONGO_URL, **db.client_options(**client_overrides)) as client:
+        # Beanie names the collection after the document class
+        return list(client[settings.MONGO_DBNAME][Article.__name__].find({}))
+
+
+def read_cache_generation() -> Optional[str]:
+    """
+    The article cache's generation, read with a short-lived synchronous client like the documents; None if Redis is
+    unavailable, in which case every worker clears the preloaded entries once it has subscribed to invalidations
+    """
+    try:
+        with redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=PRELOAD_REDIS_TIMEOUT_SECONDS,
+            socket_timeout=PRELOAD_REDIS_TIMEOUT_SECONDS,
+        ) as client:
+            return client.get(article_service.article_cache.generation_key) or "0"
+    except RedisError as exc:
+        logger.warning(f"Unable to read the article cache generation: {exc}")
+        return None
+
+
+def preload_corpus() -> int:
+    global preloaded_articles
+
+    # Before the documents, so that a write made while they are read counts as newer than them
+    generation = read_cache_generation()
+    documents = read_article_documents(serverSelectionTimeoutMS=PRELOAD_SERVER_SELECTION_TIMEOUT_MS)
+
+    article_service.prime_cache(documents, generation)
+    article_availability.load(documents)
+    preloaded_articles = len(documents)
+
+    logger.info(f"Preloaded {preloaded_articles} articles")
+
+    return preloaded_articles
+
+
+def freeze() -> None:
+    """
+    Moves everything allocated so far into the permanent generation. The collector never traverses it, so it does not
+    write to (and so un-share) those pages in the workers.
+    """
+    gc.collect()
+    gc.freeze()
+
+    logger.info(f"Froze {gc.get_freeze_count()} objects before forking")
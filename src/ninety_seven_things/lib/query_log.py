@@ -0,0 +1,186 @@
+"""
+Mongo command monitoring: per-command timings, a slow query log and per-request query counts
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import logging
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# 3rd-Party Imports
+from pymongo import monitoring
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import metrics
+
+logger = logging.getLogger(settings.LOG_NAME)
+slow_query_logger = logging.getLogger(f"{settings.LOG_NAME}.slow_query")
+
+# Handshakes, heartbeats and authentication are not queries
+IGNORED_COMMANDS = {
+    "hello",
+    "ismaster",
+    "isMaster",
+    "ping",
+    "buildInfo",
+    "endSessions",
+    "saslStart",
+    "saslContinue",
+    "authenticate",
+    "getnonce",
+}
+
+# Command fields that describe the query; anything else (documents, update bodies, etc.) is dropped from the shape
+SHAPE_FIELDS = ("filter", "query", "pipeline", "sort", "projection")
+
+# Commands awaiting their outcome; past this the oldest are forgotten, in case an outcome is never reported
+MAX_PENDING_COMMANDS = 1000
+
+
+@dataclass
+class QueryRecord:
+    command: str
+    collection: Optional[str]
+    shape: Dict[str, Any]
+    duration_ms: float
+
+
+@dataclass
+class QueryLog:
+    """
+    The commands issued while this log is current. Logs nest, so a command is recorded by every enclosing log.
+    """
+
+    parent: Optional[QueryLog] = None
+    records: List[QueryRecord] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    def add(self, record: QueryRecord) -> None:
+        self.records.append(record)
+
+        if self.parent is not None:
+            self.parent.add(record)
+
+    def summary(self) -> str:
+        return "\n".join(f"{r.command} {r.collection} {r.shape} ({r.duration_ms:.1f}ms)" for r in self.records)
+
+
+current_query_log: ContextVar[Optional[QueryLog]] = ContextVar("current_query_log", default=None)
+
+
+def strip_values(value: Any) -> Any:
+    """
+    Replaces every literal in a query with "?", keeping field names and operators
+    """
+    if isinstance(value, dict):
+        return {key: strip_values(item) for key, item in value.items()}
+
+    if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+        return [strip_values(item) for item in value]
+
+    return "?"
+
+
+def query_shape(command: Dict[str, Any]) -> Dict[str, Any]:
+    shape = {name: strip_values(command[name]) for name in SHAPE_FIELDS if name in command}
+
+    for name in ("updates", "deletes"):
+        if command.get(name):
+            shape[name] = strip_values(command[name][0].get("q", {}))
+
+    return shape
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Times every command issued by the Motor client it is registered on
+    """
+
+    def __init__(self) -> None:
+        self.pending: OrderedDict[Tuple[int, Any], Tuple[Optional[str], Dict[str, Any]]] = OrderedDict()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in IGNORED_COMMANDS:
+            return
+
+        collection = event.command.get(event.command_name)
+
+        if not isinstance(collection, str):
+            collection = None
+
+        self.pending[(event.request_id, event.connection_id)] = (collection, query_shape(event.command))
+
+        if len(self.pending) > MAX_PENDING_COMMANDS:
+            self.pending.popitem(last=False)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self.finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self.finish(event)
+
+    def finish(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent) -> None:
+        pending = self.pending.pop((event.request_id, event.connection_id), None)
+
+        if pending is None:
+            return
+
+        collection, shape = pending
+        record = QueryRecord(
+            command=event.command_name,
+            collection=collection,
+            shape=shape,
+            duration_ms=event.duration_micros / 1000,
+        )
+
+        metrics.MONGO_COMMAND_DURATION.labels(record.command, record.collection or "").observe(
+            record.duration_ms / 1000
+        )
+
+        if record.duration_ms >= settings.MONGO_SLOW_QUERY_MS:
+            slow_query_logger.warning(
+                f"Slow {record.command} on {record.collection} took {record.duration_ms:.1f}ms: {record.shape}"
+            )
+
+        query_log = current_query_log.get()
+
+        if query_log is not None:
+            query_log.add(record)
+
+
+class QueryLogMiddleware:
+    """
+    Attributes Mongo commands to the request that issued them and flags requests that issue too many
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query_log = QueryLog(parent=current_query_log.get())
+        token = current_query_log.set(query_log)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_log.reset(token)
+
+            route = getattr(scope.get("route"), "path", metrics.UNMATCHED_ROUTE)
+            metrics.REQUEST_QUERIES.labels(scope["method"], route).observe(query_log.count)
+
+            if query_log.count > settings.MONGO_QUERY_WARNING_THRESHOLD:
+                logger.warning(f"{scope['method']} {route} issued {query_log.count} queries:\n{query_log.summary()}")
@@ -0,0 +1,72 @@
+"""
+Read-preference routing: public read-only requests are allowed to read from secondaries and write requests are pinned
+to the primary, so that the reads a write depends on are consistent with it. Other reads keep the client's own read
+preference.
+"""
+
+# Standard Library Imports
+import contextlib
+import logging
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# 3rd-Party Imports
+from pymongo.read_preferences import Primary, SecondaryPreferred, _ServerMode
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+READ_ONLY_METHODS = {"GET", "HEAD"}
+
+# None leaves the client's own read preference (MONGO_READ_PREFERENCE) in effect
+current_read_preference: ContextVar[Optional[_ServerMode]] = ContextVar("current_read_preference", default=None)
+
+
+def secondary_preferred() -> _ServerMode:
+    return SecondaryPreferred(max_staleness=settings.MONGO_SECONDARY_MAX_STALENESS_SECONDS)
+
+
+@contextlib.contextmanager
+def reading_from(read_preference: Optional[_ServerMode]) -> Iterator[None]:
+    """
+    Routes the reads made inside the block, e.g. `with reading_from(Primary()):` in a read-your-writes flow
+    """
+    token = current_read_preference.set(read_preference)
+
+    try:
+        yield
+    finally:
+        current_read_preference.reset(token)
+
+
+def route_read_preference(method: str, path: str) -> Optional[_ServerMode]:
+    if not settings.MONGO_READ_ROUTING_ENABLED:
+        return None
+
+    if method not in READ_ONLY_METHODS:
+        return Primary()
+
+    if path.startswith(tuple(settings.MONGO_SECONDARY_READ_PATHS)):
+        return secondary_preferred()
+
+    return None
+
+
+class ReadRoutingMiddleware:
+    """
+    Sets the read preference for the duration of each request from its method and path
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with reading_from(route_read_preference(scope["method"], scope["path"])):
+            await self.app(scope, receive, send)
@@ -3,16 +3,15 @@ import logging
 from typing import Optional
 
 # 3rd-Party Imports
-import redis.asyncio
 from beanie import PydanticObjectId
 from fastapi import Depends, Request, Response
 from fastapi_users import BaseUserManager, FastAPIUsers
 from fastapi_users.authentication import AuthenticationBackend, BearerTransport, RedisStrategy
 from fastapi_users_db_beanie import BeanieUserDatabase, ObjectIDIDMixin
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.core.redis import redis
 from ninety_seven_things.lib.exceptions import AuthenticationException, DoesNotExistException
 from ninety_seven_things.lib.helpers import get_base_url
 from ninety_seven_things.lib.passwords import verify_password
@@ -23,8 +22,6 @@ from ninety_seven_things.modules.user import service as user_service
 logger = logging.getLogger(settings.LOG_NAME)
 
 bearer_transport = BearerTransport(tokenUrl="api/v1/auth/login")
-# redis = redis.asyncio.from_url(str(settings.REDIS_URL), decode_responses=True)
-redis = redis.asyncio.from_url(settings.REDIS_URL, decode_responses=True)
 
 
 def get_redis_strategy() -> RedisStrategy:
@@ -56,7 +53,6 @@ class UserManager(ObjectIDIDMixin, BaseUserManager[user_models.User, PydanticObj
         response: Optional[Response] = None,
     ) -> None:
         logger.info(f"User {user.id} has logged in")
-        ic()
 
     async def on_after_update(self, user: user_models.User, token: str, request: Optional[Request] = None) -> None:
         logger.info(f"User {user.id} has been updated")
@@ -0,0 +1,42 @@
+"""
+Trusted fast-path serialization: raw Motor documents straight to JSON bytes
+
+Documents read back from our own collections were validated on the way in, so read endpoints can skip building
+Beanie documents and view models and hand the raw dicts to a cached pydantic-core serializer instead. Record types are
+TypedDicts declaring `_id` with a serialization alias of `id`; undeclared keys (e.g. hashed passwords) are never
+emitted.
+"""
+
+# Standard Library Imports
+import functools
+from typing import Any, Dict, List, Type
+
+# 3rd-Party Imports
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@functools.cache
+def get_adapter(record_type: Type) -> TypeAdapter:
+    return TypeAdapter(record_type)
+
+
+@functools.cache
+def get_list_adapter(record_type: Type) -> TypeAdapter:
+    return TypeAdapter(List[record_type])
+
+
+def dump_record(record_type: Type, document: Dict[str, Any]) -> bytes:
+    return get_adapter(record_type).dump_json(document, by_alias=True)
+
+
+def dump_records(record_type: Type, documents: List[Dict[str, Any]]) -> bytes:
+    return get_list_adapter(record_type).dump_json(documents, by_alias=True)
+
+
+class JSONBytesResponse(Response):
+    """
+    A JSON response whose body has already been serialized
+    """
+
+    media_type = "application/json"
@@ -0,0 +1,49 @@
+"""
+Single-flight request coalescing: concurrent identical calls share one in-flight execution
+"""
+
+# Standard Library Imports
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import metrics
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    The first caller for a key starts the work as a task and everyone arriving before it finishes awaits that same task,
+    receiving its result or exception. Callers are shielded from one another: one of them being cancelled (e.g. a
+    client disconnecting) does not cancel the work for the rest. Nothing is remembered once the task completes; this
+    only collapses overlapping calls, caching is left to the caller.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        task = self.in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda done: self.finish(key, done))
+        else:
+            metrics.SINGLE_FLIGHT_COALESCED.labels(self.name).inc()
+
+        return await asyncio.shield(task)
+
+    def finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+
+        # Every waiter may have been cancelled; retrieve the exception so that asyncio does not report it as unhandled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,161 @@
+"""
+A read-only, memory-mapped snapshot of pre-rendered pages, keyed by (language, index)
+
+The file is a fixed header, the page bodies back to back, then an index of where each one is:
+
+    header   magic, format version, entry count, index offset, build time
+    bodies   the bytes of every page
+    index    (kind, language, index, offset, length) per page
+
+Pages are served as memoryview slices of the mapping, so a body is never copied onto the heap, and every process that
+maps the file shares the same pages of the OS page cache.
+"""
+
+# Standard Library Imports
+import enum
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.exceptions import DoesNotExistException, SnapshotFormatException
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+MAGIC = b"97THINGS"
+VERSION = 1
+
+# magic, version, reserved, entry count, index offset, built at (unix seconds)
+HEADER = struct.Struct("<8sHHIQQ")
+
+# kind, language (ASCII, NUL padded), index, body offset, body length
+ENTRY = struct.Struct("<B8sHQI")
+
+
+class PageKind(enum.IntEnum):
+    ARTICLE = 0
+    INDEX = 1
+
+
+SnapshotKey = Tuple[PageKind, str, int]
+
+
+def write_snapshot(pages: Iterable[Tuple[SnapshotKey, bytes]], path: pathlib.Path) -> int:
+    """
+    Writes the pages to a temporary file which then replaces path, so processes that have the old snapshot mapped keep
+    reading it undisturbed. Returns the number of pages written.
+    """
+    entries = []
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    with open(temporary_path, "wb") as f:
+        f.seek(HEADER.size)
+
+        for (kind, language, index), body in pages:
+            entries.append(ENTRY.pack(kind, language.encode("ascii"), index, f.tell(), len(body)))
+            f.write(body)
+
+        index_offset = f.tell()
+        f.write(b"".join(entries))
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), index_offset, int(time.time())))
+
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temporary_path, path)
+
+    return len(entries)
+
+
+class Snapshot:
+    """
+    An open snapshot file. Lookups return memoryviews into the mapping, which stay valid until close().
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+
+        with open(path, "rb") as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.view = memoryview(self.mapping)
+
+        try:
+            self.offsets, self.built_at = self.read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def read_index(self) -> Tuple[Dict[SnapshotKey, Tuple[int, int]], int]:
+        if len(self.mapping) < HEADER.size:
+            raise SnapshotFormatException(message=f"{self.path} is too short to be a snapshot")
+
+        magic, version, _, count, index_offset, built_at = HEADER.unpack_from(self.mapping, 0)
+
+        if magic != MAGIC:
+            raise SnapshotFormatException(message=f"{self.path} is not a snapshot")
+
+        if version != VERSION:
+            raise SnapshotFormatException(message=f"{self.path} is snapshot version {version}, expected {VERSION}")
+
+        if index_offset + count * ENTRY.size > len(self.mapping):
+            raise SnapshotFormatException(message=f"{self.path} is truncated")
+
+        offsets = {}
+
+        for kind, language, index, offset, length in ENTRY.iter_unpack(
+            self.mapping[index_offset : index_offset + count * ENTRY.size]
+        ):
+            offsets[(PageKind(kind), language.rstrip(b"\0").decode("ascii"), index)] = (offset, length)
+
+        return offsets, built_at
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def get(self, kind: PageKind, language: str, index: int = 0) -> memoryview:
+        try:
+            offset, length = self.offsets[(kind, language, index)]
+        except KeyError as exc:
+            raise DoesNotExistException(
+                message=f"The snapshot has no {kind.name.lower()} page {language}/{index}"
+            ) from exc
+
+        return self.view[offset : offset + length]
+
+    def close(self) -> None:
+        self.view.release()
+        self.mapping.close()
+
+
+# The snapshot the reader serves from, opened on first use; False once opening it has failed
+reader_snapshot: Optional[Snapshot | bool] = None
+
+
+def get_reader_snapshot() -> Optional[Snapshot]:
+    """
+    The READER_SNAPSHOT_PATH snapshot, or None when none is configured or it cannot be opened, in which case the reader
+    falls back to Mongo
+    """
+    global reader_snapshot
+
+    if reader_snapshot is None:
+        reader_snapshot = False
+
+        if settings.READER_SNAPSHOT_PATH:
+            try:
+                reader_snapshot = Snapshot(pathlib.Path(settings.READER_SNAPSHOT_PATH))
+                logger.info(f"Serving the reader from {len(reader_snapshot)} snapshot pages in {reader_snapshot.path}")
+            except OSError as exc:
+                logger.warning(f"Unable to open the reader snapshot, serving the reader from mongo: {exc}")
+            except SnapshotFormatException as exc:
+                logger.warning(f"Unable to read the reader snapshot, serving the reader from mongo: {exc.message}")
+
+    return reader_snapshot or None
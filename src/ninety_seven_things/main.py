@@ -4,31 +4,40 @@ import logging
 # 3rd-Party Imports
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from fastui import prebuilt_html
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.app import app
 from ninety_seven_things.core.config import settings
-from ninety_seven_things.lib.security import auth_backend, fastapi_users
+from ninety_seven_things.lib import frontend, health, metrics
+from ninety_seven_things.lib.lazy import LazyApp
+from ninety_seven_things.lib.security import auth_backend, fastapi_users, redis
+from ninety_seven_things.modules.article import warm_up as article_warm_up
 from ninety_seven_things.modules.article.views import router as article_router
 from ninety_seven_things.modules.author.views import router as author_router
+from ninety_seven_things.modules.book.views import router as book_router
+from ninety_seven_things.modules.mail import service as mail_service
+from ninety_seven_things.modules.progress.views import router as progress_router
 from ninety_seven_things.modules.user import schemas as user_schemas
 from ninety_seven_things.modules.user.views import router as user_router
 from ninety_seven_things.modules.utilities.views import router as utilities_router
-from ninety_seven_things.ui.admin.article import router as article_admin_ui_router
-from ninety_seven_things.ui.admin.author import router as author_admin_ui_router
-from ninety_seven_things.ui.admin.main import router as main_admin_ui_router
+from ninety_seven_things.ui.reader.main import reader_html, render_pages
 from ninety_seven_things.ui.reader.main import router as main_reader_ui_router
 from ninety_seven_things.ui.index import router as index_ui_router
 
 logger = logging.getLogger(settings.LOG_NAME)
+
+if settings.METRICS_ENABLED:
+    metrics.register_process_collector(metrics.RedisPoolCollector(redis.connection_pool))
+
+# Warm-up Steps, run from the app lifespan in the order given by settings.WARMUP_STEPS
+health.register_warm_up_step("articles", article_warm_up.load_articles)
+health.register_warm_up_step("pages", render_pages)
+health.register_warm_up_step("templates", mail_service.compile_templates)
+
 logger.info("Loading routers")
 
 # User Interface Routers
-app.include_router(article_admin_ui_router, prefix="/ui/admin", include_in_schema=False)
-app.include_router(author_admin_ui_router, prefix="/ui/admin", include_in_schema=False)
-app.include_router(main_admin_ui_router, prefix="/ui/admin", include_in_schema=False)
+app.mount("/ui/admin", LazyApp("ninety_seven_things.ui.admin.app:app"), name="admin_ui")
 
 app.include_router(main_reader_ui_router, prefix="/ui/reader", include_in_schema=False)
 app.include_router(index_ui_router, prefix="/ui", include_in_schema=False)
@@ -38,6 +47,8 @@ app.include_router(utilities_router, tags=["Utilities"], prefix="/api/v1")
 app.include_router(user_router, tags=["User"], prefix="/api/v1")
 app.include_router(article_router, tags=["Article"], prefix="/api/v1")
 app.include_router(author_router, tags=["Author"], prefix="/api/v1")
+app.include_router(book_router, tags=["Book"], prefix="/api/v1")
+app.include_router(progress_router, tags=["Progress"], prefix="/api/v1")
 app.include_router(
     fastapi_users.get_auth_router(backend=auth_backend, requires_verification=True),
     prefix="/api/v1/auth",
@@ -62,6 +73,11 @@ app.include_router(
 
 # app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/data", StaticFiles(directory=f"{settings.DATA_DIR}"), name="data")
+app.mount(
+    frontend.ASSETS_URL,
+    frontend.PrecompressedStaticFiles(directory=frontend.ASSETS_DIR, check_dir=False),
+    name="fastui_assets",
+)
 
 # @app.get(path="/", include_in_schema=False)
 # async def redirect() -> RedirectResponse:
@@ -85,15 +101,16 @@ app.mount("/data", StaticFiles(directory=f"{settings.DATA_DIR}"), name="data")
 @app.get("/admin/{path:path}")
 async def admin_html_landing() -> HTMLResponse:
     """Simple HTML page which serves the React app, comes last as it matches all paths."""
-    return HTMLResponse(prebuilt_html(title="97 things Administration", api_root_url="/ui"))
+    return HTMLResponse(frontend.landing_html(title="97 things Administration", api_root_url="/ui"))
 
 
 @app.get("/reader/{path:path}")
 async def reader_html_landing() -> HTMLResponse:
     """Simple HTML page which serves the React app, comes last as it matches all paths."""
-    return HTMLResponse(prebuilt_html(title="97 Things Reader", api_root_url="/ui"))
+    return HTMLResponse(reader_html())
+
 
 @app.get("/{path:path}")
 async def index_html_landing() -> HTMLResponse:
     """Simple HTML page which serves the React app, comes last as it matches all paths."""
-    return HTMLResponse(prebuilt_html(title="97 Things", api_root_url="/ui"))
+    return HTMLResponse(frontend.landing_html(title="97 Things", api_root_url="/ui"))
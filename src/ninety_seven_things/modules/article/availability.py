@@ -0,0 +1,200 @@
+"""
+Which (language, index) articles exist, as one bitmap per language with bit i set when article i exists, so that reader
+navigation and the coverage matrix never have to query for it. It is built from the corpus when it is read in (preload,
+warm-up, seeding) and kept current by the article service's writes, which are broadcast so that every worker applies
+them.
+"""
+
+# Standard Library Imports
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 3rd-Party Imports
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.core.redis import redis
+from ninety_seven_things.lib import bitset, constants
+
+# Local Folder Imports
+from .models import Article
+from .schemas import ArticleCoverage
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+class ArticleAvailability:
+    """
+    Until it is loaded it assumes every supported language has every article, which is what navigation did before
+    """
+
+    def __init__(self) -> None:
+        every_article = (1 << (constants.LAST_ARTICLE_ID + 1)) - 1
+
+        self.bitmaps: Dict[str, int] = {language: every_article for language in constants.SUPPORTED_LANGUAGES}
+        self.loaded = False
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[Tuple[str, int]]) -> "ArticleAvailability":
+        availability = cls()
+        availability.rebuild(keys)
+
+        return availability
+
+    def rebuild(self, keys: Iterable[Tuple[str, int]]) -> None:
+        bitmaps: Dict[str, int] = defaultdict(int)
+
+        for language, index in keys:
+            bitmaps[language] |= 1 << index
+
+        self.bitmaps = dict(bitmaps)
+        self.loaded = True
+
+    def add(self, language: str, index: int) -> None:
+        self.bitmaps[language] = self.bitmaps.get(language, 0) | 1 << index
+
+    def discard(self, language: str, index: int) -> None:
+        bitmap = self.bitmaps.get(language, 0) & ~(1 << index)
+
+        if bitmap:
+            self.bitmaps[language] = bitmap
+        else:
+            self.bitmaps.pop(language, None)
+
+    def clear(self) -> None:
+        self.bitmaps = {}
+
+    def has(self, language: str, index: int) -> bool:
+        return index >= 0 and bool(self.bitmaps.get(language, 0) >> index & 1)
+
+    def languages(self) -> List[str]:
+        """
+        The supported languages first, in their usual order, then any others
+        """
+        supported = [language for language in constants.SUPPORTED_LANGUAGES if language in self.bitmaps]
+
+        return supported + sorted(self.bitmaps.keys() - set(supported))
+
+    def indexes(self, language: str) -> Iterator[int]:
+        return bitset.members(self.bitmaps.get(language, 0))
+
+    def articles(self, language: str) -> int:
+        # The README is not an article
+        return self.bitmaps.get(language, 0) & ~(1 << constants.INDEX_ID)
+
+    def previous(self, language: str, index: int) -> Optional[int]:
+        """
+        The nearest article before index in the language, skipping any gaps
+        """
+        return bitset.previous_member(self.articles(language), index)
+
+    def next(self, language: str, index: int) -> Optional[int]:
+        """
+        The nearest article after index in the language, skipping any gaps
+        """
+        return bitset.next_member(self.articles(language), index)
+
+    def random(self, language: str) -> Optional[int]:
+        return bitset.random_member(self.articles(language))
+
+    def coverage(self) -> ArticleCoverage:
+        languages = self.languages()
+        indexes = sorted(set().union(*(self.indexes(language) for language in languages)))
+
+        return ArticleCoverage(
+            languages=languages,
+            indexes=indexes,
+            matrix=[[self.has(language, index) for language in languages] for index in indexes],
+            counts={language: self.articles(language).bit_count() for language in languages},
+        )
+
+
+# This process's copy; preloaded in the gunicorn master and inherited by the workers like the article cache
+availability = ArticleAvailability()
+
+
+def load(documents: Iterable[Dict[str, Any]]) -> None:
+    availability.rebuild((document["language"], document["index"]) for document in documents)
+    logger.info(f"Article availability loaded for {len(availability.bitmaps)} languages")
+
+
+async def reload() -> None:
+    # Served by the (language, index) index alone
+    documents = (
+        await Article.get_motor_collection().find({}, {"_id": 0, "language": 1, "index": 1}).to_list(length=None)
+    )
+
+    load(documents)
+
+
+def apply_change(language: Optional[str], index: Optional[int], available: bool) -> None:
+    """
+    No language clears every language
+    """
+    if language is None:
+        availability.clear()
+    elif available:
+        availability.add(language, index)
+    else:
+        availability.discard(language, index)
+
+
+async def record_change(language: Optional[str], index: Optional[int], available: bool) -> None:
+    """
+    Applies a write to this worker's availability at once, and tells every other worker to apply it too
+    """
+    apply_change(language, index, available)
+
+    message = json.dumps({"language": language, "index": index, "available": available})
+
+    try:
+        await redis.publish(settings.ARTICLE_AVAILABILITY_CHANNEL, message)
+    except RedisError as exc:
+        logger.warning(f"Unable to publish an article availability change: {exc}")
+
+
+async def mark_available(language: str, index: int) -> None:
+    await record_change(language, index, True)
+
+
+async def mark_unavailable(language: str, index: int) -> None:
+    await record_change(language, index, False)
+
+
+async def mark_all_unavailable() -> None:
+    await record_change(None, None, False)
+
+
+async def listen_for_changes(redis: Redis) -> None:
+    """
+    Applies the changes published by every worker (this one included) to this worker's availability. Runs for the
+    life of the process; while the subscription is down changes may be missed, so it is reloaded on subscribing.
+    """
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(settings.ARTICLE_AVAILABILITY_CHANNEL)
+
+                try:
+                    await reload()
+                except PyMongoError as exc:
+                    logger.warning(f"Unable to reload article availability: {exc}")
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    try:
+                        payload = json.loads(message["data"])
+                        apply_change(payload["language"], payload["index"], payload["available"])
+                    except (ValueError, KeyError, TypeError) as exc:
+                        logger.warning(f"Ignoring malformed article availability change {message['data']!r}: {exc}")
+        except RedisError as exc:
+            logger.warning(f"Article availability subscription lost, retrying: {exc}")
+            await asyncio.sleep(settings.CACHE_INVALIDATION_RETRY_SECONDS)
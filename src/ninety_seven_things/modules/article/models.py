@@ -1,17 +1,48 @@
 # Standard Library Imports
 import logging
+from typing import Any, ClassVar, List, Optional
 
 # 3rd-Party Imports
+import pymongo
 from beanie import Document, Indexed
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.models import ReadRouted, Timestamped
 
 logger = logging.getLogger(settings.LOG_NAME)
 
 
-class Article(Document):
+class Article(Timestamped, ReadRouted, Document):
     title: Indexed(str)
     index: int
     contents: str
     language: str
+
+    class Settings:
+        indexes: ClassVar[List[Any]] = [
+            [("language", pymongo.ASCENDING), ("index", pymongo.ASCENDING)],
+        ]
+
+
+class ArticleViewCount(Document):
+    """
+    How often an article was viewed in one period: a day (its ISO date) or "all" time. Written in batches by
+    popularity.write_views, never per view.
+    """
+
+    language: str
+    index: int
+    period: str
+    views: int = 0
+    # The id of the last batch of views added, so that a batch written again after a failure is not added twice
+    batch: Optional[str] = None
+
+    class Settings:
+        indexes: ClassVar[List[Any]] = [
+            pymongo.IndexModel(
+                [("language", pymongo.ASCENDING), ("index", pymongo.ASCENDING), ("period", pymongo.ASCENDING)],
+                unique=True,
+            ),
+            [("period", pymongo.ASCENDING)],
+        ]
@@ -0,0 +1,278 @@
+"""
+Article view counting with write-behind batching. A view only increments a counter in this worker's memory; every
+ARTICLE_VIEWS_FLUSH_SECONDS each worker adds its counts to a shared redis hash with one pipelined round of HINCRBYs,
+and every ARTICLE_VIEWS_ROLLUP_SECONDS whichever worker takes the rollup lock moves that hash into mongo with a single
+bulk_write, then rebuilds each language's most-read list, which is stored in redis ready to serve. Each batch is
+tagged with an id that the counts it was added to keep, so a batch retried after a failure is never counted twice.
+"""
+
+# Standard Library Imports
+import asyncio
+import datetime
+import logging
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# 3rd-Party Imports
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from redis.exceptions import RedisError, ResponseError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.core.redis import redis
+from ninety_seven_things.lib import helpers
+
+# Local Folder Imports
+from . import service as article_service
+from .availability import availability
+from .models import ArticleViewCount
+from .schemas import PopularArticle, PopularArticles
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+ALL_TIME = "all"
+
+DUPLICATE_KEY_ERROR = 11000
+
+# Views counted by this worker since its last flush, by (language, index)
+pending_views: Counter[Tuple[str, int]] = Counter()
+
+
+def redis_key(name: str) -> str:
+    return f"{settings.ARTICLE_VIEWS_REDIS_PREFIX}:{name}"
+
+
+PENDING_KEY = redis_key("pending")
+PROCESSING_KEY = redis_key("processing")
+ROLLUP_LOCK_KEY = redis_key("rollup_lock")
+
+# The field of the processing hash holding its batch id; the others are "language:index"
+BATCH_FIELD = "batch"
+
+
+def popular_key(language: str) -> str:
+    return redis_key(f"popular:{language}")
+
+
+def record_view(language: str, index: int) -> None:
+    # Only articles that exist are counted, which also keeps the keys from growing without bound
+    if availability.has(language, index):
+        pending_views[(language, index)] += 1
+
+
+async def flush_views() -> int:
+    """
+    Adds this worker's counts to the shared pending hash; they are kept for the next flush if redis is unavailable
+    """
+    global pending_views
+
+    if not pending_views:
+        return 0
+
+    views, pending_views = pending_views, Counter()
+
+    try:
+        async with redis.pipeline(transaction=False) as pipeline:
+            for (language, index), count in views.items():
+                pipeline.hincrby(PENDING_KEY, f"{language}:{index}", count)
+
+            await pipeline.execute()
+    except RedisError as exc:
+        logger.warning(f"Unable to flush {sum(views.values())} article views to redis: {exc}")
+        pending_views.update(views)
+        return 0
+
+    return sum(views.values())
+
+
+async def write_views() -> int:
+    """
+    Moves the pending counts into mongo with one bulk write, adding them to today's and the all-time counts; returns
+    how many articles were written
+    """
+    # A batch left behind by a rollup that failed part way is written before any new one is taken
+    if not await redis.exists(PROCESSING_KEY):
+        try:
+            await redis.rename(PENDING_KEY, PROCESSING_KEY)
+        except ResponseError:
+            # Nothing is pending
+            return 0
+
+    # Only set once, so that a batch retried after a failure keeps its id
+    await redis.hsetnx(PROCESSING_KEY, BATCH_FIELD, uuid.uuid4().hex)
+
+    counts = await redis.hgetall(PROCESSING_KEY)
+    batch = counts.pop(BATCH_FIELD)
+    today = helpers.utcnow().date().isoformat()
+
+    operations = []
+
+    for field, count in counts.items():
+        language, _, index = field.rpartition(":")
+
+        for period in (today, ALL_TIME):
+            operations.append(
+                UpdateOne(
+                    # A count that already has the batch is not matched, and the upsert then collides with it
+                    {"language": language, "index": int(index), "period": period, "batch": {"$ne": batch}},
+                    {"$inc": {"views": int(count)}, "$set": {"batch": batch}},
+                    upsert=True,
+                )
+            )
+
+    if operations:
+        try:
+            await ArticleViewCount.get_motor_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            # Duplicate keys are the counts that an earlier attempt at this batch already added to
+            if exc.details.get("writeConcernErrors") or any(
+                error["code"] != DUPLICATE_KEY_ERROR for error in exc.details["writeErrors"]
+            ):
+                raise
+
+    await redis.delete(PROCESSING_KEY)
+
+    return len(counts)
+
+
+def popular_since(today: datetime.date) -> datetime.date:
+    # Today counts as one of the ARTICLE_POPULAR_DAYS
+    return today - datetime.timedelta(days=settings.ARTICLE_POPULAR_DAYS - 1)
+
+
+async def rebuild_popular() -> None:
+    """
+    Sums the daily counts of the last ARTICLE_POPULAR_DAYS days and stores each language's top articles in redis
+    """
+    today = helpers.utcnow().date()
+    since = popular_since(today)
+
+    results = await (
+        ArticleViewCount.get_motor_collection()
+        .aggregate(
+            [
+                {"$match": {"period": {"$gte": since.isoformat(), "$lte": today.isoformat()}}},
+                {"$group": {"_id": {"language": "$language", "index": "$index"}, "views": {"$sum": "$views"}}},
+                {"$sort": {"views": -1, "_id.index": 1}},
+                {"$group": {"_id": "$_id.language", "articles": {"$push": {"index": "$_id.index", "views": "$views"}}}},
+                {"$project": {"articles": {"$slice": ["$articles", settings.ARTICLE_POPULAR_COUNT]}}},
+            ]
+        )
+        .to_list(length=None)
+    )
+
+    top: Dict[str, List[Dict[str, int]]] = {language: [] for language in availability.languages()}
+    top.update({result["_id"]: result["articles"] for result in results})
+
+    keys = [(language, article["index"]) for language, articles in top.items() for article in articles]
+    titles = {
+        (document["language"], document["index"]): document["title"]
+        for document in await article_service.get_many_raw_by_index_and_language(keys)
+        if document is not None
+    }
+
+    async with redis.pipeline(transaction=False) as pipeline:
+        for language, articles in top.items():
+            popular = PopularArticles(
+                language=language,
+                since=since,
+                articles=[
+                    PopularArticle(
+                        index=article["index"], title=titles[(language, article["index"])], views=article["views"]
+                    )
+                    for article in articles
+                    # Articles deleted since they were viewed are left out
+                    if (language, article["index"]) in titles
+                ],
+            )
+            pipeline.set(popular_key(language), popular.model_dump_json())
+
+        await pipeline.execute()
+
+
+async def hold_rollup_lock(token: str, lock_seconds: int) -> None:
+    """
+    Keeps the lock from expiring under a rollup that takes longer than ARTICLE_VIEWS_ROLLUP_SECONDS
+    """
+    while True:
+        await asyncio.sleep(lock_seconds / 2)
+
+        try:
+            if await redis.get(ROLLUP_LOCK_KEY) != token:
+                return
+
+            await redis.expire(ROLLUP_LOCK_KEY, lock_seconds)
+        except RedisError as exc:
+            logger.warning(f"Unable to renew the article view rollup lock: {exc}")
+            return
+
+
+async def roll_up() -> None:
+    """
+    Done by one worker per ARTICLE_VIEWS_ROLLUP_SECONDS: the lock is renewed while the rollup runs, then never
+    released, only left to expire
+    """
+    lock_seconds = max(1, int(settings.ARTICLE_VIEWS_ROLLUP_SECONDS))
+    token = uuid.uuid4().hex
+
+    if not await redis.set(ROLLUP_LOCK_KEY, token, nx=True, ex=lock_seconds):
+        return
+
+    start = time.perf_counter()
+    renewal = asyncio.create_task(hold_rollup_lock(token, lock_seconds))
+
+    try:
+        written = await write_views()
+        await rebuild_popular()
+    finally:
+        renewal.cancel()
+
+    logger.info(f"Rolled up views of {written} articles in {time.perf_counter() - start:.2f}s")
+
+
+async def run_write_behind() -> None:
+    """
+    Flushes this worker's counts and takes its turn at the rollup, for the life of the process
+    """
+    last_rollup = time.monotonic()
+
+    while True:
+        await asyncio.sleep(settings.ARTICLE_VIEWS_FLUSH_SECONDS)
+
+        try:
+            await flush_views()
+
+            if time.monotonic() - last_rollup < settings.ARTICLE_VIEWS_ROLLUP_SECONDS:
+                continue
+
+            last_rollup = time.monotonic()
+            await roll_up()
+        except (RedisError, PyMongoError) as exc:
+            logger.warning(f"Article view rollup failed, retrying next time: {exc}")
+        except Exception:
+            # Anything else is a bug, but ending the loop would stop views being written at all
+            logger.exception("Article view write-behind failed unexpectedly, retrying next time")
+
+
+async def get_popular_json(language: str) -> str:
+    """
+    The language's most-read list exactly as the last rollup serialized it, or an empty one if there has not been one
+    """
+    try:
+        popular_json = await redis.get(popular_key(language))
+    except RedisError as exc:
+        logger.warning(f"Unable to read the popular {language} articles from redis: {exc}")
+        popular_json = None
+
+    if popular_json is None:
+        empty = PopularArticles(language=language, since=popular_since(helpers.utcnow().date()), articles=[])
+        popular_json = empty.model_dump_json()
+
+    return popular_json
+
+
+async def get_popular(language: str) -> PopularArticles:
+    return PopularArticles.model_validate_json(await get_popular_json(language))
@@ -1,10 +1,12 @@
 # Standard Library Imports
+import datetime
 import logging
-from typing import Optional
+from typing import Annotated, Dict, List, Optional
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
+from typing_extensions import TypedDict
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
@@ -25,12 +27,105 @@ class AbridgedArticleView(schemas.Entity):
     id: PydanticObjectId
     title: str
     index: int
+    language: str
+
+
+class PartialArticleView(schemas.Entity):
+    """
+    A sparse fieldset of an article; only the requested fields are set
+    """
+
+    id: Optional[PydanticObjectId] = Field(default=None, validation_alias=AliasChoices("id", "_id"))
+    title: Optional[str] = None
+    index: Optional[int] = None
+    contents: Optional[str] = None
+    language: Optional[str] = None
 
 
 class AbridgedArticleProjection(BaseModel):
-    _id: PydanticObjectId
+    id: PydanticObjectId = Field(validation_alias="_id")
     title: str
     index: int
+    language: str
+
+
+class ArticleTableRow(BaseModel):
+    """
+    Just the columns shown in the admin article table
+    """
+
+    id: PydanticObjectId = Field(validation_alias="_id")
+    index: int
+    title: str
+    language: str
+
+
+class ArticleTablePage(BaseModel):
+    articles: List[ArticleTableRow]
+    total: int
+
+
+class FullArticleRecord(TypedDict):
+    """
+    A raw article document as serialized by the trusted fast path
+    """
+
+    _id: Annotated[PydanticObjectId, Field(serialization_alias="id")]
+    title: str
+    index: int
+    contents: str
+    language: str
+
+
+class ArticleBatchItem(TypedDict):
+    """
+    A requested id or (language, index) key and the article it resolved to, or None if there is no such article
+    """
+
+    key: str
+    article: Optional[FullArticleRecord]
+
+
+class AbridgedArticleRecord(TypedDict):
+    _id: Annotated[PydanticObjectId, Field(serialization_alias="id")]
+    title: str
+    index: int
+    language: str
+
+
+class PartialArticleRecord(TypedDict, total=False):
+    _id: Annotated[PydanticObjectId, Field(serialization_alias="id")]
+    title: str
+    index: int
+    contents: str
+    language: str
+
+
+class ArticleCoverage(schemas.Entity):
+    """
+    Which articles exist in which languages: matrix[i][j] is whether article indexes[i] exists in languages[j]
+    """
+
+    languages: List[str]
+    indexes: List[int]
+    matrix: List[List[bool]]
+    counts: Dict[str, int]  # articles in each language, not counting its README
+
+
+class PopularArticle(schemas.Entity):
+    index: int
+    title: str
+    views: int
+
+
+class PopularArticles(schemas.Entity):
+    """
+    A language's most viewed articles since the given day, as of the last view rollup
+    """
+
+    language: str
+    since: datetime.date
+    articles: List[PopularArticle]
 
 
 class ArticleCreate(schemas.Entity):
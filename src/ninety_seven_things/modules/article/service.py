@@ -1,47 +1,125 @@
 # Standard Library Imports
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
 from pydantic import ValidationError
+from pymongo.read_preferences import Primary
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.core.redis import redis
+from ninety_seven_things.lib import enums, helpers
+from ninety_seven_things.lib.cache import TieredCache
 from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.loader import LinkSelection, fetch_selected_links, use_lookup
+from ninety_seven_things.lib.single_flight import SingleFlight
 
 # Local Folder Imports
+from . import availability
 from .exceptions import ArticleDoesNotExistException, ArticleException, ArticleValidationException
 from .models import Article
-from .schemas import AbridgedArticleProjection, ArticleCreate, ArticleUpdate
+from .schemas import AbridgedArticleProjection, ArticleCreate, ArticleTablePage, ArticleTableRow, ArticleUpdate
 
 logger = logging.getLogger(settings.LOG_NAME)
 
+# Raw article documents, each held under both its id key and its natural key
+article_cache = TieredCache(
+    name="article", redis=redis, max_size=settings.ARTICLE_CACHE_SIZE, ttl=settings.ARTICLE_CACHE_TTL
+)
 
-async def get_by_index_and_language(index: int, language: str) -> Article:
-    article = await Article.find_one(Article.index == index, Article.language == language)
+# Concurrent identical read lookups share one query; the documents they return are shared too, so must not be modified
+article_flight = SingleFlight(name="article")
 
-    if article is None:
-        raise DoesNotExistException(message=f"An article with index {index} and language {language} does not exist")
 
-    return article
+def id_cache_key(article_id: PydanticObjectId) -> str:
+    return f"id:{article_id}"
+
+
+def natural_cache_key(language: str, index: int) -> str:
+    return f"key:{language}:{index}"
+
+
+def cache_entries(documents: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    entries = {}
+
+    for document in documents:
+        entries[id_cache_key(document["_id"])] = document
+        entries[natural_cache_key(document["language"], document["index"])] = document
+
+    return entries
+
+
+async def cache_documents(documents: Sequence[Dict[str, Any]], generation: Optional[str]) -> None:
+    """
+    generation is the article cache's, read before the documents were
+    """
+    if documents:
+        await article_cache.set_many(cache_entries(documents), generation)
+
+
+def prime_cache(documents: Sequence[Dict[str, Any]], generation: Optional[str]) -> None:
+    article_cache.prime(cache_entries(documents), generation)
+
+
+def cache_fill_collection() -> AsyncIOMotorCollection:
+    """
+    Reads that fill the cache always go to the primary: a document read from a lagging secondary could be cached after
+    the invalidation published by its write, and would then outlive it
+    """
+    return Article.get_motor_collection().with_options(read_preference=Primary())
+
+
+async def find_and_cache(query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Only the first of concurrent identical lookups runs this, so the generation is read here rather than by each caller
+    """
+    generation = await article_cache.generation()
+    document = await cache_fill_collection().find_one(query)
+
+    if document is not None:
+        await cache_documents([document], generation)
+
+    return document
+
+
+async def find_many_and_cache(query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    generation = await article_cache.generation()
+    documents = await cache_fill_collection().find(query).to_list(length=None)
+    await cache_documents(documents, generation)
+
+    return documents
 
 
-async def get_by_id(article_id: PydanticObjectId, fetch_links: bool = False) -> Article:
-    article = await Article.find_one(Article.id == article_id, fetch_links=fetch_links)
+async def evict(article: Article) -> None:
+    await article_cache.delete(id_cache_key(article.id), natural_cache_key(article.language, article.index))
+
+
+async def clear_cache() -> None:
+    await article_cache.clear()
+
+
+async def get_by_index_and_language(index: int, language: str) -> Article:
+    return Article.model_validate(await get_raw_by_index_and_language(index=index, language=language))
+
+
+async def get_by_id(article_id: PydanticObjectId, fetch_links: LinkSelection = False) -> Article:
+    article = await Article.find_one(Article.id == article_id, fetch_links=use_lookup(Article, fetch_links))
 
     if article is None:
         raise DoesNotExistException(message=f"An article with id {article_id} does not exist")
 
+    await fetch_selected_links(Article, [article], fetch_links)
+
     return article
 
 
 async def get_by_language(language: str) -> List[AbridgedArticleProjection]:
-    articles = (
-        await Article.find(Article.language == language)
-        .sort(+Article.index)
-        .project(AbridgedArticleProjection)
-        .to_list()
+    articles = await article_flight.do(
+        ("language", language),
+        Article.find(Article.language == language).sort(+Article.index).project(AbridgedArticleProjection).to_list,
     )
 
     if articles is []:
@@ -50,13 +128,13 @@ async def get_by_language(language: str) -> List[AbridgedArticleProjection]:
     return articles
 
 
-async def get_all(fetch_links: bool = False, skip: int = 0, limit: int = 100) -> List[Article]:
+async def get_all(fetch_links: LinkSelection = False, skip: int = 0, limit: int = 100) -> List[Article]:
     """ "
     Retrieve many articles
     """
     try:
-        return (
-            await Article.find_all(fetch_links=fetch_links)
+        articles = (
+            await Article.find_all(fetch_links=use_lookup(Article, fetch_links))
             .sort(+Article.index, +Article.language)
             .skip(skip)
             .limit(limit)
@@ -65,6 +143,165 @@ async def get_all(fetch_links: bool = False, skip: int = 0, limit: int = 100) ->
     except ValidationError as exc:
         raise ArticleValidationException(message=f"{str(exc)}") from exc
 
+    await fetch_selected_links(Article, articles, fetch_links)
+
+    return articles
+
+
+ABRIDGED_PROJECTION = {"_id": 1, "title": 1, "index": 1, "language": 1}
+
+
+def sparse_projection(fields: Sequence[str]) -> Dict[str, int]:
+    projection = {"_id" if field == "id" else field: 1 for field in fields}
+
+    if "id" not in fields:
+        projection["_id"] = 0
+
+    return projection
+
+
+async def get_raw_by_id(article_id: PydanticObjectId) -> Dict[str, Any]:
+    """
+    Retrieve an article as the raw Mongo document, for the trusted serialization path
+    """
+    document = await article_cache.get(id_cache_key(article_id))
+
+    if document is None:
+        document = await article_flight.do(("raw_id", article_id), find_and_cache, {"_id": article_id})
+
+        if document is None:
+            raise DoesNotExistException(message=f"An article with id {article_id} does not exist")
+
+    return document
+
+
+async def get_raw_by_index_and_language(index: int, language: str) -> Dict[str, Any]:
+    """
+    Retrieve an article by (language, index) as the raw Mongo document, through the article cache
+    """
+    document = await article_cache.get(natural_cache_key(language, index))
+
+    if document is None:
+        document = await article_flight.do(
+            ("raw_index_and_language", index, language),
+            find_and_cache,
+            {"language": language, "index": index},
+        )
+
+        if document is None:
+            raise DoesNotExistException(message=f"An article with index {index} and language {language} does not exist")
+
+    return document
+
+
+async def get_many_raw_by_id(article_ids: Sequence[PydanticObjectId]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Retrieve articles as raw Mongo documents in the order requested, with None for any that do not exist. Cached
+    documents are used where possible and the rest are fetched with a single $in query.
+    """
+    cached = await article_cache.get_many(id_cache_key(article_id) for article_id in article_ids)
+    documents = {article_id: cached.get(id_cache_key(article_id)) for article_id in article_ids}
+    missing = [article_id for article_id, document in documents.items() if document is None]
+
+    if missing:
+        found = await find_many_and_cache({"_id": {"$in": missing}})
+
+        for document in found:
+            documents[document["_id"]] = document
+
+    return [documents[article_id] for article_id in article_ids]
+
+
+async def get_many_raw_by_index_and_language(keys: Sequence[Tuple[str, int]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Retrieve articles by (language, index) as raw Mongo documents in the order requested, with None for any that do
+    not exist. Cached documents are used where possible and the rest are fetched with a single query.
+    """
+    cached = await article_cache.get_many(natural_cache_key(*key) for key in keys)
+    documents = {key: cached.get(natural_cache_key(*key)) for key in keys}
+    missing = [key for key, document in documents.items() if document is None]
+
+    if missing:
+        # An $or of equality pairs, each of which is served by the (language, index) index
+        query = {"$or": [{"language": language, "index": index} for language, index in missing]}
+        found = await find_many_and_cache(query)
+
+        for document in found:
+            documents[(document["language"], document["index"])] = document
+
+    return [documents[key] for key in keys]
+
+
+async def get_all_raw(
+    skip: int = 0, limit: int = 100, projection: Optional[Dict[str, int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve many articles as raw Mongo documents, for the trusted serialization path
+    """
+    return (
+        await Article.get_motor_collection()
+        .find({}, projection)
+        .sort([("index", 1), ("language", 1)])
+        .skip(skip)
+        .limit(limit)
+        .to_list(length=None)
+    )
+
+
+async def get_language_summary(language: str) -> Optional[Dict[str, Any]]:
+    """
+    How many articles a language has, when they last changed and the newest id, computed by mongo without sending any
+    articles; None if it has none
+    """
+    summaries = (
+        await Article.get_motor_collection()
+        .aggregate(
+            [
+                {"$match": {"language": language}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "count": {"$sum": 1},
+                        "modified": {"$max": "$updated_at"},
+                        "last_id": {"$max": "$_id"},
+                    }
+                },
+                {"$project": {"_id": 0}},
+            ]
+        )
+        .to_list(length=None)
+    )
+
+    return summaries[0] if summaries and summaries[0]["count"] else None
+
+
+async def get_all_raw_by_language(language: str) -> List[Dict[str, Any]]:
+    """
+    Every article in a language, contents included, as raw Mongo documents in index order
+    """
+    return await Article.get_motor_collection().find({"language": language}).sort("index", 1).to_list(length=None)
+
+
+async def get_table_page(
+    language: Optional[str] = None,
+    sort: enums.ArticleSort = enums.ArticleSort.INDEX,
+    skip: int = 0,
+    limit: int = 50,
+) -> ArticleTablePage:
+    """
+    One page of articles, projected down to the columns the admin table displays
+    """
+    query = Article.find(Article.language == language) if language else Article.find_all()
+
+    total = await query.count()
+
+    # Tie-break on the remaining natural keys so that paging is stable
+    sort_keys = [f"{sort.direction}{sort.field}", *(f"+{key}" for key in ("index", "language") if key != sort.field)]
+
+    articles = await query.sort(*sort_keys).skip(skip).limit(limit).project(ArticleTableRow).to_list()
+
+    return ArticleTablePage(articles=articles, total=total)
+
 
 async def create(article_in: ArticleCreate) -> Article:
     """
@@ -74,6 +311,8 @@ async def create(article_in: ArticleCreate) -> Article:
     created_article = Article(**article_in.model_dump())
     await created_article.save()
 
+    await availability.mark_available(created_article.language, created_article.index)
+
     return created_article
 
 
@@ -84,17 +323,44 @@ async def update(article: Article, updated_article_in: ArticleUpdate) -> Article
 
     updated_article_data = updated_article_in.model_dump(exclude_unset=True)
 
+    previous_key = (article.language, article.index)
+
     for key, value in updated_article_data.items():
         setattr(article, key, value)
 
+    article.updated_at = helpers.utcnow()
+
     await article.save()
 
+    # Only after the save, so that the generation it bumps refuses any fill that read the article before it; the
+    # natural key may have changed, so the entry under the previous one goes too
+    await article_cache.delete(
+        id_cache_key(article.id),
+        natural_cache_key(*previous_key),
+        natural_cache_key(article.language, article.index),
+    )
+
+    if (article.language, article.index) != previous_key:
+        await release_key(*previous_key)
+        await availability.mark_available(article.language, article.index)
+
     return article
 
 
+async def release_key(language: str, index: int) -> None:
+    """
+    Marks the (language, index) unavailable once no article has it; nothing stops two articles sharing one
+    """
+    if await cache_fill_collection().find_one({"language": language, "index": index}, {"_id": 1}) is None:
+        await availability.mark_unavailable(language, index)
+
+
 async def delete_one(article: Article) -> None:
     await article.delete()
 
+    await evict(article)
+    await release_key(article.language, article.index)
+
     return
 
 
@@ -108,4 +374,8 @@ async def delete_by_id(article_id: PydanticObjectId) -> None:
 
 async def delete_all() -> None:
     await Article.delete_all()
+
+    await clear_cache()
+    await availability.mark_all_unavailable()
+
     return
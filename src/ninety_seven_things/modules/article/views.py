@@ -1,19 +1,24 @@
 # Standard Library Imports
 import logging
-from typing import List
+from typing import List, Optional, Tuple
 
 # 3rd-Party Imports
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from pydantic import ValidationError
+from beanie import PydanticObjectId
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
-from ninety_seven_things.lib import exceptions, security
+from ninety_seven_things.lib import enums, security
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.http_cache import conditional_response
+from ninety_seven_things.lib.serialization import dump_record, dump_records
 from ninety_seven_things.modules.user import models as user_models
 
 # Local Folder Imports
+from .availability import availability
 from .dependencies import ArticleDependency
 from .exceptions import ArticleException
+from .popularity import get_popular_json
 from .role import (
     allow_create_article,
     allow_delete_all_article,
@@ -21,8 +26,31 @@ from .role import (
     allow_list_article,
     allow_update_article,
 )
-from .schemas import ArticleCreate, ArticleUpdate, FullArticleView
-from .service import create, delete_all, delete_one, get_all, update
+from .schemas import (
+    AbridgedArticleRecord,
+    AbridgedArticleView,
+    ArticleBatchItem,
+    ArticleCoverage,
+    ArticleCreate,
+    ArticleUpdate,
+    FullArticleRecord,
+    FullArticleView,
+    PartialArticleRecord,
+    PartialArticleView,
+    PopularArticles,
+)
+from .service import (
+    ABRIDGED_PROJECTION,
+    create,
+    delete_all,
+    delete_one,
+    get_all_raw,
+    get_many_raw_by_id,
+    get_many_raw_by_index_and_language,
+    get_raw_by_id,
+    sparse_projection,
+    update,
+)
 
 router = APIRouter()
 logger = logging.getLogger(settings.LOG_NAME)
@@ -54,15 +82,116 @@ async def create_article(
     summary="Retrieve all Articles",
 )
 async def read_all_articles(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-) -> List[FullArticleView]:
-    try:
-        articles = await get_all(fetch_links=True, skip=skip, limit=limit)
-    except ValidationError as exc:
-        raise exceptions.DataIntegrityException(source_exception=exc) from exc
+    view: enums.ArticleView = enums.ArticleView.FULL,
+    fields: Optional[str] = None,
+) -> List[FullArticleView | AbridgedArticleView | PartialArticleView]:
+    """
+    `view=abridged` leaves out the contents; `fields` is a comma-separated list of the fields to return and takes
+    precedence over `view`. Responses carry an ETag and Last-Modified and are answered with a 304 when unchanged.
+    """
+    if fields:
+        requested_fields = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown_fields = set(requested_fields) - set(FullArticleView.model_fields)
+
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown_fields))}",
+            )
+
+        documents = await get_all_raw(skip=skip, limit=limit, projection=sparse_projection(requested_fields))
+        return conditional_response(request, dump_records(PartialArticleRecord, documents))
+
+    if view == enums.ArticleView.ABRIDGED:
+        documents = await get_all_raw(skip=skip, limit=limit, projection=ABRIDGED_PROJECTION)
+        return conditional_response(request, dump_records(AbridgedArticleRecord, documents))
+
+    documents = await get_all_raw(skip=skip, limit=limit)
+
+    return conditional_response(request, dump_records(FullArticleRecord, documents))
+
+
+def parse_article_key(key: str) -> Tuple[str, int]:
+    language, _, index = key.rpartition(":")
 
-    return [FullArticleView(**article.dict()) for article in articles]
+    if not language or not index.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid article key {key}, expected <language>:<index>",
+        )
+
+    return language, int(index)
+
+
+@router.get(
+    path="/article/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Retrieve many Articles by id or key",
+)
+async def read_many_articles(
+    request: Request,
+    ids: list[PydanticObjectId] | None = Query(default=None),
+    keys: list[str] | None = Query(default=None),
+) -> List[ArticleBatchItem]:
+    """
+    Either `ids` or `keys` (`<language>:<index>`, e.g. `en:12`) may be repeated up to BATCH_MAX_ITEMS times. Results
+    are returned in the order requested, with `article` set to null for anything that does not exist.
+    """
+    if (ids is None) == (keys is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="One and only one of ids or keys can be specified",
+        )
+
+    requested = ids or keys
+
+    if len(requested) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_ITEMS} articles can be requested at once",
+        )
+
+    if ids is not None:
+        documents = await get_many_raw_by_id(article_ids=ids)
+    else:
+        documents = await get_many_raw_by_index_and_language(keys=[parse_article_key(key) for key in keys])
+
+    items = [{"key": str(key), "article": document} for key, document in zip(requested, documents, strict=True)]
+
+    return conditional_response(request, dump_records(ArticleBatchItem, items))
+
+
+@router.get(
+    path="/article/coverage",
+    status_code=status.HTTP_200_OK,
+    summary="Which articles exist in which languages",
+)
+async def read_article_coverage(request: Request) -> ArticleCoverage:
+    """
+    Served from the availability bitmaps every worker keeps in memory, without querying the database
+    """
+    if not availability.loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Article availability has not been loaded yet",
+        )
+
+    return conditional_response(request, availability.coverage().model_dump_json().encode())
+
+
+@router.get(
+    path="/article/popular",
+    status_code=status.HTTP_200_OK,
+    summary="The most read articles of the last week",
+)
+async def read_popular_articles(request: Request, language: str = "en") -> PopularArticles:
+    """
+    Precomputed by the periodic view rollup and served as stored; the list is empty until the first rollup has run
+    """
+    return conditional_response(request, (await get_popular_json(language)).encode())
 
 
 @router.get(
@@ -71,9 +200,15 @@ async def read_all_articles(
     summary="Retrieve one Article",
 )
 async def read_one_article(
-    article: ArticleDependency,
+    request: Request,
+    article_id: PydanticObjectId,
 ) -> FullArticleView:
-    return FullArticleView(**article.model_dump())
+    try:
+        document = await get_raw_by_id(article_id=article_id)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+    return conditional_response(request, dump_record(FullArticleRecord, document), document)
 
 
 @router.patch(
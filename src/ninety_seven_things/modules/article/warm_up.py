@@ -0,0 +1,25 @@
+# Standard Library Imports
+import logging
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import preload
+
+# Local Folder Imports
+from . import availability
+from . import service as article_service
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+async def load_articles() -> None:
+    """
+    Fills the article cache and availability from mongo, unless this worker inherited them from the preloaded master
+    """
+    if preload.preloaded_articles:
+        logger.info(f"Warm-up using the {preload.preloaded_articles} articles preloaded before forking")
+        return
+
+    documents = await article_service.find_many_and_cache({})
+    availability.load(documents)
+    logger.info(f"Warm-up cached {len(documents)} articles")
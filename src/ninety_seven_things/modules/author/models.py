@@ -7,11 +7,12 @@ from pydantic import computed_field
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.models import ReadRouted
 
 logger = logging.getLogger(settings.LOG_NAME)
 
 
-class Author(Document):
+class Author(ReadRouted, Document):
     given_name: str
     family_name: str
     url: str
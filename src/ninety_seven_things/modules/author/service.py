@@ -9,6 +9,7 @@ from pydantic import ValidationError
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
 from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.loader import LinkSelection, fetch_selected_links, use_lookup
 
 # Local Folder Imports
 from .exceptions import AuthorDoesNotExistException, AuthorException
@@ -18,33 +19,47 @@ from .schemas import AuthorCreate, AuthorUpdate
 logger = logging.getLogger(settings.LOG_NAME)
 
 
-async def get_by_name(name: str, fetch_links: bool = False) -> Author:
-    author = await Author.find_one(Author.name == name, fetch_links=fetch_links)
+async def get_by_name(name: str, fetch_links: LinkSelection = False) -> Author:
+    author = await Author.find_one(Author.name == name, fetch_links=use_lookup(Author, fetch_links))
 
     if author is None:
         raise AuthorDoesNotExistException(message=f"An author with the name {name} does not exist")
 
+    await fetch_selected_links(Author, [author], fetch_links)
+
     return author
 
 
-async def get_by_id(author_id: PydanticObjectId, fetch_links: bool = False) -> Author:
-    author = await Author.find_one(Author.id == author_id, fetch_links=fetch_links)
+async def get_by_id(author_id: PydanticObjectId, fetch_links: LinkSelection = False) -> Author:
+    author = await Author.find_one(Author.id == author_id, fetch_links=use_lookup(Author, fetch_links))
 
     if author is None:
         raise DoesNotExistException(message=f"An author with id {author_id} does not exist")
 
+    await fetch_selected_links(Author, [author], fetch_links)
+
     return author
 
 
-async def get_many(fetch_links: bool = False, skip: int = 0, limit: int = 100) -> List[Author]:
+async def get_many(fetch_links: LinkSelection = False, skip: int = 0, limit: int = 100) -> List[Author]:
     """ "
     Retrieve many authors
     """
     try:
-        return await Author.find_all(fetch_links=fetch_links).sort(+Author.name).skip(skip).limit(limit).to_list()
+        authors = (
+            await Author.find_all(fetch_links=use_lookup(Author, fetch_links))
+            .sort(+Author.name)
+            .skip(skip)
+            .limit(limit)
+            .to_list()
+        )
     except ValidationError as exc:
         raise AuthorException(message=f"{str(exc)}") from exc
 
+    await fetch_selected_links(Author, authors, fetch_links)
+
+    return authors
+
 
 async def create(author_in: AuthorCreate) -> Author:
     """
@@ -0,0 +1,35 @@
+"""
+Chapter rendering, run in worker processes; kept free of application imports so that starting a worker stays cheap
+"""
+
+# Standard Library Imports
+from html import escape
+
+# 3rd-Party Imports
+import lxml.html
+import markdown
+from lxml import etree
+
+# Elements that never have content; every other empty element keeps its end tag, which HTML needs
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+def render_chapter(contents: str) -> str:
+    """
+    An article's Markdown as well-formed XHTML, which is also valid HTML5. Markdown passes raw HTML through untouched
+    (e.g. <br>), so its output is parsed as HTML and serialized again as XML.
+    """
+    html = markdown.markdown(contents, output_format="xhtml", extensions=["fenced_code", "tables"])
+
+    if not html.strip():
+        return ""
+
+    root = lxml.html.fragment_fromstring(html, create_parent="div")
+
+    for element in root.iter(etree.Element):
+        if element.tag not in VOID_ELEMENTS and element.text is None and not len(element):
+            element.text = ""
+
+    return escape(root.text or "", quote=False) + "".join(
+        etree.tostring(child, method="xml", encoding="unicode") for child in root
+    )
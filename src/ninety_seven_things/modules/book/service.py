@@ -0,0 +1,212 @@
+"""
+Each language edition as a downloadable book, in EPUB and single-page HTML. Books are built into DATA_DIR/books under
+names that include a hash of the language's article count, last update and newest id, so one is only ever built once
+and is served by the /data mount.
+"""
+
+# Standard Library Imports
+import asyncio
+import datetime
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Sequence
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import constants
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.single_flight import SingleFlight
+from ninety_seven_things.modules.article import service as article_service
+from ninety_seven_things.modules.article.availability import availability
+
+if TYPE_CHECKING:
+    # 3rd-Party Imports
+    from jinja2 import Environment
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+BookFormat = Literal["epub", "html"]
+BOOK_FORMATS: Sequence[BookFormat] = ("epub", "html")
+
+# Part of every book's hash; bump it when the templates or the rendering change so that existing books are rebuilt
+BOOK_LAYOUT_VERSION = 2
+
+BOOKS_DIR = pathlib.Path(settings.DATA_DIR) / "books"
+BOOKS_URL = "/data/books"
+BOOK_NAME = re.compile(r"97-things-(?P<language>.+)-(?P<digest>[0-9a-f]{16})\.(?P<format>epub|html)")
+
+# Concurrent downloads of a book that has not been built yet share one build
+book_flight = SingleFlight(name="book")
+
+
+@functools.cache
+def get_jinja_env() -> "Environment":
+    # 3rd-Party Imports
+    # Imported on first use, like markdown in render_chapters, so that only processes that build books load them
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    return Environment(
+        loader=PackageLoader("ninety_seven_things", "templates/book"),
+        autoescape=select_autoescape(["html", "xhtml", "xml", "opf"]),
+    )
+
+
+def corpus_hash(count: int, modified: Optional[datetime.datetime], last_id: Any) -> str:
+    """
+    Changes whenever an article in the language is created, updated or deleted, as the services set updated_at on
+    every write
+    """
+    version = [BOOK_LAYOUT_VERSION, count, modified.isoformat() if modified else None, str(last_id)]
+
+    return hashlib.sha256(json.dumps(version).encode()).hexdigest()[:16]
+
+
+def documents_hash(documents: Sequence[Dict[str, Any]]) -> str:
+    """
+    The corpus_hash of articles already in hand, matching the one get_language_summary gives for them
+    """
+    modified = [document["updated_at"] for document in documents if document.get("updated_at") is not None]
+
+    return corpus_hash(len(documents), max(modified, default=None), max(document["_id"] for document in documents))
+
+
+def book_name(language: str, digest: str, book_format: BookFormat) -> str:
+    return f"97-things-{language}-{digest}.{book_format}"
+
+
+def chapter_heading(document: Dict[str, Any]) -> str:
+    if document["index"] == constants.INDEX_ID:
+        return document["title"]
+
+    return f"{document['index']}. {document['title']}"
+
+
+async def render_chapters(documents: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Renders every chapter in parallel, in freshly spawned processes rather than forks of this one and its threads
+    """
+    # Local Folder Imports
+    from .render import render_chapter
+
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+        bodies = await asyncio.gather(
+            *(loop.run_in_executor(pool, render_chapter, document["contents"]) for document in documents)
+        )
+
+    return [
+        {
+            "id": f"chapter-{document['index']:03}",
+            "heading": chapter_heading(document),
+            "body": body,
+        }
+        for document, body in zip(documents, bodies, strict=True)
+    ]
+
+
+def write_atomically(path: pathlib.Path, write: Any) -> None:
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    write(temporary_path)
+    os.replace(temporary_path, path)
+
+
+def write_html(path: pathlib.Path, context: Dict[str, Any]) -> None:
+    html = get_jinja_env().get_template("book.html").render(context)
+    write_atomically(path, lambda temporary_path: temporary_path.write_text(html, encoding="utf-8"))
+
+
+def write_epub(path: pathlib.Path, context: Dict[str, Any]) -> None:
+    jinja_env = get_jinja_env()
+
+    def write(temporary_path: pathlib.Path) -> None:
+        with zipfile.ZipFile(temporary_path, "w", compression=zipfile.ZIP_DEFLATED) as epub:
+            # Must come first, and uncompressed, for readers to recognise the file
+            epub.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+            epub.writestr("META-INF/container.xml", jinja_env.get_template("container.xml").render(context))
+            epub.writestr("OEBPS/content.opf", jinja_env.get_template("content.opf").render(context))
+            epub.writestr("OEBPS/nav.xhtml", jinja_env.get_template("nav.xhtml").render(context))
+
+            chapter_template = jinja_env.get_template("chapter.xhtml")
+
+            for chapter in context["chapters"]:
+                epub.writestr(f"OEBPS/{chapter['id']}.xhtml", chapter_template.render(context, chapter=chapter))
+
+    write_atomically(path, write)
+
+
+def remove_stale_books(language: str, digest: str) -> None:
+    for path in BOOKS_DIR.iterdir():
+        # Matched exactly, so that one language's books never match another's whose code it prefixes
+        match = BOOK_NAME.fullmatch(path.name)
+
+        if match and match["language"] == language and match["digest"] != digest:
+            path.unlink(missing_ok=True)
+
+
+async def build_books(language: str, documents: Sequence[Dict[str, Any]], digest: str) -> None:
+    """
+    Builds the book in every format from a language's articles, in index order
+    """
+    BOOKS_DIR.mkdir(parents=True, exist_ok=True)
+
+    context = {
+        "title": settings.PROJECT_NAME,
+        "language": language,
+        "digest": digest,
+        "modified": datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "chapters": await render_chapters(documents),
+    }
+
+    write_epub(BOOKS_DIR / book_name(language, digest, "epub"), context)
+    write_html(BOOKS_DIR / book_name(language, digest, "html"), context)
+
+    remove_stale_books(language, digest)
+
+    logger.info(f"Built the {language} book {digest} from {len(documents)} articles")
+
+
+def books_exist(language: str, digest: str) -> bool:
+    return all((BOOKS_DIR / book_name(language, digest, book_format)).exists() for book_format in BOOK_FORMATS)
+
+
+async def ensure_books(language: str, documents: Sequence[Dict[str, Any]]) -> str:
+    """
+    Builds the books for these articles unless they already exist; returns their hash
+    """
+    digest = documents_hash(documents)
+
+    if not books_exist(language, digest):
+        await book_flight.do((language, digest), build_books, language, documents, digest)
+
+    return digest
+
+
+async def build_language_books(language: str, digest: str) -> None:
+    await build_books(language, await article_service.get_all_raw_by_language(language), digest)
+
+
+async def get_book_url(language: str, book_format: BookFormat) -> str:
+    """
+    The /data URL of the book for the language's current articles, building it first if need be. The articles
+    themselves are only read when a book has to be built.
+    """
+    summary = await article_service.get_language_summary(language) if language in availability.languages() else None
+
+    if summary is None:
+        raise DoesNotExistException(message=f"There are no articles in language {language}")
+
+    digest = corpus_hash(**summary)
+
+    if not books_exist(language, digest):
+        await book_flight.do((language, digest), build_language_books, language, digest)
+
+    return f"{BOOKS_URL}/{book_name(language, digest, book_format)}"
@@ -0,0 +1,38 @@
+# Standard Library Imports
+import logging
+from typing import Annotated
+
+# 3rd-Party Imports
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import RedirectResponse
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+
+# Local Folder Imports
+from .service import BookFormat, get_book_url
+
+router = APIRouter()
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+@router.get(
+    path="/book/{language}",
+    status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+    summary="Download a language edition as a book",
+    response_class=RedirectResponse,
+)
+async def download_book(
+    language: str, book_format: Annotated[BookFormat, Query(alias="format")] = "epub"
+) -> RedirectResponse:
+    """
+    Redirects to the book under /data, which is built on the first request after the articles change and is then a
+    plain static file
+    """
+    try:
+        url = await get_book_url(language=language, book_format=book_format)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+    return RedirectResponse(url=url)
@@ -6,6 +6,7 @@ import logging
 import pathlib
 from datetime import UTC, datetime
 from dataclasses import dataclass
+from typing import Iterator
 
 # 3rd-Party Imports
 from git import Repo
@@ -13,6 +14,7 @@ from git import Repo
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
 from ninety_seven_things.lib import constants
+from ninety_seven_things.modules.article.schemas import ArticleCreate
 
 # Local Folder Imports
 # from .exceptions import CloneRepoException
@@ -34,3 +36,20 @@ class Git:
         logger.info(f"Cloning {self.repo_url} to {self.local_dir}")
         Repo.clone_from(settings.SOURCE_REPO_URL, self.local_dir)
         logger.info(f"Cloning completed successfully")
+
+    def articles(self) -> Iterator[ArticleCreate]:
+        """
+        Every article in the checkout: each language's README as article 0, then its things in order
+        """
+        for language in constants.SUPPORTED_LANGUAGES:
+            with open(self.local_dir / language / "README.md") as f:
+                yield ArticleCreate(title="README", index=0, contents=f.read(), language=language)
+
+            for i in range(constants.FIRST_ARTICLE_ID, constants.LAST_ARTICLE_ID + 1):
+                with open(self.local_dir / language / f"thing_{i:02}" / "README.md") as f:
+                    raw_article_data = f.read()
+
+                _, _, title = raw_article_data.split("\n")[0].partition(" ")
+                contents = "\n".join(raw_article_data.split("\n")[2:])
+
+                yield ArticleCreate(title=title, index=i, contents=contents, language=language)
@@ -1,13 +1,29 @@
 # Standard Library Imports
 import pathlib
+from typing import BinaryIO, Optional, Self
 
 # 3rd-Party Imports
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, SkipValidation, model_validator
 
 
 class AttachmentCreate(BaseModel):
-    raw_contents: bytes
+    """
+    An attachment can be supplied as raw bytes, as a path on disk or as an open binary file handle. Paths and file
+    handles are memory-mapped and encoded in chunks when the mail is sent, rather than being read into memory.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    raw_contents: Optional[bytes] = None
+    file_handle: Optional[SkipValidation[BinaryIO]] = None
     file_type: str
-    source_file_name: pathlib.Path
+    source_file_name: Optional[pathlib.Path] = None
     destination_file_name: str
     content_id: str
+
+    @model_validator(mode="after")
+    def validate_source(self) -> Self:
+        if self.raw_contents is None and self.file_handle is None and self.source_file_name is None:
+            raise ValueError("One of raw_contents, file_handle or source_file_name must be supplied")
+
+        return self
@@ -1,15 +1,16 @@
 # Standard Library Imports
 import base64
+import functools
+import io
 import logging
+import mmap
+import os
 import pathlib
-from typing import Dict
+import stat
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable
 
 # 3rd-Party Imports
-import sendgrid
-from jinja2 import Environment, PackageLoader, Template, select_autoescape
 from pydantic.networks import EmailStr
-from python_http_client.exceptions import ForbiddenError
-from sendgrid.helpers.mail import Mail
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
@@ -18,13 +19,93 @@ from ninety_seven_things.modules.mail import schemas as mail_schemas
 # Local Folder Imports
 from .exceptions import MailException
 
-jinja_env = Environment(loader=PackageLoader("ninety_seven_things"), autoescape=select_autoescape())
+if TYPE_CHECKING:
+    # 3rd-Party Imports
+    import sendgrid
+    from jinja2 import Environment, Template
 
 logger = logging.getLogger(settings.LOG_NAME)
 
+# Must be a multiple of 3 so that each chunk encodes to base64 without padding
+ATTACHMENT_CHUNK_SIZE = 3 * 256 * 1024
 
-def create_attachment(attachment_create: mail_schemas.AttachmentCreate) -> sendgrid.Attachment:
-    encoded_contents = base64.b64encode(attachment_create.raw_contents).decode()
+
+@functools.cache
+def get_jinja_env() -> "Environment":
+    """
+    Created on first use, as are the sendgrid imports below, so that processes which never send mail never load either
+    """
+    # 3rd-Party Imports
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    return Environment(loader=PackageLoader("ninety_seven_things"), autoescape=select_autoescape())
+
+
+async def compile_templates() -> None:
+    """
+    Warm-up: compiles every mail template, so the first mail sent does not pay for it
+    """
+    # 3rd-Party Imports
+    from jinja2 import TemplateError
+
+    jinja_env = get_jinja_env()
+
+    for name in jinja_env.list_templates():
+        try:
+            jinja_env.get_template(name)
+        except TemplateError as exc:
+            raise MailException(message=f"Unable to compile the mail template {name}: {exc}") from exc
+
+
+def encode_chunks(chunks: Iterable[bytes]) -> str:
+    encoded = io.StringIO()
+
+    for chunk in chunks:
+        encoded.write(base64.b64encode(chunk).decode("ascii"))
+
+    return encoded.getvalue()
+
+
+def encode_file(file_handle: BinaryIO) -> str:
+    """
+    Base64-encodes a file chunk by chunk into a single buffer. Regular files are memory-mapped, so the raw contents
+    are never copied onto the heap; anything else (in-memory handles such as BytesIO, pipes, sockets) is read a chunk
+    at a time until EOF.
+    """
+    try:
+        fileno = file_handle.fileno()
+        file_stat = os.fstat(fileno)
+    except (AttributeError, OSError):
+        # io.UnsupportedOperation, raised by BytesIO, is an OSError
+        file_stat = None
+
+    # Pipes and sockets report a size of 0 whatever they hold, and can not be mapped
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return encode_chunks(iter(functools.partial(file_handle.read, ATTACHMENT_CHUNK_SIZE), b""))
+
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        return encode_chunks(
+            view[offset : offset + ATTACHMENT_CHUNK_SIZE]
+            for offset in range(0, file_stat.st_size, ATTACHMENT_CHUNK_SIZE)
+        )
+
+
+def encode_attachment(attachment_create: mail_schemas.AttachmentCreate) -> str:
+    if attachment_create.raw_contents is not None:
+        return base64.b64encode(attachment_create.raw_contents).decode()
+
+    if attachment_create.file_handle is not None:
+        return encode_file(attachment_create.file_handle)
+
+    with open(attachment_create.source_file_name, "rb") as f:
+        return encode_file(f)
+
+
+def create_attachment(attachment_create: mail_schemas.AttachmentCreate) -> "sendgrid.Attachment":
+    # 3rd-Party Imports
+    import sendgrid
+
+    encoded_contents = encode_attachment(attachment_create)
 
     attachment = sendgrid.Attachment()
 
@@ -43,11 +124,16 @@ def delete_attachment(path: pathlib.Path) -> None:
 
 def send_mail(
     mail_to: EmailStr | str,
-    subject_template: Template,
-    body_template: Template,
+    subject_template: "Template",
+    body_template: "Template",
     attachment: mail_schemas.AttachmentCreate = None,
     environment: Dict = None,
 ) -> None:
+    # 3rd-Party Imports
+    import sendgrid
+    from python_http_client.exceptions import ForbiddenError
+    from sendgrid.helpers.mail import Mail
+
     if environment is None:
         environment = {}
 
@@ -67,11 +153,12 @@ def send_mail(
         message = "Failed to send mail = received HTTP 403 from mail provider API"
         raise MailException(message=message) from exc
     finally:
-        if attachment:
+        if attachment and attachment.source_file_name:
             delete_attachment(path=attachment.source_file_name)
 
 
 def send_internal_server_mail(mail_to: EmailStr | str, body: Dict) -> None:
+    jinja_env = get_jinja_env()
     subject_template = jinja_env.from_string(f"{settings.PROJECT_NAME} - Internal Server Error")
     body_template = jinja_env.get_template("internal_server_error.html")
 
@@ -90,6 +177,7 @@ def send_forgot_password_mail(
     token: str,
     base_url: str,
 ) -> None:
+    jinja_env = get_jinja_env()
     subject_template = jinja_env.from_string(f"{settings.ENTITY_NAME} - Password recovery for {given_name}")
     body_template = jinja_env.get_template("forgot_password.html")
     link = f"{base_url}/reset-password?token={token}"
@@ -110,6 +198,7 @@ def send_forgot_password_mail(
 
 
 def send_reset_password_mail(mail_to: EmailStr | str, given_name: str, family_name: str | None, base_url: str) -> None:
+    jinja_env = get_jinja_env()
     subject_template = jinja_env.from_string(f"{settings.ENTITY_NAME} - Password has been reset for {given_name}")
     body_template = jinja_env.get_template("reset_password.html")
 
@@ -129,6 +218,7 @@ def send_reset_password_mail(mail_to: EmailStr | str, given_name: str, family_na
 
 
 def send_new_account_mail(mail_to: EmailStr | str, full_name: str, dashboard_link: str) -> None:
+    jinja_env = get_jinja_env()
     subject_template = jinja_env.from_string(f"{settings.ENTITY_NAME} - New account for {full_name}")
     body_template = jinja_env.get_template("new_account.html")
 
@@ -153,6 +243,7 @@ def send_new_account_confirmation_mail(
     else:
         full_name = given_name
 
+    jinja_env = get_jinja_env()
     subject_template = jinja_env.from_string(f"{settings.ENTITY_NAME} - Account verification for {full_name}")
     body_template = jinja_env.get_template("email_confirmation.html")
 
@@ -0,0 +1,20 @@
+# Standard Library Imports
+from typing import Annotated, Optional
+
+# 3rd-Party Imports
+from fastapi import Depends, status
+from fastapi.exceptions import HTTPException
+
+# Application-Local Imports
+from ninety_seven_things.lib import security
+from ninety_seven_things.modules.user.models import User
+
+
+async def signed_in_user(user: Annotated[Optional[User], Depends(security.current_active_user)]) -> User:
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Sign in to track reading progress")
+
+    return user
+
+
+SignedInUserDependency = Annotated[User, Depends(signed_in_user)]
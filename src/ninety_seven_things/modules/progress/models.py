@@ -0,0 +1,29 @@
+# Standard Library Imports
+import logging
+from typing import Any, ClassVar, Dict, List
+
+# 3rd-Party Imports
+import pymongo
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+class ReadingProgress(Document):
+    """
+    The articles a user has read in one language, as a bitset: bit i % 64 of word i // 64 is set once article i has
+    been read. The words are separate int64 fields, as $bit can only address whole fields.
+    """
+
+    user_id: PydanticObjectId
+    language: str
+    words: Dict[str, int] = Field(default_factory=dict)
+
+    class Settings:
+        indexes: ClassVar[List[Any]] = [
+            pymongo.IndexModel([("user_id", pymongo.ASCENDING), ("language", pymongo.ASCENDING)], unique=True),
+        ]
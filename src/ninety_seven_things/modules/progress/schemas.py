@@ -0,0 +1,22 @@
+# Standard Library Imports
+import logging
+from typing import List
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import schemas
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+class ReadingProgressView(schemas.Entity):
+    language: str
+    read: List[int]
+    unread_count: int
+    total: int  # articles in the language, not counting its README
+
+
+class ArticleSuggestion(schemas.Entity):
+    language: str
+    index: int
+    url: str
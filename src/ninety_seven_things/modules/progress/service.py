@@ -0,0 +1,131 @@
+"""
+Reading progress, read and written a whole bitset at a time: each update is one atomic $bit upsert of a single word,
+and suggestions are computed in memory against the article availability bitmaps
+"""
+
+# Standard Library Imports
+import logging
+from typing import Any, Dict, Optional
+
+# 3rd-Party Imports
+from beanie import PydanticObjectId
+from bson.int64 import Int64
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import bitset, constants
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.modules.article.availability import availability
+
+# Local Folder Imports
+from .models import ReadingProgress
+from .schemas import ArticleSuggestion, ReadingProgressView
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+def to_int64(word: int) -> Int64:
+    """
+    Mongo's integers are signed, so a word with its top bit set is stored as a negative number
+    """
+    return Int64(word - (1 << WORD_BITS) if word >> (WORD_BITS - 1) else word)
+
+
+def from_words(words: Dict[str, int]) -> int:
+    read = 0
+
+    for number, word in words.items():
+        read |= (word & WORD_MASK) << (int(number) * WORD_BITS)
+
+    return read
+
+
+def validate_article(language: str, index: int) -> None:
+    if index == constants.INDEX_ID or not availability.has(language, index):
+        raise DoesNotExistException(message=f"An article with index {index} and language {language} does not exist")
+
+
+async def get_read(user_id: PydanticObjectId, language: str) -> int:
+    document = await ReadingProgress.get_motor_collection().find_one(
+        {"user_id": user_id, "language": language}, {"_id": 0, "words": 1}
+    )
+
+    return from_words(document["words"]) if document else 0
+
+
+async def set_read(user_id: PydanticObjectId, language: str, index: int, read: bool) -> int:
+    """
+    Marks the article read or unread with a single write, creating the user's progress in the language if need be;
+    returns the updated bitset
+    """
+    validate_article(language, index)
+
+    bit = 1 << (index % WORD_BITS)
+    operation = {"or": to_int64(bit)} if read else {"and": to_int64(~bit & WORD_MASK)}
+    update: Dict[str, Any] = {"$bit": {f"words.{index // WORD_BITS}": operation}}
+
+    collection = ReadingProgress.get_motor_collection()
+
+    try:
+        document = await collection.find_one_and_update(
+            {"user_id": user_id, "language": language},
+            update,
+            projection={"_id": 0, "words": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        # A concurrent first write for the same user and language won the upsert; the document exists now
+        document = await collection.find_one_and_update(
+            {"user_id": user_id, "language": language},
+            update,
+            projection={"_id": 0, "words": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    return from_words(document["words"])
+
+
+def unread(language: str, read: int) -> int:
+    return availability.articles(language) & ~read
+
+
+def progress_view(language: str, read: int) -> ReadingProgressView:
+    # Articles since removed are left out
+    read &= availability.articles(language)
+
+    return ReadingProgressView(
+        language=language,
+        read=list(bitset.members(read)),
+        unread_count=unread(language, read).bit_count(),
+        total=availability.articles(language).bit_count(),
+    )
+
+
+def suggestion(language: str, index: Optional[int]) -> ArticleSuggestion:
+    if index is None:
+        raise DoesNotExistException(message=f"Every article in language {language} has been read")
+
+    return ArticleSuggestion(language=language, index=index, url=f"/reader/{language}/article/{index}")
+
+
+def next_unread(language: str, read: int, after: int = constants.INDEX_ID) -> ArticleSuggestion:
+    """
+    The first unread article after the given one, wrapping around to the start
+    """
+    remaining = unread(language, read)
+    index = bitset.next_member(remaining, after)
+
+    if index is None:
+        index = bitset.next_member(remaining, constants.INDEX_ID)
+
+    return suggestion(language, index)
+
+
+def random_unread(language: str, read: int) -> ArticleSuggestion:
+    return suggestion(language, bitset.random_member(unread(language, read)))
@@ -0,0 +1,88 @@
+# Standard Library Imports
+import logging
+
+# 3rd-Party Imports
+from fastapi import APIRouter, HTTPException, status
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import constants
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+
+# Local Folder Imports
+from .dependencies import SignedInUserDependency
+from .schemas import ArticleSuggestion, ReadingProgressView
+from .service import get_read, next_unread, progress_view, random_unread, set_read
+
+router = APIRouter()
+logger = logging.getLogger(settings.LOG_NAME)
+
+
+@router.get(
+    path="/progress/{language}",
+    status_code=status.HTTP_200_OK,
+    summary="Retrieve my reading progress in a language",
+)
+async def read_progress(language: str, user: SignedInUserDependency) -> ReadingProgressView:
+    return progress_view(language, await get_read(user_id=user.id, language=language))
+
+
+@router.get(
+    path="/progress/{language}/next",
+    status_code=status.HTTP_200_OK,
+    summary="Suggest the next article I have not read",
+)
+async def suggest_next_unread(
+    language: str, user: SignedInUserDependency, after: int = constants.INDEX_ID
+) -> ArticleSuggestion:
+    """
+    The first unread article after `after`, wrapping around to the start; 404 once every article has been read
+    """
+    read = await get_read(user_id=user.id, language=language)
+
+    try:
+        return next_unread(language, read, after=after)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+
+@router.get(
+    path="/progress/{language}/random",
+    status_code=status.HTTP_200_OK,
+    summary="Suggest a random article I have not read",
+)
+async def suggest_random_unread(language: str, user: SignedInUserDependency) -> ArticleSuggestion:
+    read = await get_read(user_id=user.id, language=language)
+
+    try:
+        return random_unread(language, read)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+
+@router.put(
+    path="/progress/{language}/{index}",
+    status_code=status.HTTP_200_OK,
+    summary="Mark an article as read",
+)
+async def mark_read(language: str, index: int, user: SignedInUserDependency) -> ReadingProgressView:
+    try:
+        read = await set_read(user_id=user.id, language=language, index=index, read=True)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+    return progress_view(language, read)
+
+
+@router.delete(
+    path="/progress/{language}/{index}",
+    status_code=status.HTTP_200_OK,
+    summary="Mark an article as unread",
+)
+async def mark_unread(language: str, index: int, user: SignedInUserDependency) -> ReadingProgressView:
+    try:
+        read = await set_read(user_id=user.id, language=language, index=index, read=False)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+    return progress_view(language, read)
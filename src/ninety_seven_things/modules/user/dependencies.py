@@ -1,14 +1,15 @@
 # Standard Library Imports
+import logging
 from typing import Annotated, List
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
 from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
-from icecream import ic
 from pydantic import EmailStr
 
 # Application-Local Imports
+from ninety_seven_things.core.config import settings
 from ninety_seven_things.lib import enums, security
 from ninety_seven_things.lib.exceptions import DoesNotExistException
 
@@ -17,6 +18,8 @@ from .models import User
 from .schemas import UserRoles
 from .service import get_one_by_email, get_one_by_id, get_roles
 
+logger = logging.getLogger(settings.LOG_NAME)
+
 
 async def valid_user_id(user_id: PydanticObjectId) -> User:
     try:
@@ -38,7 +41,7 @@ async def valid_user_email(user_email: EmailStr | str) -> User:
 
 async def user_roles(current_user: User = Depends(security.current_active_user)) -> UserRoles:
     if current_user is None:
-        ic("current_user is None")
+        logger.debug("current_user is None")
         return []
 
     roles = await get_roles(user_id=current_user.id)
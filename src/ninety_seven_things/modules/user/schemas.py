@@ -3,12 +3,13 @@ from __future__ import annotations
 
 # Standard Library Imports
 import logging
-from typing import Optional
+from typing import Annotated, Optional
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
 from fastapi_users import schemas
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing_extensions import TypedDict
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
@@ -52,6 +53,31 @@ class UserView(schemas.BaseUser[PydanticObjectId]):
     phone_number: Optional[types.PhoneNumber]
 
 
+class UserRecord(TypedDict):
+    """
+    A raw user document as serialized by the trusted fast path; the hashed password is not declared, so it is never
+    emitted
+    """
+
+    _id: Annotated[PydanticObjectId, Field(serialization_alias="id")]
+    email: str
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+    given_name: str
+    family_name: Optional[str]
+    phone_number: Optional[str]
+
+
+class UserBatchItem(TypedDict):
+    """
+    A requested id or email address and the user it resolved to, or None if there is no such user
+    """
+
+    key: str
+    user: Optional[UserRecord]
+
+
 class AbridgedUser(BaseModel):
     """
     Just the minimum fields when returning a user
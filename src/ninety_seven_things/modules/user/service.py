@@ -1,16 +1,16 @@
 # Standard Library Imports
 import logging
-from typing import List, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
 from beanie.operators import In
-from icecream import ic
 from pydantic import EmailStr
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
 from ninety_seven_things.lib import exceptions, passwords
+from ninety_seven_things.lib.loader import LinkSelection, fetch_selected_links, use_lookup
 
 # Local Folder Imports
 from .exceptions import UserDoesNotExistException, UserExistsException
@@ -42,27 +42,70 @@ async def create_user(user_in: UserCreate) -> User:
     return created_user
 
 
-async def get_many(fetch_links: bool = False, skip: int = 0, limit: int = 100) -> List[User]:
+async def get_many(fetch_links: LinkSelection = False, skip: int = 0, limit: int = 100) -> List[User]:
     """ "
     Retrieve many Users
     """
-    return await User.find_all(fetch_links=fetch_links).skip(skip).limit(limit).to_list()
+    users = await User.find_all(fetch_links=use_lookup(User, fetch_links)).skip(skip).limit(limit).to_list()
 
+    await fetch_selected_links(User, users, fetch_links)
 
-async def get_one_by_id(user_id: PydanticObjectId, fetch_links: bool = False) -> User:
+    return users
+
+
+async def get_many_raw(skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    Retrieve many Users as raw Mongo documents, for the trusted serialization path
+    """
+    cursor = User.get_motor_collection().find({}, {"hashed_password": 0}).skip(skip).limit(limit)
+    return await cursor.to_list(length=None)
+
+
+async def get_many_raw_by_field(field: str, values: Sequence[Any]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Retrieve Users whose field matches one of the values as raw Mongo documents, in the order requested and with None
+    for any that do not exist, using a single $in query
+    """
+    cursor = User.get_motor_collection().find({field: {"$in": list(set(values))}}, {"hashed_password": 0})
+    documents = {document[field]: document for document in await cursor.to_list(length=None)}
+
+    return [documents.get(value) for value in values]
+
+
+async def get_many_raw_by_id(user_ids: Sequence[PydanticObjectId]) -> List[Optional[Dict[str, Any]]]:
+    return await get_many_raw_by_field("_id", user_ids)
+
+
+async def get_many_raw_by_email(email_addresses: Sequence[EmailStr | str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Emails are matched case-insensitively, as fastapi-users does, using the collation of its email index
+    """
+    cursor = User.get_motor_collection().find(
+        {"email": {"$in": list(set(email_addresses))}},
+        {"hashed_password": 0},
+        collation=User.Settings.email_collation,
+    )
+    documents = {document["email"].lower(): document for document in await cursor.to_list(length=None)}
+
+    return [documents.get(email_address.lower()) for email_address in email_addresses]
+
+
+async def get_one_by_id(user_id: PydanticObjectId, fetch_links: LinkSelection = False) -> User:
     """ "
     Retrieve many Users
     """
-    user = await User.find_one(User.id == user_id, fetch_links=fetch_links)
+    user = await User.find_one(User.id == user_id, fetch_links=use_lookup(User, fetch_links))
 
     if user is None:
         raise UserDoesNotExistException
 
+    await fetch_selected_links(User, [user], fetch_links)
+
     return user
 
 
 async def get_one_by_email(email: EmailStr | str) -> User:
-    target_user = await User.find_one(User.email == email)
+    target_user = await User.find_one(User.email == email, collation=User.Settings.email_collation)
 
     if target_user is None:
         raise UserDoesNotExistException
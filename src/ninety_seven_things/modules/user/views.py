@@ -6,7 +6,6 @@ from typing import List, Optional
 # 3rd-Party Imports
 from beanie import PydanticObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
-from icecream import ic
 from pydantic import EmailStr
 from starlette import status
 
@@ -14,6 +13,7 @@ from starlette import status
 from ninety_seven_things.core.config import settings
 from ninety_seven_things.lib.exceptions import DoesNotExistException
 from ninety_seven_things.lib.security import auth_backend
+from ninety_seven_things.lib.serialization import JSONBytesResponse, dump_records
 from ninety_seven_things.modules.user import dependencies as user_dependencies
 from ninety_seven_things.modules.user import schemas as user_schemas
 from ninety_seven_things.modules.user import service as user_service
@@ -21,7 +21,7 @@ from ninety_seven_things.modules.user import service as user_service
 # Local Folder Imports
 from .exceptions import UserExistsException
 from .role import allow_create_anonymous_user, allow_list_user, allow_view_user
-from .service import create_user, get_many
+from .service import create_user, get_many_raw
 
 router = APIRouter()
 logger = logging.getLogger(settings.LOG_NAME)
@@ -100,13 +100,36 @@ async def find(
     dependencies=[Depends(allow_view_user)],
     summary="Searches for a number of users",
 )
-async def find_many(email_addresses: list[EmailStr] | None = Query(default=None)) -> List[user_schemas.UserView]:
-    try:
-        users = await get_many_by_email(email_addresses=email_addresses)
-    except DoesNotExistException as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+async def find_many(
+    user_ids: list[PydanticObjectId] | None = Query(default=None),
+    email_addresses: list[EmailStr] | None = Query(default=None),
+) -> List[user_schemas.UserBatchItem]:
+    """
+    Either `user_ids` or `email_addresses` may be repeated up to BATCH_MAX_ITEMS times. Results are returned in the
+    order requested, with `user` set to null for anyone who does not exist.
+    """
+    if (user_ids is None) == (email_addresses is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="One and only one of user_ids or email_addresses can be specified",
+        )
+
+    requested = user_ids or email_addresses
+
+    if len(requested) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_ITEMS} users can be requested at once",
+        )
+
+    if user_ids is not None:
+        documents = await user_service.get_many_raw_by_id(user_ids=user_ids)
+    else:
+        documents = await user_service.get_many_raw_by_email(email_addresses=email_addresses)
+
+    items = [{"key": str(key), "user": document} for key, document in zip(requested, documents, strict=True)]
 
-    return [user_schemas.UserView(**user.model_dump()) for user in users]
+    return JSONBytesResponse(content=dump_records(user_schemas.UserBatchItem, items))
 
 
 @router.get(
@@ -116,4 +139,5 @@ async def find_many(email_addresses: list[EmailStr] | None = Query(default=None)
     summary="Retrieves all Users",
 )
 async def read_all_users(skip: int = 0, limit: int = 100) -> List[user_schemas.UserView]:
-    return [user_schemas.UserView(**user.model_dump()) for user in await get_many(skip=skip, limit=limit)]
+    documents = await get_many_raw(skip=skip, limit=limit)
+    return JSONBytesResponse(content=dump_records(user_schemas.UserRecord, documents))
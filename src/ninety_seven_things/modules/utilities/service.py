@@ -8,20 +8,18 @@ from datetime import UTC, datetime
 # 3rd-Party Imports
 from fastapi import APIRouter, Depends, Response, status
 from fastapi.exceptions import HTTPException
-from git import Repo
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
-from ninety_seven_things.lib import constants
+from ninety_seven_things.lib import cache
 from ninety_seven_things.lib.types.phone_number import PhoneNumber
+from ninety_seven_things.modules.article import availability as article_availability
 from ninety_seven_things.modules.article import models as article_models
-from ninety_seven_things.modules.article import schemas as article_schemas
 from ninety_seven_things.modules.article import service as article_service
 from ninety_seven_things.modules.author import models as author_models
 from ninety_seven_things.modules.user import models as user_models
 from ninety_seven_things.modules.user import schemas as user_schemas
 from ninety_seven_things.modules.user import service as user_service
-from ninety_seven_things.modules.git import interface as git_interface
 
 # Local Folder Imports
 from .role import allow_reseed_db, allow_wipe_db
@@ -55,6 +53,10 @@ async def load_seed_data(
 
     logger.info(f"Loading seed data from {settings.SOURCE_REPO_URL}")
 
+    # Application-Local Imports
+    # Only seeding needs GitPython, so it is imported here rather than by every worker at start-up
+    from ninety_seven_things.modules.git import interface as git_interface
+
     logger.info(f"Instantiating git interface")
     git = git_interface.Git()
 
@@ -64,38 +66,12 @@ async def load_seed_data(
 
     await git.clone_repo()
 
-    for language in constants.SUPPORTED_LANGUAGES:
-        with open(git.local_dir / language / "README.md") as f:
-            contents = f.read()
-
-            article_in = article_schemas.ArticleCreate(
-                title="README",
-                index=0,
-                contents=contents,
-                language=language,
-            )
-
-            article = await article_service.create(article_in=article_in)
-
-            created_articles.append(article.id)
+    for article_in in git.articles():
+        article = await article_service.create(article_in=article_in)
 
-        for i in range(constants.FIRST_ARTICLE_ID, constants.LAST_ARTICLE_ID + 1):
-            with open(git.local_dir / language / f"thing_{i:02}" / "README.md") as f:
-                raw_article_data = f.read()
-                _, _, title = raw_article_data.split("\n")[0].partition(" ")
+        created_articles.append(article.id)
 
-                contents = "\n".join(raw_article_data.split("\n")[2:])
-
-                article_in = article_schemas.ArticleCreate(
-                    title=title,
-                    index=i,
-                    contents=contents,
-                    language=language,
-                )
-
-                article = await article_service.create(article_in=article_in)
-
-                created_articles.append(article.id)
+    await cache.clear_all()
 
     return LoadedDataReport(authors=created_authors, articles=created_articles)
 
@@ -117,3 +93,6 @@ async def clear_db():
     for model in models:
         logger.warning(f"Deleting all {model.__name__} documents")
         await model.delete_all()
+
+    await cache.clear_all()
+    await article_availability.mark_all_unavailable()
@@ -10,6 +10,8 @@ from fastapi.exceptions import HTTPException
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import cache
+from ninety_seven_things.modules.article import availability as article_availability
 from ninety_seven_things.modules.article import models as article_models
 from ninety_seven_things.modules.article import schemas as article_schemas
 from ninety_seven_things.modules.article import service as article_service
@@ -81,3 +83,6 @@ async def clear_db():
     for model in models:
         logger.warning(f"Deleting all {model.__name__} documents")
         await model.delete_all()
+
+    await cache.clear_all()
+    await article_availability.mark_all_unavailable()
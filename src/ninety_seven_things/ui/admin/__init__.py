@@ -9,7 +9,6 @@ from fastapi import params as fastapi_params
 from fastui import AnyComponent
 from fastui import components as c
 from fastui.events import GoToEvent
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
@@ -0,0 +1,14 @@
+# 3rd-Party Imports
+from fastapi import FastAPI
+
+# Local Folder Imports
+from .article import router as article_router
+from .author import router as author_router
+from .main import router as main_router
+
+# Mounted at /ui/admin by main.py through a LazyApp, so none of the admin UI is imported until it is first requested
+app = FastAPI(openapi_url=None)
+
+app.include_router(article_router)
+app.include_router(author_router)
+app.include_router(main_router)
@@ -1,5 +1,6 @@
 # Standard Library Imports
 import logging
+from typing import Literal, Optional
 
 # 3rd-Party Imports
 from beanie import PydanticObjectId
@@ -8,12 +9,12 @@ from fastui import AnyComponent, FastUI
 from fastui import components as c
 from fastui.components.display import DisplayLookup, DisplayMode
 from fastui.events import BackEvent, GoToEvent
-from icecream import ic
 from pydantic import BaseModel, Field
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
-from ninety_seven_things.modules.article import models as article_models
+from ninety_seven_things.lib import constants, enums
+from ninety_seven_things.modules.article import schemas as article_schemas
 from ninety_seven_things.modules.article import service as article_service
 
 # Local Folder Imports
@@ -23,20 +24,45 @@ router = APIRouter()
 logger = logging.getLogger(settings.LOG_NAME)
 
 
+class ArticleTableFilter(BaseModel):
+    language: Optional[Literal[tuple(constants.SUPPORTED_LANGUAGES)]] = Field(default=None, title="Language")
+    sort: enums.ArticleSort = Field(default=enums.ArticleSort.INDEX, title="Sort by")
+
+
 @router.get(path="/article", response_model=FastUI, response_model_exclude_none=True)
-async def article_table() -> list[AnyComponent]:
-    articles = await article_service.get_all(fetch_links=True)
+async def article_table(
+    page: int = 1,
+    language: Optional[str] = None,
+    sort: enums.ArticleSort = enums.ArticleSort.INDEX,
+) -> list[AnyComponent]:
+    page_size = settings.ADMIN_PAGE_SIZE
+
+    article_page = await article_service.get_table_page(
+        language=language or None,
+        sort=sort,
+        skip=(max(page, 1) - 1) * page_size,
+        limit=page_size,
+    )
 
     return admin_page(
+        c.ModelForm(
+            model=ArticleTableFilter,
+            initial={"language": language, "sort": sort},
+            submit_url=".",
+            method="GOTO",
+            submit_on_change=True,
+            display_mode="inline",
+        ),
         c.Table(
-            data=articles,
+            data=article_page.articles,
             columns=[
                 DisplayLookup(field="index", mode=DisplayMode.plain),
-                DisplayLookup(field="title", on_click=GoToEvent(url="/admin/article/{_id}")),
+                DisplayLookup(field="title", on_click=GoToEvent(url="/admin/article/{id}")),
                 DisplayLookup(field="language", mode=DisplayMode.plain),
             ],
-            data_model=article_models.Article,
+            data_model=article_schemas.ArticleTableRow,
         ),
+        c.Pagination(page=page, page_size=page_size, total=article_page.total),
         title="Articles",
     )
 
@@ -50,7 +76,7 @@ async def article_detail(article_id: PydanticObjectId) -> list[AnyComponent]:
     """
     article = await article_service.get_by_id(article_id, fetch_links=True)
 
-    ic(article)
+    logger.debug(f"Admin article detail: {article}")
     return admin_page(
         # c.Heading(text=article.name, level=2),
         c.Link(components=[c.Text(text="Back")], on_click=BackEvent()),
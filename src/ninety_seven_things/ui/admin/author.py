@@ -3,17 +3,17 @@ import logging
 from typing import Annotated
 
 # 3rd-Party Imports
-from beanie import PydanticObjectId
+from beanie import Document, PydanticObjectId
 from fastapi import APIRouter
 from fastui import AnyComponent, FastUI
 from fastui import components as c
 from fastui.components.display import DisplayLookup, DisplayMode
 from fastui.events import BackEvent, GoToEvent
 from fastui.forms import SelectSearchResponse, fastui_form
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.loader import BatchLoaderDependency, link_values
 from ninety_seven_things.modules.author import schemas as author_schemas
 from ninety_seven_things.modules.author import service as author_service
 
@@ -66,39 +66,44 @@ async def search_view(q: str) -> SelectSearchResponse:
     author_options = [{"label": author.name, "value": str(author.id)} for author in authors]
 
     options = [{"label": "Author", "options": author_options}]
-    ic(options)
+    logger.debug(f"Admin author search options: {options}")
     return SelectSearchResponse(options=options)
 
 
 @router.get(
     path="/author/{author_id}", response_model=FastUI, response_model_exclude_none=True, include_in_schema=False
 )
-async def author_detail(author_id: PydanticObjectId) -> list[AnyComponent]:
+async def author_detail(author_id: PydanticObjectId, loader: BatchLoaderDependency) -> list[AnyComponent]:
     """
     author page, the frontend will fetch this when the user visits `/author/{id}/`.
     """
-    author = await author_service.get_by_id(author_id, fetch_links=True)
+    author = await author_service.get_by_id(author_id)
 
-    event_links = []
-    speaker_links = []
-    agent_links = []
-    sponsor_links = []
+    # Queue every link up front so each target collection is resolved with a single query
+    links_by_field = link_values(author)
 
-    for event in author.events:
-        e = await event.fetch()
-        event_links.append(c.Link(components=[c.Text(text=e.name)], on_click=GoToEvent(url=f"/event/{e.id}")))
+    for links in links_by_field.values():
+        loader.add_many(links)
 
-    for agent in author.agents:
-        a = await agent.fetch()
-        agent_links.append(c.Link(components=[c.Text(text=a.full_name)], on_click=GoToEvent(url=f"/agent/{a.id}")))
+    await loader.load()
 
-    for speaker in author.speakers:
-        s = await speaker.fetch()
-        speaker_links.append(c.Link(components=[c.Text(text=a.full_name)], on_click=GoToEvent(url=f"/speaker/{s.id}")))
+    link_sections = []
 
-    for sponsor in author.sponsors:
-        s = await sponsor.fetch()
-        sponsor_links.append(c.Link(components=[c.Text(text=a.name)], on_click=GoToEvent(url=f"/sponsor/{s.id}")))
+    for field_name, links in links_by_field.items():
+        linked_documents = [loader.get(link) for link in links]
+        link_components = [
+            c.Link(
+                components=[c.Text(text=link_label(document))],
+                on_click=GoToEvent(url=f"/admin/{type(document).__name__.lower()}/{document.id}"),
+            )
+            for document in linked_documents
+            if document is not None
+        ]
+
+        link_sections += [
+            c.Heading(text=field_name.replace("_", " ").title(), level=2),
+            c.Div(components=[c.LinkList(links=link_components)], class_name="mb-4"),
+        ]
 
     return admin_page(
         c.Link(components=[c.Text(text="Back")], on_click=BackEvent()),
@@ -108,15 +113,16 @@ async def author_detail(author_id: PydanticObjectId) -> list[AnyComponent]:
                 c.Details(
                     data=author,
                     fields=[
-                        DisplayLookup(field="name"),
+                        DisplayLookup(field="full_name"),
                         DisplayLookup(field="url"),
                     ],
                 ),
-                c.Heading(text="Events", level=2),
-                c.Div(components=[c.LinkList(links=event_links)], class_name="mb-4"),
-                c.Heading(text="Agents", level=2),
-                c.Div(components=[c.LinkList(links=agent_links)], class_name="mb-4"),
+                *link_sections,
             ],
             class_name="mb-4",
         ),
     )
+
+
+def link_label(document: Document) -> str:
+    return getattr(document, "full_name", None) or getattr(document, "name", None) or str(document.id)
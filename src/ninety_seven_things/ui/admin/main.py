@@ -5,7 +5,6 @@ import logging
 from fastapi import APIRouter
 from fastui import AnyComponent, FastUI
 from fastui import components as c
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
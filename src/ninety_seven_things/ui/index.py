@@ -10,7 +10,6 @@ from fastapi import APIRouter
 from fastui import AnyComponent, FastUI
 from fastui import components as c
 from fastui.events import BackEvent, GoToEvent
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
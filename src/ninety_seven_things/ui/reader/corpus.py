@@ -0,0 +1,90 @@
+"""
+Renders every reader page from the whole corpus at once, read from Mongo or straight from a checkout of the source
+repository, for serving without the database
+"""
+
+# Standard Library Imports
+import asyncio
+import logging
+import pathlib
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import constants, preload
+from ninety_seven_things.lib.snapshot import PageKind, SnapshotKey
+from ninety_seven_things.modules.article.availability import ArticleAvailability
+from ninety_seven_things.modules.article.schemas import ArticleCreate
+from ninety_seven_things.modules.git import interface as git_interface
+
+# Local Folder Imports
+from .main import page_json, render_index_page, render_reader_page
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+CorpusSource = Literal["mongo", "git"]
+
+
+def articles_from_mongo() -> List[ArticleCreate]:
+    return [ArticleCreate.model_validate(document) for document in preload.read_article_documents()]
+
+
+def articles_from_checkout(local_dir: Optional[pathlib.Path] = None) -> List[ArticleCreate]:
+    """
+    Reads an existing checkout, or clones a fresh one as load_seed_data does when local_dir is not given
+    """
+    git = git_interface.Git(local_dir=local_dir)
+
+    if local_dir is None:
+        asyncio.run(git.clone_repo())
+
+    return list(git.articles())
+
+
+def load_articles(source: CorpusSource, local_dir: Optional[pathlib.Path] = None) -> List[ArticleCreate]:
+    articles = articles_from_mongo() if source == "mongo" else articles_from_checkout(local_dir)
+    logger.info(f"Read {len(articles)} articles from {source}")
+
+    return articles
+
+
+def render_pages(
+    articles: Iterable[ArticleCreate], availability: Optional[ArticleAvailability] = None
+) -> Iterator[Tuple[SnapshotKey, bytes]]:
+    """
+    The body of every article page, and of each language's index page, exactly as the reader routes render them.
+    Navigation links to the articles in availability, which defaults to just those being rendered.
+    """
+    by_language: Dict[str, List[ArticleCreate]] = defaultdict(list)
+
+    for article in articles:
+        by_language[article.language].append(article)
+
+    if availability is None:
+        availability = ArticleAvailability.from_keys(
+            (language, article.index)
+            for language, language_articles in by_language.items()
+            for article in language_articles
+        )
+
+    for language, language_articles in by_language.items():
+        language_articles.sort(key=lambda article: article.index)
+        readme = next((article for article in language_articles if article.index == constants.INDEX_ID), None)
+
+        if readme is None:
+            logger.warning(f"No README for {language}, so it has no index page")
+        else:
+            index_page = render_index_page(
+                readme_contents=readme.contents,
+                articles=language_articles,
+                language=language,
+                availability=availability,
+            )
+            yield (PageKind.INDEX, language, constants.INDEX_ID), page_json(index_page)
+
+        for article in language_articles:
+            yield (
+                (PageKind.ARTICLE, language, article.index),
+                page_json(render_reader_page(article, language=language, availability=availability)),
+            )
@@ -0,0 +1,184 @@
+"""
+Exports the reader as a static site: every page body at the path the React app fetches it from, each with a gzipped
+copy beside it, plus the HTML shell, so that nginx or a CDN can serve the reader without the app
+
+    reader/index.html            the shell, for every /reader/... URL
+    static/fastui/...            the vendored frontend bundle the shell loads, if there is one
+    ui/reader/{language}/index
+    ui/reader/{language}/article/{index}
+
+Exports are incremental: a manifest of content hashes is kept in the output directory, only pages whose bytes changed
+are rewritten, and pages that no longer exist are removed.
+
+Index pages are exported without the "Most read this week" list, which changes with every view rollup; to show it,
+route ui/reader/{language}/index to the app rather than to the export.
+"""
+
+# Standard Library Imports
+import gzip
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 3rd-Party Imports
+from pydantic import BaseModel
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import frontend
+from ninety_seven_things.lib.snapshot import PageKind, SnapshotKey
+from ninety_seven_things.modules.article.availability import ArticleAvailability
+from ninety_seven_things.modules.article.schemas import ArticleCreate
+
+# Local Folder Imports
+from .corpus import render_pages
+from .main import reader_html
+
+logger = logging.getLogger(settings.LOG_NAME)
+
+MANIFEST_NAME = ".manifest.json"
+SHELL_PATH = "reader/index.html"
+
+
+class ExportReport(BaseModel):
+    written: List[str] = []
+    unchanged: int = 0
+    removed: List[str] = []
+
+
+def page_path(key: SnapshotKey) -> str:
+    kind, language, index = key
+
+    if kind == PageKind.INDEX:
+        return f"ui/reader/{language}/index"
+
+    return f"ui/reader/{language}/article/{index}"
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def write_atomically(path: pathlib.Path, contents: bytes) -> None:
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary_path.write_bytes(contents)
+    os.replace(temporary_path, path)
+
+
+def write_page(output_dir: pathlib.Path, relative_path: str, body: bytes) -> None:
+    path = output_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    write_atomically(path, body)
+    # mtime=0 keeps the compressed bytes a function of the body alone
+    write_atomically(path.with_name(f"{path.name}.gz"), gzip.compress(body, compresslevel=9, mtime=0))
+
+
+def export_pages(
+    pages: Iterable[Tuple[str, bytes]], output_dir: pathlib.Path, previous: Dict[str, str]
+) -> Dict[str, Tuple[str, bool]]:
+    """
+    Writes whichever pages differ from their previous hash; returns each page's hash and whether it was written
+    """
+    exported = {}
+
+    for relative_path, body in pages:
+        digest = content_hash(body)
+        changed = previous.get(relative_path) != digest or not (output_dir / relative_path).exists()
+
+        if changed:
+            write_page(output_dir, relative_path, body)
+
+        exported[relative_path] = (digest, changed)
+
+    return exported
+
+
+def export_language(
+    articles: List[ArticleCreate],
+    availability: ArticleAvailability,
+    output_dir: pathlib.Path,
+    previous: Dict[str, str],
+) -> Dict[str, Tuple[str, bool]]:
+    """
+    Renders and writes one language's pages, linking to the articles of every language; runs in a worker process
+    """
+    pages = ((page_path(key), body) for key, body in render_pages(articles, availability))
+
+    return export_pages(pages, output_dir, previous)
+
+
+def read_manifest(output_dir: pathlib.Path) -> Dict[str, str]:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text())["pages"]
+    except (OSError, ValueError, KeyError) as exc:
+        logger.info(f"No usable export manifest in {output_dir}, exporting every page: {exc}")
+        return {}
+
+
+def export_site(
+    articles: Iterable[ArticleCreate], output_dir: pathlib.Path, workers: Optional[int] = None
+) -> ExportReport:
+    """
+    Exports every page, one language per worker process
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = read_manifest(output_dir)
+
+    by_language: Dict[str, List[ArticleCreate]] = defaultdict(list)
+
+    for article in articles:
+        by_language[article.language].append(article)
+
+    availability = ArticleAvailability.from_keys(
+        (article.language, article.index) for language_articles in by_language.values() for article in language_articles
+    )
+
+    exported = export_pages([(SHELL_PATH, reader_html().encode())], output_dir, previous)
+
+    if fingerprint := frontend.assets_fingerprint():
+        # Fingerprinted, so a bundle already copied never needs copying again
+        shutil.copytree(
+            frontend.ASSETS_DIR / fingerprint,
+            output_dir / frontend.ASSETS_URL.lstrip("/") / fingerprint,
+            dirs_exist_ok=True,
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(export_language, language_articles, availability, output_dir, previous)
+            for language_articles in by_language.values()
+        ]
+
+        for future in futures:
+            exported.update(future.result())
+
+    report = ExportReport()
+
+    for relative_path, (_, changed) in sorted(exported.items()):
+        if changed:
+            report.written.append(relative_path)
+        else:
+            report.unchanged += 1
+
+    for relative_path in sorted(previous.keys() - exported.keys()):
+        for path in (output_dir / relative_path, output_dir / f"{relative_path}.gz"):
+            path.unlink(missing_ok=True)
+
+        report.removed.append(relative_path)
+
+    manifest = {"pages": {relative_path: digest for relative_path, (digest, _) in sorted(exported.items())}}
+    write_atomically(output_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+
+    logger.info(
+        f"Exported the reader to {output_dir}: {len(report.written)} written, {report.unchanged} unchanged, "
+        f"{len(report.removed)} removed"
+    )
+
+    return report
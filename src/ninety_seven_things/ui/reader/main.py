@@ -3,27 +3,67 @@ from __future__ import annotations as _annotations
 
 # Standard Library Imports
 import logging
-import random
-from typing import List
+from typing import Callable, List, Optional, Sequence, Tuple
 
 # 3rd-Party Imports
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response, status
 from fastui import AnyComponent, FastUI
 from fastui import components as c
 from fastui.events import BackEvent, GoToEvent
-from icecream import ic
 
 # Application-Local Imports
 from ninety_seven_things.core.config import settings
-from ninety_seven_things.lib import constants
+from ninety_seven_things.lib import constants, frontend
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.single_flight import SingleFlight
+from ninety_seven_things.lib.snapshot import PageKind, get_reader_snapshot
+from ninety_seven_things.modules.article import availability as article_availability
 from ninety_seven_things.modules.article import models as article_models
+from ninety_seven_things.modules.article import popularity as article_popularity
+from ninety_seven_things.modules.article import schemas as article_schemas
 from ninety_seven_things.modules.article import service as article_service
 
 router = APIRouter()
 logger = logging.getLogger(settings.LOG_NAME)
 
+# Concurrent requests for the same page share one lookup and render
+reader_flight = SingleFlight(name="reader")
 
-def render_reader_page(article: article_models.Article, language: str) -> list[AnyComponent]:
+
+def reader_html() -> str:
+    """
+    The HTML shell served at /reader/{path}, which loads the React app that then fetches pages from /ui/reader
+    """
+    return frontend.landing_html(title="97 Things Reader", api_root_url="/ui")
+
+
+def page_json(page: list[AnyComponent]) -> bytes:
+    """
+    The response body the routes below would send for page
+    """
+    return FastUI(root=page).model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def snapshot_response(kind: PageKind, language: str, index: int = 0) -> Optional[Response]:
+    """
+    The page straight from the reader snapshot, if one is in use and has it; the body is a view of the mapped file
+    """
+    snapshot = get_reader_snapshot()
+
+    if snapshot is None:
+        return None
+
+    try:
+        return Response(content=snapshot.get(kind, language, index), media_type="application/json")
+    except DoesNotExistException:
+        return None
+
+
+def render_reader_page(
+    article: article_models.Article | article_schemas.ArticleCreate,
+    language: str,
+    availability: Optional[article_availability.ArticleAvailability] = None,
+) -> list[AnyComponent]:
     return reader_page(
         c.Div(
             components=[
@@ -34,27 +74,96 @@ def render_reader_page(article: article_models.Article, language: str) -> list[A
         ),
         index=article.index,
         language=language,
+        availability=availability,
     )
 
 
-@router.get(path="/{language}/article/random", response_model=FastUI, response_model_exclude_none=True)
-async def read_random_article(language: str) -> List[AnyComponent]:
-    index = random.randint(constants.FIRST_ARTICLE_ID, constants.LAST_ARTICLE_ID)
+async def build_article_page(index: int, language: str) -> list[AnyComponent]:
     article = await article_service.get_by_index_and_language(index=index, language=language)
     return render_reader_page(article=article, language=language)
 
 
+async def article_page(index: int, language: str) -> List[AnyComponent]:
+    """
+    This worker's availability can lag a delete made on another, so an article it lists may already be gone
+    """
+    try:
+        return await reader_flight.do(("article", language, index), build_article_page, index, language)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+
+@router.get(path="/{language}/article/random", response_model=FastUI, response_model_exclude_none=True)
+async def read_random_article(language: str) -> List[AnyComponent]:
+    index = article_availability.availability.random(language)
+
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"There are no articles in {language}")
+
+    article_popularity.record_view(language, index)
+
+    if response := snapshot_response(PageKind.ARTICLE, language, index):
+        return response
+
+    return await article_page(index, language)
+
+
 @router.get(path="/{language}/article/{index}", response_model=FastUI, response_model_exclude_none=True)
 async def read_article(index: int, language: str) -> List[AnyComponent]:
-    article = await article_service.get_by_index_and_language(index=index, language=language)
-    return render_reader_page(article=article, language=language)
+    article_popularity.record_view(language, index)
+
+    if response := snapshot_response(PageKind.ARTICLE, language, index):
+        return response
+
+    return await article_page(index, language)
 
 
 @router.get(path="/{language}/index", response_model=FastUI, response_model_exclude_none=True)
 async def reader_index(language: str = "en") -> list[AnyComponent]:
+    popular = await article_popularity.get_popular(language)
+
+    # The snapshot's index page is rendered without a most-read list, which changes with every rollup
+    if not popular.articles and (response := snapshot_response(PageKind.INDEX, language)):
+        return response
+
+    try:
+        return await reader_flight.do(("index", language), build_index_page, language, popular)
+    except DoesNotExistException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+
+async def build_index_page(
+    language: str, popular: Optional[article_schemas.PopularArticles] = None
+) -> list[AnyComponent]:
     readme = await article_service.get_by_index_and_language(index=0, language=language)
     articles = await article_service.get_by_language(language=language)
 
+    if popular is None:
+        popular = await article_popularity.get_popular(language)
+
+    return render_index_page(readme_contents=readme.contents, articles=articles, language=language, popular=popular)
+
+
+async def render_pages() -> None:
+    """
+    Warm-up: renders the reader index and first article in each language, building the FastUI component schemas and
+    serializers that the first real requests would otherwise pay for
+    """
+    for language in constants.SUPPORTED_LANGUAGES:
+        for page in (
+            await build_index_page(language),
+            await build_article_page(constants.FIRST_ARTICLE_ID, language),
+        ):
+            page_json(page)
+
+
+def render_index_page(
+    readme_contents: str,
+    articles: Sequence[article_schemas.AbridgedArticleProjection | article_schemas.ArticleCreate],
+    language: str,
+    availability: Optional[article_availability.ArticleAvailability] = None,
+    popular: Optional[article_schemas.PopularArticles] = None,
+) -> list[AnyComponent]:
     t = []
     for article in articles:
         if article.index == 0:  # skip including the README in the index
@@ -62,8 +171,21 @@ async def reader_index(language: str = "en") -> list[AnyComponent]:
 
         t.append(f"{article.index}. [{article.title}](/reader/{language}/article/{article.index})")
 
+    sections = [c.Div(components=[c.Markdown(text=readme_contents)])]
+
+    if popular and popular.articles:
+        most_read = [
+            f"1. [{article.title}](/reader/{language}/article/{article.index})" for article in popular.articles
+        ]
+        sections.append(
+            c.Div(
+                components=[c.Heading(text="Most read this week", level=2), c.Markdown(text="\n".join(most_read))],
+                class_name="border-top mt-3 pt-1",
+            )
+        )
+
     return reader_page(
-        c.Div(components=[c.Markdown(text=readme.contents)]),
+        *sections,
         c.Div(
             components=[c.Heading(text="Index", level=2), c.Markdown(text="\n".join(t))],
             class_name="border-top mt-3 pt-1",
@@ -71,16 +193,37 @@ async def reader_index(language: str = "en") -> list[AnyComponent]:
         index=0,
         language=language,
         include_nav_links=False,
+        availability=availability,
     )
 
 
+def adjacent_article(find: Callable[[str, int], Optional[int]], language: str, index: int) -> Optional[Tuple[str, int]]:
+    """
+    The article find locates from index in the language, or failing that in READER_FALLBACK_LANGUAGE
+    """
+    for candidate in dict.fromkeys((language, settings.READER_FALLBACK_LANGUAGE)):
+        found = find(candidate, index)
+
+        if found is not None:
+            return candidate, found
+
+    return None
+
+
 def reader_page(
     *components: AnyComponent,
     title: str | None = None,
     index: int = 0,
     language: str = "en",
     include_nav_links: bool = True,
+    availability: Optional[article_availability.ArticleAvailability] = None,
 ) -> list[AnyComponent]:
+    """
+    Links only ever point at articles that exist, according to availability (by default this worker's)
+    """
+    if availability is None:
+        availability = article_availability.availability
+
     if not include_nav_links:
         nav_links = []
     else:
@@ -89,38 +232,35 @@ def reader_page(
             c.Link(components=[c.Text(text="Random")], on_click=GoToEvent(url=f"/reader/{language}/article/random")),
         ]
 
-        if index > constants.FIRST_ARTICLE_ID:
+        if previous := adjacent_article(availability.previous, language, index):
             nav_links.insert(
                 0,
                 c.Link(
                     components=[c.Text(text="Previous")],
-                    on_click=GoToEvent(url=f"/reader/{language}/article/{index - 1}"),
+                    on_click=GoToEvent(url=f"/reader/{previous[0]}/article/{previous[1]}"),
                 ),
             )
 
-        if index < constants.LAST_ARTICLE_ID:
+        if following := adjacent_article(availability.next, language, index):
             nav_links.append(
                 c.Link(
                     components=[c.Text(text="Next")],
-                    on_click=GoToEvent(url=f"/reader/{language}/article/{index + 1}"),
+                    on_click=GoToEvent(url=f"/reader/{following[0]}/article/{following[1]}"),
                 )
             )
 
     start_links = []
 
-    if index == constants.INDEX_ID:
-        for language in constants.SUPPORTED_LANGUAGES:
-            start_links.append(
-                c.Link(components=[c.Text(text=language.upper())], on_click=GoToEvent(url=f"/reader/{language}/index"))
-            )
-    else:
-        for language in constants.SUPPORTED_LANGUAGES:
-            start_links.append(
-                c.Link(
-                    components=[c.Text(text=language.upper())],
-                    on_click=GoToEvent(url=f"/reader/{language}/article/{index}"),
-                )
-            )
+    # Each language's translation of this article, or its index page if it has none
+    for link_language in availability.languages():
+        if index != constants.INDEX_ID and availability.has(link_language, index):
+            url = f"/reader/{link_language}/article/{index}"
+        elif availability.has(link_language, constants.INDEX_ID):
+            url = f"/reader/{link_language}/index"
+        else:
+            continue
+
+        start_links.append(c.Link(components=[c.Text(text=link_language.upper())], on_click=GoToEvent(url=url)))
 
     return [
         c.PageTitle(text=f"{settings.PROJECT_NAME} — {title}" if title else settings.PROJECT_NAME),
@@ -1,7 +1,14 @@
+# Standard Library Imports
+from contextlib import contextmanager
+from typing import Iterator
+
 # 3rd-Party Imports
 from starlette.datastructures import Headers
 from starlette.requests import Request
 
+# Application-Local Imports
+from ninety_seven_things.lib.query_log import QueryLog, current_query_log
+
 
 def starlette_request(
     method: str = "GET",
@@ -32,3 +39,24 @@ def starlette_request(
         request.body = request_body
 
     return request
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryLog]:
+    """
+    Fails if more than max_queries Mongo commands are issued inside the block, e.g.
+
+        with assert_max_queries(3):
+            await client.get(f"/ui/admin/author/{author.id}")
+    """
+    query_log = QueryLog(parent=current_query_log.get())
+    token = current_query_log.set(query_log)
+
+    try:
+        yield query_log
+    finally:
+        current_query_log.reset(token)
+
+    assert query_log.count <= max_queries, (
+        f"Expected at most {max_queries} queries, {query_log.count} were issued:\n{query_log.summary()}"
+    )
@@ -0,0 +1,149 @@
+# Standard Library Imports
+import random
+
+# 3rd-Party Imports
+import fakeredis
+import pytest
+import pytest_asyncio
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+
+# Application-Local Imports
+from ninety_seven_things.lib import cache, constants
+from ninety_seven_things.modules.article import availability, service
+from ninety_seven_things.modules.article.availability import ArticleAvailability
+from ninety_seven_things.modules.article.models import Article
+from ninety_seven_things.modules.author.models import Author
+from ninety_seven_things.modules.user.models import User
+from ninety_seven_things.modules.utilities import views as utilities_views
+
+KEYS = [("en", 0), ("en", 1), ("en", 2), ("en", 5), ("en", 9), ("fa", 0), ("fa", 2), ("fa", 12), ("xx", 3)]
+
+
+@pytest.fixture
+def article_availability():
+    return ArticleAvailability.from_keys(KEYS)
+
+
+def test_everything_is_available_until_loaded():
+    unloaded = ArticleAvailability()
+
+    assert not unloaded.loaded
+    assert unloaded.languages() == constants.SUPPORTED_LANGUAGES
+    assert unloaded.has("en", constants.LAST_ARTICLE_ID)
+    assert not unloaded.has("en", constants.LAST_ARTICLE_ID + 1)
+
+
+def test_from_keys(article_availability):
+    assert article_availability.loaded
+    assert all(article_availability.has(*key) for key in KEYS)
+    assert not article_availability.has("en", 3)
+    assert not article_availability.has("en", -1)
+    assert not article_availability.has("pt_br", 1)
+    assert list(article_availability.indexes("fa")) == [0, 2, 12]
+
+
+def test_rebuild_replaces_every_language(article_availability):
+    article_availability.rebuild([("pt_br", 4)])
+
+    assert article_availability.languages() == ["pt_br"]
+    assert not article_availability.has("en", 1)
+
+
+def test_supported_languages_come_first(article_availability):
+    languages = article_availability.languages()
+
+    assert languages[-1] == "xx"
+    assert languages[:-1] == [language for language in constants.SUPPORTED_LANGUAGES if language in ("en", "fa")]
+
+
+def test_add_and_discard(article_availability):
+    article_availability.add("pt_br", 7)
+    article_availability.discard("en", 5)
+    article_availability.discard("en", 50)
+
+    assert article_availability.has("pt_br", 7)
+    assert not article_availability.has("en", 5)
+    assert list(article_availability.indexes("en")) == [0, 1, 2, 9]
+
+    # A language with nothing left is gone
+    article_availability.discard("xx", 3)
+
+    assert "xx" not in article_availability.languages()
+
+
+def test_the_readme_is_not_an_article(article_availability):
+    assert article_availability.has("en", constants.INDEX_ID)
+    assert article_availability.articles("en") == 0b1000100110
+    assert article_availability.previous("en", 1) is None
+
+
+def test_navigation_skips_gaps(article_availability):
+    assert article_availability.previous("en", 5) == 2
+    assert article_availability.next("en", 5) == 9
+    assert article_availability.next("en", 9) is None
+    assert article_availability.next("fa", 2) == 12
+    # Neighbours of an article that does not exist
+    assert article_availability.previous("en", 4) == 2
+    assert article_availability.next("en", 4) == 5
+    assert article_availability.next("zz", 1) is None
+
+
+def test_random_article(article_availability):
+    random.seed(97)
+
+    assert {article_availability.random("en") for _ in range(200)} == {1, 2, 5, 9}
+    assert article_availability.random("zz") is None
+
+
+def test_coverage(article_availability):
+    coverage = article_availability.coverage()
+
+    assert coverage.languages == article_availability.languages()
+    assert coverage.indexes == [0, 1, 2, 3, 5, 9, 12]
+    assert coverage.counts["en"] == 4
+    assert coverage.counts["fa"] == 2
+    assert coverage.counts["xx"] == 1
+
+    column = coverage.languages.index("fa")
+
+    assert [row[column] for row in coverage.matrix] == [True, False, True, False, False, False, True]
+
+
+@pytest_asyncio.fixture
+async def articles(monkeypatch):
+    """
+    Mongo and redis stand-ins for the article service, and an availability of its own
+    """
+    await init_beanie(database=AsyncMongoMockClient()["testing"], document_models=[Article])
+
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(availability, "redis", redis)
+    monkeypatch.setattr(service.article_cache, "redis", redis)
+    monkeypatch.setattr(availability, "availability", ArticleAvailability.from_keys([]))
+    # mongomock's with_options drops its async wrapper
+    monkeypatch.setattr(service, "cache_fill_collection", Article.get_motor_collection)
+
+    return [await Article(title=f"Article {i}", index=1, contents="", language="en").insert() for i in range(2)]
+
+
+async def test_a_key_stays_available_while_an_article_has_it(articles):
+    availability.availability.add("en", 1)
+
+    await service.delete_one(articles[0])
+
+    assert availability.availability.has("en", 1)
+
+    await service.delete_one(articles[1])
+
+    assert not availability.availability.has("en", 1)
+
+
+async def test_wiping_the_database_empties_availability(articles, monkeypatch):
+    await init_beanie(database=Article.get_motor_collection().database, document_models=[Article, Author, User])
+    monkeypatch.setattr(cache, "caches", {})
+    availability.availability.add("en", 1)
+
+    await utilities_views.clear_db()
+
+    assert availability.availability.languages() == []
@@ -0,0 +1,44 @@
+# Standard Library Imports
+import random
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.lib import bitset
+
+BITSET = 1 << 1 | 1 << 2 | 1 << 5 | 1 << 64 | 1 << 200
+
+
+def test_members():
+    assert list(bitset.members(BITSET)) == [1, 2, 5, 64, 200]
+    assert list(bitset.members(0)) == []
+
+
+@pytest.mark.parametrize(
+    "after, member",
+    [(-5, 1), (0, 1), (1, 2), (2, 5), (3, 5), (5, 64), (64, 200), (200, None), (1000, None)],
+)
+def test_next_member(after, member):
+    assert bitset.next_member(BITSET, after) == member
+
+
+@pytest.mark.parametrize(
+    "before, member",
+    [(-5, None), (0, None), (1, None), (2, 1), (5, 2), (6, 5), (64, 5), (201, 200), (1000, 200)],
+)
+def test_previous_member(before, member):
+    assert bitset.previous_member(BITSET, before) == member
+
+
+def test_empty_set_has_no_neighbours():
+    assert bitset.next_member(0, 0) is None
+    assert bitset.previous_member(0, 10) is None
+
+
+def test_random_member_reaches_every_member():
+    random.seed(97)
+
+    assert {bitset.random_member(BITSET) for _ in range(500)} == set(bitset.members(BITSET))
+    assert bitset.random_member(1 << 70) == 70
+    assert bitset.random_member(0) is None
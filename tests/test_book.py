@@ -0,0 +1,150 @@
+# Standard Library Imports
+import datetime
+import zipfile
+
+# 3rd-Party Imports
+import pytest
+from bson import ObjectId
+from lxml import etree
+
+# Application-Local Imports
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.modules.book import service
+from ninety_seven_things.modules.book.render import render_chapter
+
+# Raw HTML that Markdown passes through as it is, none of which is well-formed XML
+CONTENTS = """
+First line<br>
+second line, with an image <img src="cover.png" alt="Cover"> & an empty <a name="top"></a> anchor.
+
+<div class="note">An unclosed paragraph<p>inside a block &nbsp; of HTML
+</div>
+
+| Before | After |
+|--------|-------|
+| `<br>` | <hr>  |
+
+```
+<br> in code is only text
+```
+"""
+
+
+def article(index, contents=CONTENTS, updated_at=datetime.datetime(2024, 1, 1)):
+    return {
+        "_id": ObjectId(),
+        "index": index,
+        "title": f"Article <{index}>",
+        "language": "en",
+        "contents": contents,
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture
+def books_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(service, "BOOKS_DIR", tmp_path)
+
+    return tmp_path
+
+
+def parse_xhtml(body: str):
+    return etree.fromstring(f'<body xmlns="http://www.w3.org/1999/xhtml">{body}</body>'.encode())
+
+
+def test_chapters_are_well_formed():
+    body = parse_xhtml(render_chapter(CONTENTS))
+
+    assert body.find(".//{*}br") is not None
+    assert "<br>" in "".join(body.find(".//{*}code").itertext())
+
+
+def test_chapters_keep_end_tags_that_html_needs():
+    rendered = render_chapter('An <a name="top"></a> anchor<br>')
+
+    assert '<a name="top"></a>' in rendered
+    assert "<br/>" in rendered
+
+
+def test_empty_chapter():
+    assert render_chapter("") == ""
+
+
+async def test_every_file_in_the_epub_is_well_formed(books_dir):
+    documents = [article(0), article(1), article(2, contents="Just text")]
+
+    digest = await service.ensure_books("en", documents)
+
+    with zipfile.ZipFile(books_dir / service.book_name("en", digest, "epub")) as epub:
+        names = epub.namelist()
+
+        assert names[0] == "mimetype"
+        assert epub.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+
+        for name in names[1:]:
+            etree.fromstring(epub.read(name))
+
+    assert {"OEBPS/chapter-000.xhtml", "OEBPS/chapter-001.xhtml", "OEBPS/chapter-002.xhtml"} <= set(names)
+
+
+async def test_books_are_only_built_once(books_dir, monkeypatch):
+    documents = [article(1)]
+    digest = await service.ensure_books("en", documents)
+
+    async def fail(*args):
+        raise AssertionError("The book was built again")
+
+    monkeypatch.setattr(service, "build_books", fail)
+
+    assert await service.ensure_books("en", documents) == digest
+
+
+def test_hash_follows_count_updates_and_ids():
+    documents = [article(1), article(2)]
+    digest = service.documents_hash(documents)
+
+    assert service.documents_hash(documents) == digest
+    assert service.documents_hash(documents[:1]) != digest
+    assert service.documents_hash([documents[0], article(2, updated_at=datetime.datetime(2024, 1, 2))]) != digest
+    # A delete and a create that leave the count and the last update as they were still change the newest id
+    assert service.documents_hash([documents[0], article(3)]) != digest
+
+
+def test_hash_matches_the_language_summary():
+    documents = [article(1), article(2, updated_at=None), article(3, updated_at=datetime.datetime(2024, 2, 1))]
+    summary = {
+        "count": 3,
+        "modified": datetime.datetime(2024, 2, 1),
+        "last_id": max(document["_id"] for document in documents),
+    }
+
+    assert service.documents_hash(documents) == service.corpus_hash(**summary)
+
+
+def test_only_stale_books_of_the_language_are_removed(books_dir):
+    names = [
+        service.book_name("pt", "0" * 16, "epub"),
+        service.book_name("pt", "1" * 16, "epub"),
+        service.book_name("pt", "1" * 16, "html"),
+        service.book_name("pt-br", "0" * 16, "epub"),
+        "97-things-pt-notes.txt",
+    ]
+
+    for name in names:
+        (books_dir / name).touch()
+
+    service.remove_stale_books("pt", "1" * 16)
+
+    assert sorted(path.name for path in books_dir.iterdir()) == sorted(names[1:])
+
+
+async def test_unknown_languages_are_not_looked_up(monkeypatch):
+    async def get_language_summary(language):
+        raise AssertionError(f"{language} was looked up")
+
+    monkeypatch.setattr(service.article_service, "get_language_summary", get_language_summary)
+
+    with pytest.raises(DoesNotExistException) as exc_info:
+        await service.get_book_url("*", "epub")
+
+    assert exc_info.value.message == "There are no articles in language *"
@@ -0,0 +1,188 @@
+# Standard Library Imports
+import asyncio
+import contextlib
+
+# 3rd-Party Imports
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import cache
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def article_cache(monkeypatch, redis):
+    monkeypatch.setattr(cache, "caches", {})
+    tiered_cache = cache.TieredCache(name="article", redis=redis, max_size=10, ttl=60)
+    tiered_cache.prime({"key:en:1": {"title": "One"}, "key:en:2": {"title": "Two"}}, generation="0")
+
+    return tiered_cache
+
+
+async def subscribed(redis) -> None:
+    while not dict(await redis.pubsub_numsub(settings.CACHE_INVALIDATION_CHANNEL))[settings.CACHE_INVALIDATION_CHANNEL]:
+        await asyncio.sleep(0.01)
+
+
+@contextlib.asynccontextmanager
+async def listening(redis):
+    listener = asyncio.create_task(cache.listen_for_invalidations(redis))
+
+    try:
+        await asyncio.wait_for(subscribed(redis), timeout=5)
+        yield listener
+    finally:
+        listener.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+
+
+async def test_preloaded_entries_survive_subscribing(redis, article_cache):
+    async with listening(redis):
+        await asyncio.sleep(0.05)
+
+    assert len(article_cache.local) == 2
+    assert await article_cache.get("key:en:1") == {"title": "One"}
+
+
+async def test_preloaded_entries_are_cleared_if_written_since(redis, article_cache):
+    # Written after the master preloaded, and before this worker was forked
+    await redis.incr(article_cache.generation_key)
+
+    async with listening(redis):
+        await asyncio.sleep(0.05)
+
+    assert len(article_cache.local) == 0
+
+
+async def test_preloaded_entries_of_an_unknown_generation_are_cleared(redis, article_cache):
+    article_cache.prime({"key:en:3": {"title": "Three"}}, generation=None)
+
+    async with listening(redis):
+        await asyncio.sleep(0.05)
+
+    assert len(article_cache.local) == 0
+
+
+async def test_invalidations_evict_local_entries(redis, article_cache):
+    async with listening(redis):
+        await cache.publish_invalidation(redis, "article", ["key:en:1"])
+
+        for _ in range(100):
+            if len(article_cache.local) == 1:
+                break
+
+            await asyncio.sleep(0.01)
+
+    assert article_cache.local.get("key:en:1") is None
+    assert article_cache.local.get("key:en:2") == {"title": "Two"}
+
+
+class DroppedPubSub:
+    """
+    A subscription that is lost as soon as it is made
+    """
+
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    async def __aenter__(self):
+        await self.pubsub.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self.pubsub.__aexit__(*exc_info)
+
+    async def subscribe(self, *channels):
+        await self.pubsub.subscribe(*channels)
+
+    async def listen(self):
+        raise RedisConnectionError("Connection lost")
+        yield
+
+
+class ReconnectingRedis:
+    """
+    Loses its first subscription, then subscribes normally
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.subscriptions = 0
+
+    def pubsub(self, **kwargs):
+        self.subscriptions += 1
+        pubsub = self.redis.pubsub(**kwargs)
+
+        return DroppedPubSub(pubsub) if self.subscriptions == 1 else pubsub
+
+
+async def test_reconnecting_clears_local_entries(monkeypatch, redis, article_cache):
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_RETRY_SECONDS", 0)
+    reconnecting_redis = ReconnectingRedis(redis)
+
+    listener = asyncio.create_task(cache.listen_for_invalidations(reconnecting_redis))
+
+    try:
+        await asyncio.wait_for(subscribed(redis), timeout=5)
+    finally:
+        listener.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+
+    assert reconnecting_redis.subscriptions == 2
+    assert len(article_cache.local) == 0
+
+
+async def test_fills_are_written_to_both_tiers(redis, article_cache):
+    generation = await article_cache.generation()
+
+    await article_cache.set_many({"key:en:3": {"title": "Three"}}, generation)
+
+    assert article_cache.local.get("key:en:3") == {"title": "Three"}
+    assert await redis.exists(article_cache.redis_key("key:en:3"))
+
+
+async def test_a_fill_that_raced_a_write_is_refused(redis, article_cache):
+    # The generation is read before the document, and the write lands in between
+    generation = await article_cache.generation()
+    await article_cache.delete("key:en:3")
+
+    await article_cache.set_many({"key:en:3": {"title": "Before the write"}}, generation)
+
+    assert article_cache.local.get("key:en:3") is None
+    assert not await redis.exists(article_cache.redis_key("key:en:3"))
+
+
+async def test_clearing_bumps_the_generation(redis, article_cache):
+    generation = await article_cache.generation()
+
+    await article_cache.clear()
+
+    assert await article_cache.generation() != generation
+
+
+async def test_redis_hits_evicted_meanwhile_are_not_kept_locally(redis, article_cache):
+    await redis.set(article_cache.redis_key("key:en:3"), '{"title": "Three"}')
+    mget = redis.mget
+
+    async def mget_then_evict(keys):
+        values = await mget(keys)
+        # Handled by the invalidation listener while this worker waited on redis
+        cache.evict_local("article", ["key:en:3"])
+
+        return values
+
+    redis.mget = mget_then_evict
+
+    assert await article_cache.get("key:en:3") == {"title": "Three"}
+    assert article_cache.local.get("key:en:3") is None
@@ -0,0 +1,79 @@
+# Standard Library Imports
+import gzip
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.modules.article.schemas import ArticleCreate
+from ninety_seven_things.ui.reader import export
+
+
+def article(language: str, index: int, contents: str = "") -> ArticleCreate:
+    return ArticleCreate(
+        title=f"{language} {index}", index=index, contents=contents or f"# {language} {index}", language=language
+    )
+
+
+ARTICLES = [article("en", 0), article("en", 1), article("en", 2), article("fr", 0), article("fr", 1)]
+
+
+def inodes(output_dir) -> dict:
+    """
+    Each exported file's inode, which changes whenever it is rewritten as files are replaced rather than written to
+    """
+    return {str(path.relative_to(output_dir)): path.stat().st_ino for path in output_dir.rglob("*") if path.is_file()}
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    output_dir = tmp_path / "site"
+    report = export.export_site(ARTICLES, output_dir, workers=1)
+
+    assert "ui/reader/en/article/2" in report.written
+    assert report.unchanged == 0
+
+    return output_dir
+
+
+def test_pages_and_their_compressed_copies_are_written(output_dir):
+    page = output_dir / "ui/reader/fr/article/1"
+
+    assert page.read_bytes()
+    assert gzip.decompress((output_dir / "ui/reader/fr/article/1.gz").read_bytes()) == page.read_bytes()
+    assert (output_dir / export.SHELL_PATH).exists()
+
+
+def test_unchanged_pages_are_not_rewritten(output_dir):
+    before = inodes(output_dir)
+
+    report = export.export_site(ARTICLES, output_dir, workers=1)
+
+    assert report.written == []
+    assert report.removed == []
+    assert report.unchanged == len(export.read_manifest(output_dir))
+    assert {path: inode for path, inode in inodes(output_dir).items() if path != export.MANIFEST_NAME} == {
+        path: inode for path, inode in before.items() if path != export.MANIFEST_NAME
+    }
+
+
+def test_only_changed_pages_are_rewritten(output_dir):
+    before = inodes(output_dir)
+    articles = [*ARTICLES[:2], article("en", 2, contents="# Rewritten"), *ARTICLES[3:]]
+
+    report = export.export_site(articles, output_dir, workers=1)
+
+    assert report.written == ["ui/reader/en/article/2"]
+
+    after = inodes(output_dir)
+    rewritten = {path for path in after if after[path] != before.get(path)}
+
+    assert rewritten == {"ui/reader/en/article/2", "ui/reader/en/article/2.gz", export.MANIFEST_NAME}
+
+
+def test_pages_that_no_longer_exist_are_removed(output_dir):
+    report = export.export_site([article for article in ARTICLES if article.language == "en"], output_dir, workers=1)
+
+    assert report.removed == ["ui/reader/fr/article/0", "ui/reader/fr/article/1", "ui/reader/fr/index"]
+    assert not (output_dir / "ui/reader/fr/article/1").exists()
+    assert not (output_dir / "ui/reader/fr/article/1.gz").exists()
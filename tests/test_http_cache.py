@@ -0,0 +1,105 @@
+# Standard Library Imports
+import datetime
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import http_cache
+
+# Local Folder Imports
+from .helpers import starlette_request
+
+CONTENT = b'{"title": "Act with Prudence"}'
+UPDATED_AT = datetime.datetime(2024, 3, 1, 12, 30, 15, 250000)
+LAST_MODIFIED = "Fri, 01 Mar 2024 12:30:15 GMT"
+
+
+def test_entity_tag_is_a_quoted_hash_of_the_content():
+    etag = http_cache.entity_tag(CONTENT)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == http_cache.entity_tag(CONTENT)
+    assert etag != http_cache.entity_tag(CONTENT + b" ")
+
+
+def test_last_modified_treats_mongo_datetimes_as_utc():
+    assert http_cache.last_modified({"updated_at": UPDATED_AT}) == UPDATED_AT.replace(tzinfo=datetime.UTC)
+    assert http_cache.last_modified({}) is None
+    assert http_cache.last_modified(None) is None
+
+
+def test_cache_control(monkeypatch):
+    monkeypatch.setattr(settings, "ARTICLE_CACHE_MAX_AGE", 60)
+    monkeypatch.setattr(settings, "ARTICLE_STALE_WHILE_REVALIDATE", 300)
+
+    assert http_cache.cache_control() == "public, max-age=60, stale-while-revalidate=300"
+
+    monkeypatch.setattr(settings, "ARTICLE_STALE_WHILE_REVALIDATE", 0)
+
+    assert http_cache.cache_control() == "public, max-age=60"
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ("abc", False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    assert http_cache.etag_matches(if_none_match, '"abc"') is matches
+
+
+def test_single_document_response_carries_every_validator():
+    response = http_cache.conditional_response(starlette_request(), CONTENT, {"updated_at": UPDATED_AT})
+
+    assert response.status_code == 200
+    assert response.body == CONTENT
+    assert response.headers["etag"] == http_cache.entity_tag(CONTENT)
+    assert response.headers["last-modified"] == LAST_MODIFIED
+    assert response.headers["cache-control"] == http_cache.cache_control()
+
+
+def test_collection_response_has_no_last_modified():
+    response = http_cache.conditional_response(starlette_request(), CONTENT)
+
+    assert response.status_code == 200
+    assert "etag" in response.headers
+    assert "last-modified" not in response.headers
+
+
+def test_matching_etag_is_not_modified():
+    request = starlette_request(headers={"If-None-Match": http_cache.entity_tag(CONTENT)})
+    response = http_cache.conditional_response(request, CONTENT, {"updated_at": UPDATED_AT})
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == http_cache.entity_tag(CONTENT)
+
+
+@pytest.mark.parametrize(
+    "headers, status_code",
+    [
+        ({"If-Modified-Since": LAST_MODIFIED}, 304),
+        ({"If-Modified-Since": "Fri, 01 Mar 2024 12:30:14 GMT"}, 200),
+        ({"If-Modified-Since": "yesterday"}, 200),
+        # If-None-Match takes precedence
+        ({"If-None-Match": '"stale"', "If-Modified-Since": LAST_MODIFIED}, 200),
+    ],
+)
+def test_if_modified_since(headers, status_code):
+    response = http_cache.conditional_response(starlette_request(headers=headers), CONTENT, {"updated_at": UPDATED_AT})
+
+    assert response.status_code == status_code
+
+
+def test_if_modified_since_is_ignored_for_collections():
+    request = starlette_request(headers={"If-Modified-Since": LAST_MODIFIED})
+
+    assert http_cache.conditional_response(request, CONTENT).status_code == 200
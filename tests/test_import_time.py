@@ -0,0 +1,28 @@
+# Standard Library Imports
+import importlib.util
+import os
+import pathlib
+
+# 3rd-Party Imports
+import pytest
+
+ROOT = pathlib.Path(__file__).parents[1]
+
+
+@pytest.fixture
+def check_import_time(monkeypatch):
+    spec = importlib.util.spec_from_file_location("check_import_time", ROOT / "scripts" / "check_import_time.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # The interpreters it starts import the package from the source tree, as the tests do
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(ROOT / "src"), os.environ.get("PYTHONPATH")])))
+
+    return module
+
+
+def test_cold_import_is_lazy_and_within_budget(check_import_time):
+    total_ms, loaded, _ = check_import_time.check()
+
+    assert loaded == [], f"Imported eagerly but should load on first use: {', '.join(loaded)}"
+    assert total_ms <= check_import_time.DEFAULT_BUDGET_MS
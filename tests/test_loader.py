@@ -0,0 +1,138 @@
+# Standard Library Imports
+import datetime
+import itertools
+from typing import List, Optional
+
+# 3rd-Party Imports
+import pytest_asyncio
+from beanie import Document, Link, init_beanie
+from mongomock_motor import AsyncMongoMockClient
+from pymongo import monitoring
+
+# Application-Local Imports
+from ninety_seven_things.lib import query_log
+from ninety_seven_things.lib.loader import BatchLoader, fetch_selected_links
+from ninety_seven_things.modules.author.models import Author
+from ninety_seven_things.ui.admin import author as author_admin
+
+# Local Folder Imports
+from .helpers import assert_max_queries
+
+request_ids = itertools.count()
+CONNECTION = ("localhost", 27017)
+
+
+class Speaker(Document):
+    name: str
+
+
+class Event(Document):
+    speakers: List[Link[Speaker]]
+    host: Optional[Link[Speaker]] = None
+
+
+class MonitoredCollection:
+    """
+    mongomock issues no commands, so its reads are reported to the query log's monitor as the server's would be
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.monitor = query_log.CommandMonitor()
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def report(self, command_name: str, filter: dict) -> None:
+        request_id = next(request_ids)
+        command = {command_name: self.collection.name, "filter": filter}
+        self.monitor.started(monitoring.CommandStartedEvent(command, "testing", request_id, CONNECTION, request_id))
+        self.monitor.succeeded(
+            monitoring.CommandSucceededEvent(
+                datetime.timedelta(0), {"ok": 1}, command_name, request_id, CONNECTION, request_id
+            )
+        )
+
+    def find(self, filter=None, *args, **kwargs):
+        self.report("find", filter)
+        return self.collection.find(filter, *args, **kwargs)
+
+    async def find_one(self, filter=None, *args, **kwargs):
+        self.report("find", filter)
+        return await self.collection.find_one(filter, *args, **kwargs)
+
+
+@pytest_asyncio.fixture
+async def speakers(monkeypatch):
+    await init_beanie(database=AsyncMongoMockClient()["testing"], document_models=[Author, Speaker, Event])
+
+    for model in (Author, Speaker, Event):
+        collection = MonitoredCollection(model.get_motor_collection())
+        monkeypatch.setattr(model, "get_motor_collection", classmethod(lambda cls, collection=collection: collection))
+
+    return [await Speaker(name=f"Speaker {i}").insert() for i in range(3)]
+
+
+def links(documents) -> List[Link]:
+    return [Speaker.link_from_id(document.id) for document in documents]
+
+
+async def test_links_are_resolved_with_one_query_per_collection(speakers):
+    loader = BatchLoader()
+    loader.add_many(links([*speakers, speakers[0], speakers[0]]))
+
+    assert loader.pending[Speaker] == {speaker.id for speaker in speakers}
+
+    with assert_max_queries(1):
+        await loader.load()
+
+    assert [loader.get(link).name for link in links(speakers)] == ["Speaker 0", "Speaker 1", "Speaker 2"]
+
+
+async def test_resolved_links_are_not_fetched_again(speakers):
+    loader = BatchLoader()
+    await loader.resolve(links(speakers[:2]))
+
+    # Documents rather than links need no query either
+    loader.add(speakers[2])
+
+    with assert_max_queries(0):
+        assert [speaker.name for speaker in await loader.resolve([*links(speakers), speakers[2]])] == [
+            "Speaker 0",
+            "Speaker 1",
+            "Speaker 2",
+            "Speaker 2",
+        ]
+
+
+async def test_missing_documents_are_skipped(speakers):
+    await speakers[1].delete()
+
+    assert [speaker.name for speaker in await BatchLoader().resolve(links(speakers))] == ["Speaker 0", "Speaker 2"]
+
+
+async def test_selected_links_are_fetched_together(speakers):
+    events = [
+        Event(speakers=links(speakers[:2]), host=links(speakers)[2]),
+        Event(speakers=links(speakers[1:]), host=links(speakers)[0]),
+    ]
+
+    with assert_max_queries(1):
+        await fetch_selected_links(Event, events, ["speakers", "host"])
+
+    assert [speaker.name for speaker in events[1].speakers] == ["Speaker 1", "Speaker 2"]
+    assert events[0].host.name == "Speaker 2"
+
+
+async def test_author_detail_costs_a_constant_number_of_queries(speakers, monkeypatch):
+    author = await Author(given_name="Kevlin", family_name="Henney", url="https://example.com").insert()
+
+    for count in (1, 3, 30):
+        linked = links(itertools.islice(itertools.cycle(speakers), count))
+        monkeypatch.setattr(author_admin, "link_values", lambda document, linked=linked: {"speakers": linked})
+
+        # The author, then every speaker at once
+        with assert_max_queries(2) as log:
+            await author_admin.author_detail(author.id, BatchLoader())
+
+        assert log.count == 2
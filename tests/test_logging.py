@@ -0,0 +1,59 @@
+# Standard Library Imports
+import logging
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.core import logging as wj_logging
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def access_log():
+    log = logging.getLogger("testing.access")
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    recorder = Recorder()
+    log.addHandler(recorder)
+
+    yield log, recorder
+
+    wj_logging.listeners.pop(log.name).stop()
+    wj_logging.detach_queue(log.name)
+
+
+def test_server_loggers_write_through_a_queue(access_log):
+    log, recorder = access_log
+
+    wj_logging.route_through_queue(log.name)
+
+    assert log.handlers == [
+        handler for handler in log.handlers if isinstance(handler, wj_logging.NonBlockingQueueHandler)
+    ]
+
+    log.info("GET / 200")
+    wj_logging.listeners[log.name].stop()
+
+    assert recorder.messages == ["GET / 200"]
+
+    # Started again so that the fixture can stop it
+    wj_logging.listeners[log.name].start()
+
+
+def test_routing_again_keeps_the_handlers(access_log):
+    log, recorder = access_log
+
+    wj_logging.route_through_queue(log.name)
+    wj_logging.route_through_queue(log.name)
+
+    assert len(log.handlers) == 1
+    assert wj_logging.listeners[log.name].handlers.count(recorder) == 1
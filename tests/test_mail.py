@@ -0,0 +1,48 @@
+# Standard Library Imports
+import base64
+import io
+import os
+import threading
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.modules.mail import service
+
+# Spans several chunks and ends part way through one
+CONTENTS = os.urandom(2 * service.ATTACHMENT_CHUNK_SIZE + 1000)
+
+
+@pytest.fixture(params=[CONTENTS, b""], ids=["contents", "empty"])
+def contents(request):
+    return request.param
+
+
+def test_encode_regular_file(contents, tmp_path):
+    path = tmp_path / "attachment.bin"
+    path.write_bytes(contents)
+
+    with path.open("rb") as file_handle:
+        assert service.encode_file(file_handle) == base64.b64encode(contents).decode()
+
+
+def test_encode_in_memory_handle(contents):
+    assert service.encode_file(io.BytesIO(contents)) == base64.b64encode(contents).decode()
+
+
+def test_encode_pipe(contents):
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, "wb") as writer:
+            writer.write(contents)
+
+    # Written alongside, as the pipe's buffer is smaller than the contents
+    writer = threading.Thread(target=write)
+    writer.start()
+
+    with os.fdopen(read_fd, "rb") as file_handle:
+        assert service.encode_file(file_handle) == base64.b64encode(contents).decode()
+
+    writer.join()
@@ -0,0 +1,65 @@
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import metrics
+
+# Local Folder Imports
+from .helpers import starlette_request
+
+
+def scrape(client: str, headers: dict = None):
+    request = starlette_request(path="/metrics", headers=headers)
+    request.scope["client"] = (client, 40000)
+
+    return request
+
+
+@pytest.fixture
+def token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "s3cret")
+
+    return "s3cret"
+
+
+@pytest.mark.parametrize(
+    "client, allowed",
+    [("127.0.0.1", True), ("10.1.2.3", True), ("::1", True), ("203.0.113.9", False), ("not an address", False)],
+)
+def test_direct_scrapes_are_allowed_from_internal_networks(client, allowed):
+    assert metrics.scrape_allowed(scrape(client)) is allowed
+
+
+@pytest.mark.parametrize(
+    "headers", [{"X-Forwarded-For": "10.0.0.1"}, {"Forwarded": "for=10.0.0.1"}], ids=["x-forwarded-for", "forwarded"]
+)
+def test_proxied_scrapes_need_the_token(headers, token):
+    # The client as uvicorn rewrites it from the header
+    assert not metrics.scrape_allowed(scrape("10.0.0.1", headers))
+    assert metrics.scrape_allowed(scrape("10.0.0.1", {**headers, "Authorization": f"Bearer {token}"}))
+
+
+def test_the_token_is_accepted_from_anywhere(token):
+    assert metrics.scrape_allowed(scrape("203.0.113.9", {"Authorization": f"Bearer {token}"}))
+    assert not metrics.scrape_allowed(scrape("203.0.113.9", {"Authorization": "Bearer wrong"}))
+
+
+def test_no_token_is_configured_by_default():
+    assert not metrics.scrape_allowed(scrape("203.0.113.9", {"Authorization": "Bearer "}))
+
+
+class FakePool:
+    max_connections = 10
+    _available_connections = [object()]
+    _in_use_connections = [object(), object()]
+
+
+def test_process_collectors_are_rendered_with_multiprocess_metrics(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    monkeypatch.setattr(metrics, "process_collectors", [metrics.RedisPoolCollector(FakePool())])
+
+    rendered = metrics.render_metrics().decode()
+
+    assert 'redis_pool_connections{state="in_use"} 2.0' in rendered
+    assert 'redis_pool_connections{state="max"} 10.0' in rendered
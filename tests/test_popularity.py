@@ -0,0 +1,159 @@
+# Standard Library Imports
+import asyncio
+
+# 3rd-Party Imports
+import fakeredis
+import pytest
+import pytest_asyncio
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.modules.article import popularity
+from ninety_seven_things.modules.article.models import ArticleViewCount
+
+
+class BulkWriteCollection:
+    """
+    mongomock's bulk_write predates pymongo's current operations, so they are applied one at a time, reporting errors
+    as the server does for an unordered bulk write
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    async def bulk_write(self, operations, ordered=True):
+        errors = []
+
+        for number, operation in enumerate(operations):
+            try:
+                await self.collection.update_one(operation._filter, operation._doc, upsert=operation._upsert)
+            except DuplicateKeyError as exc:
+                errors.append({"index": number, "code": exc.code, "errmsg": str(exc)})
+
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": []})
+
+
+@pytest_asyncio.fixture
+async def redis(monkeypatch):
+    await init_beanie(database=AsyncMongoMockClient()["testing"], document_models=[ArticleViewCount])
+    collection = BulkWriteCollection(ArticleViewCount.get_motor_collection())
+    monkeypatch.setattr(ArticleViewCount, "get_motor_collection", classmethod(lambda cls: collection))
+
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(popularity, "redis", redis)
+
+    return redis
+
+
+async def views() -> dict:
+    documents = await ArticleViewCount.get_motor_collection().find({"period": popularity.ALL_TIME}).to_list(length=None)
+
+    return {(document["language"], document["index"]): document["views"] for document in documents}
+
+
+async def test_views_are_added_to_the_counts(redis):
+    await redis.hset(popularity.PENDING_KEY, mapping={"en:1": 3, "pt_br:2": 1})
+
+    assert await popularity.write_views() == 2
+    assert await views() == {("en", 1): 3, ("pt_br", 2): 1}
+    assert not await redis.exists(popularity.PROCESSING_KEY)
+
+    await redis.hset(popularity.PENDING_KEY, mapping={"en:1": 2})
+    await popularity.write_views()
+
+    assert await views() == {("en", 1): 5, ("pt_br", 2): 1}
+
+
+async def test_nothing_pending(redis):
+    assert await popularity.write_views() == 0
+    assert await views() == {}
+
+
+async def test_a_retried_batch_is_not_counted_twice(redis, monkeypatch):
+    await ArticleViewCount(language="en", index=1, period=popularity.ALL_TIME, views=10).insert()
+    await redis.hset(popularity.PENDING_KEY, mapping={"en:1": 3, "en:2": 1})
+
+    delete = redis.delete
+
+    async def fail(*keys):
+        raise RedisConnectionError("Connection lost")
+
+    # The counts are written, but the batch is left behind
+    monkeypatch.setattr(redis, "delete", fail)
+
+    with pytest.raises(RedisConnectionError):
+        await popularity.write_views()
+
+    monkeypatch.setattr(redis, "delete", delete)
+    # Views counted meanwhile wait for the next batch
+    await redis.hset(popularity.PENDING_KEY, mapping={"en:1": 1})
+
+    await popularity.write_views()
+
+    assert await views() == {("en", 1): 13, ("en", 2): 1}
+
+    await popularity.write_views()
+
+    assert await views() == {("en", 1): 14, ("en", 2): 1}
+
+
+async def test_only_one_worker_rolls_up(redis, monkeypatch):
+    rollups = []
+
+    async def roll_up():
+        rollups.append(await redis.ttl(popularity.ROLLUP_LOCK_KEY))
+
+    monkeypatch.setattr(popularity, "rebuild_popular", roll_up)
+
+    await popularity.roll_up()
+    await popularity.roll_up()
+
+    assert len(rollups) == 1
+
+
+async def test_a_long_rollup_keeps_its_lock(redis, monkeypatch):
+    monkeypatch.setattr(settings, "ARTICLE_VIEWS_ROLLUP_SECONDS", 1)
+
+    async def rebuild_popular():
+        await asyncio.sleep(1.5)
+
+        assert await redis.exists(popularity.ROLLUP_LOCK_KEY)
+
+    monkeypatch.setattr(popularity, "rebuild_popular", rebuild_popular)
+
+    await popularity.roll_up()
+
+
+async def test_write_behind_outlives_unexpected_errors(monkeypatch):
+    monkeypatch.setattr(settings, "ARTICLE_VIEWS_FLUSH_SECONDS", 0)
+    monkeypatch.setattr(settings, "ARTICLE_VIEWS_ROLLUP_SECONDS", 0)
+    rollups = []
+
+    async def roll_up():
+        rollups.append(True)
+
+        if len(rollups) < 3:
+            raise KeyError("batch")
+
+    monkeypatch.setattr(popularity, "roll_up", roll_up)
+    write_behind = asyncio.create_task(popularity.run_write_behind())
+
+    try:
+        for _ in range(100):
+            if len(rollups) >= 3:
+                break
+
+            await asyncio.sleep(0.01)
+    finally:
+        write_behind.cancel()
+
+    assert len(rollups) >= 3
+    assert not write_behind.done() or write_behind.cancelled()
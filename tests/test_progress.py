@@ -0,0 +1,35 @@
+# 3rd-Party Imports
+import pytest
+from bson.int64 import Int64
+
+# Application-Local Imports
+from ninety_seven_things.modules.progress.service import WORD_BITS, WORD_MASK, from_words, to_int64
+
+
+@pytest.mark.parametrize(
+    "word, stored",
+    [
+        (0, 0),
+        (1, 1),
+        ((1 << 63) - 1, (1 << 63) - 1),
+        # The top bit makes the stored number negative
+        (1 << 63, -(1 << 63)),
+        (WORD_MASK, -1),
+    ],
+)
+def test_to_int64(word, stored):
+    assert isinstance(to_int64(word), Int64)
+    assert to_int64(word) == stored
+
+
+def test_from_words_reads_words_as_unsigned():
+    read = 1 << 0 | 1 << 63 | 1 << 64 | 1 << 190
+
+    words = {str(number): int(to_int64(read >> (number * WORD_BITS) & WORD_MASK)) for number in range(3)}
+
+    assert words["0"] < 0
+    assert from_words(words) == read
+
+
+def test_from_words_of_nothing():
+    assert from_words({}) == 0
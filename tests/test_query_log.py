@@ -0,0 +1,73 @@
+# Standard Library Imports
+import datetime
+import itertools
+
+# 3rd-Party Imports
+import pytest
+from pymongo import monitoring
+
+# Application-Local Imports
+from ninety_seven_things.lib import query_log
+
+# Local Folder Imports
+from .helpers import assert_max_queries
+
+request_ids = itertools.count()
+CONNECTION = ("localhost", 27017)
+
+
+def start(monitor: query_log.CommandMonitor, command: dict) -> int:
+    request_id = next(request_ids)
+    monitor.started(monitoring.CommandStartedEvent(command, "testing", request_id, CONNECTION, request_id))
+    return request_id
+
+
+def succeed(monitor: query_log.CommandMonitor, command_name: str, request_id: int) -> None:
+    monitor.succeeded(
+        monitoring.CommandSucceededEvent(
+            datetime.timedelta(milliseconds=1), {"ok": 1}, command_name, request_id, CONNECTION, request_id
+        )
+    )
+
+
+def run_find(monitor: query_log.CommandMonitor, language: str) -> None:
+    succeed(monitor, "find", start(monitor, {"find": "articles", "filter": {"language": language}}))
+
+
+def test_assert_max_queries_counts_commands_issued_in_the_block():
+    monitor = query_log.CommandMonitor()
+
+    with assert_max_queries(2) as log:
+        run_find(monitor, "en")
+        run_find(monitor, "fr")
+
+    assert log.count == 2
+    assert log.records[0].collection == "articles"
+    assert log.records[0].shape == {"filter": {"language": "?"}}
+
+
+def test_assert_max_queries_fails_when_exceeded():
+    monitor = query_log.CommandMonitor()
+
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, 2 were issued"):
+        with assert_max_queries(1):
+            run_find(monitor, "en")
+            run_find(monitor, "fr")
+
+
+def test_handshakes_are_not_counted():
+    monitor = query_log.CommandMonitor()
+
+    with assert_max_queries(0) as log:
+        succeed(monitor, "hello", start(monitor, {"hello": 1}))
+
+    assert log.count == 0
+
+
+def test_pending_commands_are_bounded(monkeypatch):
+    monkeypatch.setattr(query_log, "MAX_PENDING_COMMANDS", 3)
+    monitor = query_log.CommandMonitor()
+
+    started = [start(monitor, {"find": "articles", "filter": {}}) for _ in range(5)]
+
+    assert list(monitor.pending) == [(request_id, CONNECTION) for request_id in started[2:]]
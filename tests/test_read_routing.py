@@ -0,0 +1,28 @@
+# 3rd-Party Imports
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib.read_routing import route_read_preference
+
+
+def test_public_reads_may_use_secondaries():
+    read_preference = route_read_preference("GET", "/ui/reader/en/article/1")
+
+    assert isinstance(read_preference, SecondaryPreferred)
+    assert read_preference.max_staleness == settings.MONGO_SECONDARY_MAX_STALENESS_SECONDS
+
+
+def test_writes_are_pinned_to_the_primary():
+    assert route_read_preference("POST", "/api/v1/article") == Primary()
+    assert route_read_preference("DELETE", "/api/v1/user/me") == Primary()
+
+
+def test_other_reads_keep_the_configured_read_preference():
+    assert route_read_preference("GET", "/api/v1/user/me") is None
+
+
+def test_routing_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "MONGO_READ_ROUTING_ENABLED", False)
+
+    assert route_read_preference("POST", "/api/v1/article") is None
@@ -0,0 +1,93 @@
+# Standard Library Imports
+import datetime
+
+# 3rd-Party Imports
+import pytest
+from fastapi import HTTPException
+
+# Application-Local Imports
+from ninety_seven_things.lib import snapshot
+from ninety_seven_things.lib.exceptions import DoesNotExistException
+from ninety_seven_things.lib.snapshot import PageKind, Snapshot, write_snapshot
+from ninety_seven_things.modules.article import availability, popularity
+from ninety_seven_things.modules.article import service as article_service
+from ninety_seven_things.modules.article.availability import ArticleAvailability
+from ninety_seven_things.modules.article.schemas import ArticleCreate, PopularArticle, PopularArticles
+from ninety_seven_things.ui.reader import main as reader
+
+README = ArticleCreate(title="97 Things", index=0, contents="# 97 Things", language="en")
+ARTICLE = ArticleCreate(title="Act with Prudence", index=1, contents="", language="en")
+
+
+def get_popular(articles):
+    async def get_popular(language):
+        return PopularArticles(language=language, since=datetime.date(2026, 10, 13), articles=articles)
+
+    return get_popular
+
+
+@pytest.fixture
+def deleted_elsewhere(monkeypatch):
+    """
+    This worker still lists en/5, which another worker has deleted
+    """
+    monkeypatch.setattr(availability, "availability", ArticleAvailability.from_keys([("en", 0), ("en", 5)]))
+    monkeypatch.setattr(popularity, "availability", availability.availability)
+    monkeypatch.setattr(snapshot, "reader_snapshot", False)
+    monkeypatch.setattr(popularity, "get_popular", get_popular([]))
+
+    async def get_by_index_and_language(index, language):
+        raise DoesNotExistException(message=f"An article with index {index} and language {language} does not exist")
+
+    monkeypatch.setattr(article_service, "get_by_index_and_language", get_by_index_and_language)
+
+
+@pytest.mark.parametrize(
+    "read",
+    [
+        lambda: reader.read_article(index=5, language="en"),
+        lambda: reader.read_random_article(language="en"),
+        lambda: reader.reader_index(language="en"),
+    ],
+    ids=["article", "random", "index"],
+)
+async def test_articles_missing_from_mongo_are_not_found(deleted_elsewhere, read):
+    with pytest.raises(HTTPException) as exc_info:
+        await read()
+
+    assert exc_info.value.status_code == 404
+    assert "does not exist" in exc_info.value.detail
+
+
+@pytest.fixture
+def index_snapshot(tmp_path, monkeypatch):
+    path = tmp_path / "reader.snapshot"
+    write_snapshot([((PageKind.INDEX, "en", 0), b'{"page": "snapshot index"}')], path)
+    reader_snapshot = Snapshot(path)
+    monkeypatch.setattr(snapshot, "reader_snapshot", reader_snapshot)
+
+    async def get_by_index_and_language(index, language):
+        return README
+
+    async def get_by_language(language):
+        return [README, ARTICLE]
+
+    monkeypatch.setattr(article_service, "get_by_index_and_language", get_by_index_and_language)
+    monkeypatch.setattr(article_service, "get_by_language", get_by_language)
+
+    yield
+
+    reader_snapshot.close()
+
+
+async def test_the_snapshot_index_is_served_until_there_is_a_most_read_list(index_snapshot, monkeypatch):
+    monkeypatch.setattr(popularity, "get_popular", get_popular([]))
+
+    assert bytes((await reader.reader_index(language="en")).body) == b'{"page": "snapshot index"}'
+
+    monkeypatch.setattr(popularity, "get_popular", get_popular([PopularArticle(index=1, title=ARTICLE.title, views=9)]))
+
+    page = reader.page_json(await reader.reader_index(language="en"))
+
+    assert b"Most read this week" in page
+    assert b"[Act with Prudence](/reader/en/article/1)" in page
@@ -0,0 +1,141 @@
+# Standard Library Imports
+import struct
+
+# 3rd-Party Imports
+import pytest
+
+# Application-Local Imports
+from ninety_seven_things.core.config import settings
+from ninety_seven_things.lib import snapshot
+from ninety_seven_things.lib.exceptions import DoesNotExistException, SnapshotFormatException
+from ninety_seven_things.lib.snapshot import PageKind, Snapshot, write_snapshot
+
+PAGES = [
+    ((PageKind.INDEX, "en", 0), b'{"page": "en index"}'),
+    ((PageKind.ARTICLE, "en", 1), b'{"page": "en 1"}'),
+    ((PageKind.ARTICLE, "pt_br", 97), '{"page": "pt_br 97 é"}'.encode()),
+    ((PageKind.ARTICLE, "fr", 2), b""),
+]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "reader.snapshot"
+    write_snapshot(PAGES, path)
+
+    return path
+
+
+def test_pages_round_trip(snapshot_path):
+    reader = Snapshot(snapshot_path)
+
+    try:
+        assert len(reader) == len(PAGES)
+
+        for (kind, language, index), body in PAGES:
+            with reader.get(kind, language, index) as page:
+                assert bytes(page) == body
+    finally:
+        reader.close()
+
+
+def test_missing_page(snapshot_path):
+    reader = Snapshot(snapshot_path)
+
+    try:
+        with pytest.raises(DoesNotExistException) as exc_info:
+            reader.get(PageKind.ARTICLE, "en", 2)
+
+        assert exc_info.value.message == "The snapshot has no article page en/2"
+
+        # An index page is not an article page
+        with pytest.raises(DoesNotExistException):
+            reader.get(PageKind.ARTICLE, "en", 0)
+    finally:
+        reader.close()
+
+
+def test_rewriting_leaves_an_open_snapshot_readable(snapshot_path):
+    reader = Snapshot(snapshot_path)
+
+    try:
+        write_snapshot([((PageKind.INDEX, "en", 0), b"new")], snapshot_path)
+
+        assert bytes(reader.get(PageKind.INDEX, "en")) == b'{"page": "en index"}'
+    finally:
+        reader.close()
+
+    rewritten = Snapshot(snapshot_path)
+
+    try:
+        assert len(rewritten) == 1
+        assert bytes(rewritten.get(PageKind.INDEX, "en")) == b"new"
+    finally:
+        rewritten.close()
+
+    assert [path.name for path in snapshot_path.parent.iterdir()] == [snapshot_path.name]
+
+
+def rewrite_header(path, **fields):
+    data = bytearray(path.read_bytes())
+    header = dict(
+        zip(
+            ("magic", "version", "reserved", "count", "index_offset", "built_at"),
+            snapshot.HEADER.unpack_from(data, 0),
+            strict=True,
+        )
+    )
+    header.update(fields)
+    snapshot.HEADER.pack_into(data, 0, *header.values())
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.parametrize(
+    "fields, message",
+    [
+        ({"magic": b"NOTTHIS!"}, "is not a snapshot"),
+        ({"version": snapshot.VERSION + 1}, "expected 1"),
+        ({"count": len(PAGES) + 1}, "is truncated"),
+    ],
+)
+def test_bad_header(snapshot_path, fields, message):
+    rewrite_header(snapshot_path, **fields)
+
+    with pytest.raises(SnapshotFormatException) as exc_info:
+        Snapshot(snapshot_path)
+
+    assert message in exc_info.value.message
+
+
+def test_too_short(tmp_path):
+    path = tmp_path / "short.snapshot"
+    path.write_bytes(struct.pack("<8s", snapshot.MAGIC))
+
+    with pytest.raises(SnapshotFormatException) as exc_info:
+        Snapshot(path)
+
+    assert "too short" in exc_info.value.message
+
+
+@pytest.mark.parametrize("path", ["", "missing.snapshot", "bad.snapshot"])
+def test_reader_falls_back_to_mongo(monkeypatch, tmp_path, path):
+    (tmp_path / "bad.snapshot").write_bytes(b"x" * 64)
+    monkeypatch.setattr(settings, "READER_SNAPSHOT_PATH", str(tmp_path / path) if path else "")
+    monkeypatch.setattr(snapshot, "reader_snapshot", None)
+
+    assert snapshot.get_reader_snapshot() is None
+    # The failure is remembered rather than retried on every request
+    assert snapshot.reader_snapshot is False
+
+
+def test_reader_snapshot_is_opened_once(monkeypatch, snapshot_path):
+    monkeypatch.setattr(settings, "READER_SNAPSHOT_PATH", str(snapshot_path))
+    monkeypatch.setattr(snapshot, "reader_snapshot", None)
+
+    reader = snapshot.get_reader_snapshot()
+
+    try:
+        assert reader is not None
+        assert snapshot.get_reader_snapshot() is reader
+    finally:
+        reader.close()
@@ -0,0 +1,46 @@
+# Standard Library Imports
+import re
+
+# 3rd-Party Imports
+import pytest_asyncio
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+
+# Application-Local Imports
+from ninety_seven_things.modules.user import service as user_service
+from ninety_seven_things.modules.user.models import User
+
+
+class CollatedCollection:
+    """
+    mongomock ignores collations, so a case-insensitive one (strength 2) is applied here as a regular expression
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def find(self, query, projection=None, collation=None):
+        if collation is not None and collation.document["strength"] == 2:
+            emails = "|".join(re.escape(email) for email in query["email"]["$in"])
+            query = {"email": {"$regex": f"^({emails})$", "$options": "i"}}
+
+        return self.collection.find(query, projection)
+
+
+@pytest_asyncio.fixture
+async def alice(good_user_in, monkeypatch):
+    await init_beanie(database=AsyncMongoMockClient()["testing"], document_models=[User])
+    collection = CollatedCollection(User.get_motor_collection())
+    monkeypatch.setattr(User, "get_motor_collection", classmethod(lambda cls: collection))
+
+    return await User(**{**good_user_in, "email": "Alice@Example.com", "hashed_password": "password"}).insert()
+
+
+async def test_batched_emails_match_case_insensitively(alice):
+    documents = await user_service.get_many_raw_by_email(["alice@example.com", "ALICE@EXAMPLE.COM", "bob@example.com"])
+
+    assert [document and document["_id"] for document in documents] == [alice.id, alice.id, None]
+    assert "hashed_password" not in documents[0]